@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Crawl Throughput Benchmark
+
+Crawls an in-process synthetic documentation site (see synthetic_site.py)
+with every crawl mode and reports pages per second. Each response is
+delayed by --latency seconds, so throughput shows how well a mode keeps
+requests in flight rather than how fast this machine parses HTML.
+
+``batch`` is the async scheduler this pipeline replaced: take
+``workers * 2`` URLs off the frontier, ``gather`` them, repeat (pages are
+parsed and saved on the event loop, as before). Speedups are reported
+against both the sequential crawl and the batch scheduler.
+
+``async-inline`` is the async pipeline with pages saved on the event loop
+instead of the page writer thread; async rows report the event loop lag
+(p99 / max) so the two can be compared.
+
+Usage:
+    python3 cli/bench_crawl.py
+    python3 cli/bench_crawl.py --pages 2000 --latency 0.05 --workers 16
+    python3 cli/bench_crawl.py --modes batch,async --workers 4,16,64
+    python3 cli/bench_crawl.py --modes async-inline,async --store json
+"""
+
+import os
+import sys
+import time
+import asyncio
+import logging
+import argparse
+import tempfile
+from typing import Any, Dict
+
+import httpx
+
+# Add parent directory to path for imports when run as script
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cli.doc_scraper import DocToSkillConverter
+from cli.synthetic_site import SyntheticDocSite
+
+MODES = ('sequential', 'batch', 'threaded', 'async-inline', 'async')
+
+
+async def scrape_in_batches(converter: DocToSkillConverter) -> None:
+    """The old async scheduler: gather a batch of workers * 2 pages, then refill.
+
+    Every batch waits for its slowest page, so workers sit idle at each
+    barrier; this is the baseline the streaming pipeline is measured against.
+    """
+    semaphore = asyncio.Semaphore(converter.workers)
+    limit = converter.config['max_pages']
+
+    async def fetch(url: str, client: httpx.AsyncClient) -> None:
+        async with semaphore:
+            await converter.scrape_page_async(url, client)
+
+    async with httpx.AsyncClient(
+        timeout=30.0,
+        follow_redirects=True,
+        limits=httpx.Limits(max_connections=converter.workers * 2)
+    ) as client:
+        while len(converter.visited_urls) < limit:
+            batch = []
+            while len(batch) < converter.workers * 2:
+                url = converter.frontier.pop()
+                if url is None:
+                    break
+                if converter._mark_visited(url):
+                    batch.append(url)
+            if not batch:
+                break
+            await asyncio.gather(*(fetch(url, client) for url in batch), return_exceptions=True)
+    converter.pages_scraped = len(converter.visited_urls)
+    converter.close_http_sessions()
+    converter.save_summary()
+
+
+def run_crawl(mode: str, workers: int, pages: int, latency: float, store: str = 'json') -> Dict[str, Any]:
+    """Crawl a fresh synthetic site in a scratch directory."""
+    overrides: Dict[str, Any] = {'workers': 1 if mode == 'sequential' else workers, 'page_store': store}
+    if mode in ('async', 'async-inline', 'batch'):
+        overrides['async_mode'] = True
+    if mode == 'async-inline':
+        overrides['async_writer'] = False
+
+    previous_dir = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix='bench_crawl_') as work_dir, \
+            SyntheticDocSite(pages=pages, latency=latency) as site:
+        os.chdir(work_dir)
+        try:
+            converter = DocToSkillConverter(site.config('bench', **overrides))
+            started = time.perf_counter()
+            if mode == 'batch':
+                asyncio.run(scrape_in_batches(converter))
+            else:
+                converter.scrape_all()
+            elapsed = time.perf_counter() - started
+        finally:
+            os.chdir(previous_dir)
+        return {
+            'mode': mode,
+            'workers': overrides['workers'],
+            'pages': converter.pages_scraped or len(converter.visited_urls),
+            'requests': site.requests,
+            'elapsed': elapsed,
+            'loop_lag': converter.loop_lag
+        }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark crawl throughput against a synthetic site')
+    parser.add_argument('--pages', type=int, default=500, help='Pages on the synthetic site (default: 500)')
+    parser.add_argument('--latency', type=float, default=0.05,
+                        help='Seconds added to every response (default: 0.05)')
+    parser.add_argument('--workers', default='8',
+                        help='Comma-separated worker counts for threaded/async modes (default: 8)')
+    parser.add_argument('--modes', default=','.join(MODES),
+                        help=f"Comma-separated crawl modes (default: {','.join(MODES)})")
+    parser.add_argument('--store', default='json', choices=('json', 'jsonl', 'sqlite'),
+                        help='Page store backend (default: json)')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING, format='%(message)s')
+    modes = [mode.strip() for mode in args.modes.split(',') if mode.strip()]
+    unknown = set(modes) - set(MODES)
+    if unknown:
+        parser.error(f"unknown mode(s): {', '.join(sorted(unknown))} (use {', '.join(MODES)})")
+    worker_counts = [int(count) for count in args.workers.split(',')]
+
+    print(f"Synthetic site: {args.pages} pages, {args.latency * 1000:.0f}ms latency per response\n")
+    print(f"{'mode':<12}{'workers':>8}{'pages':>8}{'requests':>10}{'seconds':>10}{'pages/s':>10}"
+          f"{'vs seq':>9}{'vs batch':>10}{'lag p99/max ms':>16}")
+    sequential = None
+    batch: Dict[int, float] = {}  # worker count -> batch scheduler pages/s
+    # Baselines first, so every later row can be compared against them
+    order = sorted(modes, key=lambda mode: MODES.index(mode))
+    for mode in order:
+        for workers in ([1] if mode == 'sequential' else worker_counts):
+            result = run_crawl(mode, workers, args.pages, args.latency, args.store)
+            rate = result['pages'] / result['elapsed']
+            if mode == 'sequential':
+                sequential = rate
+            elif mode == 'batch':
+                batch[workers] = rate
+            vs_seq = f"{rate / sequential:>8.1f}x" if sequential else f"{'-':>9}"
+            vs_batch = f"{rate / batch[workers]:>9.1f}x" if mode != 'sequential' and workers in batch else f"{'-':>10}"
+            lag = result['loop_lag']
+            lag_ms = f"{lag['p99'] * 1000:.1f}/{lag['max'] * 1000:.1f}" if lag else '-'
+            print(f"{result['mode']:<12}{result['workers']:>8}{result['pages']:>8}{result['requests']:>10}"
+                  f"{result['elapsed']:>10.2f}{rate:>10.1f}{vs_seq}{vs_batch}{lag_ms:>16}")
+
+
+if __name__ == "__main__":
+    main()
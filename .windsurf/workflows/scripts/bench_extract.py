@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Extraction Micro-Benchmark
+
+Times parse_html (parsing plus the single-pass content/pattern walk) on
+large generated pages, API-reference sized with thousands of elements
+in the main content, for every available parser backend. Also checks
+that every backend produces the same page dicts as html.parser.
+
+Usage:
+    python3 cli/bench_extract.py
+    python3 cli/bench_extract.py --elements 6000 --pages 10 --repeat 5
+"""
+
+import os
+import sys
+import time
+import logging
+import argparse
+from typing import List
+
+# Add parent directory to path for imports when run as script
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cli.doc_scraper import DocToSkillConverter, PARSER_BACKENDS
+from cli.synthetic_site import SyntheticDocSite
+
+BENCH_URL = 'https://docs.example.com/docs/api/reference.html'
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark content extraction on large pages')
+    parser.add_argument('--elements', type=int, default=3000,
+                        help='Generated elements per page (default: 3000)')
+    parser.add_argument('--pages', type=int, default=10, help='Distinct pages to parse (default: 10)')
+    parser.add_argument('--repeat', type=int, default=3, help='Timed passes over all pages (default: 3)')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.ERROR, format='%(message)s')
+    site = SyntheticDocSite(pages=2 * args.pages + 1, elements=args.elements)
+    documents: List[bytes] = [site.render(n) for n in range(args.pages)]
+    size = sum(len(document) for document in documents) / len(documents)
+    print(f"{args.pages} pages, ~{args.elements} elements and {size / 1024:.0f} KB each, "
+          f"best of {args.repeat} passes\n")
+    print(f"{'backend':<14}{'ms/page':>10}{'pages/s':>10}{'vs html.parser':>16}{'output':>12}")
+
+    baseline_pages = None
+    baseline_time = None
+    for backend in PARSER_BACKENDS:
+        converter = DocToSkillConverter({
+            'name': 'bench',
+            'base_url': 'https://docs.example.com/docs/',
+            'parser': backend,
+            'selectors': {'main_content': 'div[role="main"]', 'title': 'title', 'code_blocks': 'pre code'},
+        }, dry_run=True)
+        if converter.parser_backend != backend:
+            print(f"{backend:<14}{'not installed':>48}")
+            continue
+
+        pages = [converter.parse_html(document, BENCH_URL) for document in documents]
+        best = float('inf')
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            for document in documents:
+                converter.parse_html(document, BENCH_URL)
+            best = min(best, time.perf_counter() - started)
+
+        per_page = best / len(documents)
+        if baseline_pages is None:
+            baseline_pages, baseline_time = pages, per_page
+        output = 'identical' if pages == baseline_pages else 'DIFFERS'
+        print(f"{backend:<14}{per_page * 1000:>10.1f}{1 / per_page:>10.1f}"
+              f"{baseline_time / per_page:>15.1f}x{output:>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Crawl Memory Benchmark
+
+Crawls in-process synthetic documentation sites of growing size with
+and without ``streaming`` and reports each crawl's peak RSS. Every crawl
+runs in its own child process so peaks don't carry over. In streaming
+mode pages go to the page store and only (title, url) stays in memory,
+so peak RSS should stay flat as the page count grows.
+
+Usage:
+    python3 cli/bench_memory.py
+    python3 cli/bench_memory.py --sizes 1000,4000,16000 --elements 600
+
+Unix only (peak RSS comes from the resource module).
+"""
+
+import os
+import sys
+import json
+import logging
+import argparse
+import resource
+import subprocess
+import tempfile
+
+# Add parent directory to path for imports when run as script
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def run_child(pages: int, elements: int, streaming: bool) -> None:
+    """Crawl one site and print the result as JSON (runs in a child process)."""
+    from cli.doc_scraper import DocToSkillConverter
+    from cli.synthetic_site import SyntheticDocSite
+
+    logging.basicConfig(level=logging.WARNING, format='%(message)s')
+    with tempfile.TemporaryDirectory(prefix='bench_memory_') as work_dir, \
+            SyntheticDocSite(pages=pages, elements=elements) as site:
+        os.chdir(work_dir)
+        baseline = peak_rss_mb()
+        converter = DocToSkillConverter(site.config('bench', workers=8, streaming=streaming))
+        converter.scrape_all()
+        print(json.dumps({
+            'pages': converter.pages_scraped or len(converter.visited_urls),
+            'baseline_mb': baseline,
+            'peak_mb': peak_rss_mb()
+        }))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark crawl peak RSS as the page count grows')
+    parser.add_argument('--sizes', default='500,1000,2000,4000',
+                        help='Comma-separated site sizes in pages (default: 500,1000,2000,4000)')
+    parser.add_argument('--elements', type=int, default=300,
+                        help='Generated elements per page (default: 300, ~25 KB of HTML)')
+    parser.add_argument('--child', nargs=3, metavar=('PAGES', 'ELEMENTS', 'STREAMING'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(int(args.child[0]), int(args.child[1]), args.child[2] == '1')
+        return
+
+    sizes = [int(size) for size in args.sizes.split(',')]
+    print(f"Peak RSS per crawl ({args.elements} elements per page, threaded, 8 workers)\n")
+    print(f"{'pages':>8}{'streaming MB':>15}{'in-memory MB':>15}")
+    for size in sizes:
+        row = []
+        for streaming in (True, False):
+            output = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), '--child', str(size), str(args.elements),
+                 '1' if streaming else '0'],
+                check=True, capture_output=True, text=True
+            ).stdout
+            result = json.loads(output.strip().splitlines()[-1])
+            row.append(result['peak_mb'])
+        print(f"{size:>8}{row[0]:>15.1f}{row[1]:>15.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+JSON Serialization Benchmark
+
+Encodes, writes and reads back a synthetic corpus of scraped page dicts
+(50k pages by default, shaped like doc_scraper output) with the old
+stdlib ``json.dump(indent=2)`` and with every installed serialization
+backend, then streams the corpus through the single-file page stores.
+
+Usage:
+    python3 cli/bench_serialization.py
+    python3 cli/bench_serialization.py --pages 10000 --skip-files
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import shutil
+import argparse
+import tempfile
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List
+
+# Add parent directory to path for imports when run as script
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cli import serialization
+from cli.page_store import open_page_store
+
+WORDS = ('component', 'render', 'state', 'hook', 'props', 'effect', 'über', 'naïve', '→',
+         'async', 'await', 'return', 'function', 'value', 'configuration', 'example')
+
+
+def make_corpus(count: int, seed: int = 1) -> List[Dict[str, Any]]:
+    """Deterministic page dicts (~6 KB of content, 25 links, 3 code samples each)."""
+    rng = random.Random(seed)
+    return [{
+        'url': f'https://docs.example.com/guide/section{i % 40}/page{i}.html',
+        'title': f'Page {i} – guide',
+        'content': ' '.join(rng.choice(WORDS) for _ in range(700)),
+        'headings': [{'level': 'h2', 'text': f'Heading {j}', 'id': f'heading-{j}'} for j in range(6)],
+        'code_samples': [{'code': 'const [x, setX] = useState(0);\n' * 8, 'language': 'javascript'}
+                         for _ in range(3)],
+        'patterns': [{'description': 'Example: call the hook', 'code': 'useEffect(() => {}, []);'}],
+        'links': [f'https://docs.example.com/guide/page{rng.randrange(count)}.html' for _ in range(25)]
+    } for i in range(count)]
+
+
+def available_backends() -> List[str]:
+    backends = ['json']
+    if serialization.MSGSPEC_AVAILABLE:
+        backends.append('msgspec')
+    if serialization.ORJSON_AVAILABLE:
+        backends.append('orjson')
+    return backends
+
+
+@contextmanager
+def json_backend(name: str) -> Iterator[None]:
+    """Temporarily switch the serialization module's backend."""
+    previous = serialization.JSON_BACKEND
+    serialization.JSON_BACKEND = name
+    try:
+        yield
+    finally:
+        serialization.JSON_BACKEND = previous
+
+
+def timed(func: Callable[[], Any]) -> float:
+    started = time.perf_counter()
+    func()
+    return time.perf_counter() - started
+
+
+def stdlib_write(path: str, obj: Any) -> None:
+    """What save_page/save_summary did before the serialization module."""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(obj, f, indent=2, ensure_ascii=False)
+
+
+def stdlib_read(path: str) -> Any:
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def bench_memory(corpus: List[Dict[str, Any]]) -> None:
+    print(f"\nEncode/decode in memory ({len(corpus)} pages)")
+    print(f"{'variant':<28}{'encode s':>10}{'decode s':>10}{'MB':>9}")
+    encoded: List[Any] = []
+    encode = timed(lambda: encoded.extend(json.dumps(page, indent=2, ensure_ascii=False) for page in corpus))
+    decode = timed(lambda: [json.loads(data) for data in encoded])
+    size = sum(len(data.encode()) for data in encoded) / 1e6
+    print(f"{'stdlib indent=2 (old)':<28}{encode:>10.2f}{decode:>10.2f}{size:>9.1f}")
+
+    for backend in available_backends():
+        for pretty in (False, True):
+            with json_backend(backend):
+                encoded = []
+                encode = timed(lambda: encoded.extend(serialization.dumps(page, pretty) for page in corpus))
+                decode = timed(lambda: [serialization.loads(data) for data in encoded])
+            size = sum(len(data) for data in encoded) / 1e6
+            label = f"{backend} {'pretty' if pretty else 'compact'}"
+            print(f"{label:<28}{encode:>10.2f}{decode:>10.2f}{size:>9.1f}")
+
+
+def bench_files(corpus: List[Dict[str, Any]], work_dir: str) -> None:
+    print(f"\nOne file per page ({len(corpus)} files, json page store layout)")
+    print(f"{'variant':<28}{'write s':>10}{'read s':>10}{'MB':>9}")
+    variants = [('stdlib indent=2 (old)', 'json', stdlib_write, stdlib_read)]
+    for backend in available_backends():
+        variants.append((f"{backend} compact", backend, serialization.write_json, serialization.read_json))
+
+    for label, backend, write, read in variants:
+        files_dir = os.path.join(work_dir, 'pages')
+        os.makedirs(files_dir)
+        paths = [os.path.join(files_dir, f"{i}.json") for i in range(len(corpus))]
+        with json_backend(backend):
+            write_time = timed(lambda: [write(path, page) for path, page in zip(paths, corpus)])
+            size = sum(os.path.getsize(path) for path in paths) / 1e6
+            read_time = timed(lambda: [read(path) for path in paths])
+        shutil.rmtree(files_dir)
+        print(f"{label:<28}{write_time:>10.2f}{read_time:>10.2f}{size:>9.1f}")
+
+
+def bench_stores(corpus: List[Dict[str, Any]], work_dir: str) -> None:
+    print(f"\nSingle-file page stores ({len(corpus)} pages, {serialization.JSON_BACKEND} backend)")
+    print(f"{'store':<28}{'write s':>10}{'iterate s':>10}{'MB':>9}")
+    for backend in ('jsonl', 'sqlite'):
+        data_dir = os.path.join(work_dir, backend)
+        store = open_page_store(data_dir, backend)
+        batch = 32  # PageWriter's default batch size
+
+        def write() -> None:
+            for start in range(0, len(corpus), batch):
+                store.put_many(corpus[start:start + batch])
+            store.flush()
+
+        write_time = timed(write)
+        iterate_time = timed(lambda: sum(1 for _ in store))
+        store.close()
+        size = sum(os.path.getsize(os.path.join(data_dir, name)) for name in os.listdir(data_dir)) / 1e6
+        shutil.rmtree(data_dir)
+        print(f"{backend:<28}{write_time:>10.2f}{iterate_time:>10.2f}{size:>9.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark JSON serialization on a synthetic page corpus')
+    parser.add_argument('--pages', type=int, default=50000, help='Pages in the corpus (default: 50000)')
+    parser.add_argument('--skip-files', action='store_true', help='Skip the one-file-per-page benchmark')
+    args = parser.parse_args()
+
+    print(f"Serialization backends installed: {', '.join(available_backends())} "
+          f"(default: {serialization.JSON_BACKEND})")
+    corpus = make_corpus(args.pages)
+    bench_memory(corpus)
+    with tempfile.TemporaryDirectory(prefix='bench_serialization_') as work_dir:
+        if not args.skip_files:
+            bench_files(corpus, work_dir)
+        bench_stores(corpus, work_dir)
+
+
+if __name__ == "__main__":
+    main()
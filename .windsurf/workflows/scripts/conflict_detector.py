@@ -11,12 +11,13 @@ Detects conflicts between documentation and code:
 Used by unified scraper to identify discrepancies before merging.
 """
 
-import json
 import logging
 from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass, asdict
 from difflib import SequenceMatcher
 
+from serialization import read_json, write_json
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -434,21 +435,21 @@ class ConflictDetector:
 
         return summary
 
-    def save_conflicts(self, conflicts: List[Conflict], output_path: str):
+    def save_conflicts(self, conflicts: List[Conflict], output_path: str, pretty: bool = False):
         """
         Save conflicts to JSON file.
 
         Args:
             conflicts: List of Conflict objects
             output_path: Path to output JSON file
+            pretty: Indent the JSON (default: compact)
         """
         data = {
             'conflicts': [asdict(c) for c in conflicts],
             'summary': self.generate_summary(conflicts)
         }
 
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        write_json(output_path, data, pretty=pretty)
 
         logger.info(f"Conflicts saved to: {output_path}")
 
@@ -464,11 +465,8 @@ if __name__ == '__main__':
     github_file = sys.argv[2]
 
     # Load data
-    with open(docs_file, 'r') as f:
-        docs_data = json.load(f)
-
-    with open(github_file, 'r') as f:
-        github_data = json.load(f)
+    docs_data = read_json(docs_file)
+    github_data = read_json(github_file)
 
     # Detect conflicts
     detector = ConflictDetector(docs_data, github_data)
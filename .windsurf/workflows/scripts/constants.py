@@ -11,6 +11,14 @@ DEFAULT_RATE_LIMIT = 0.5  # seconds between requests
 DEFAULT_MAX_PAGES = 500   # maximum pages to scrape
 DEFAULT_CHECKPOINT_INTERVAL = 1000  # pages between checkpoints
 DEFAULT_ASYNC_MODE = False  # use async mode for parallel scraping (opt-in)
+DEFAULT_PARSE_WORKERS = 0  # async mode: HTML parse processes (0 = parse on event loop)
+DEFAULT_PARSER_BACKEND = 'html.parser'  # 'html.parser', 'lxml' or 'lxml-direct'
+DEFAULT_HTTP_TIMEOUT = 30  # seconds per page request
+DEFAULT_PAGE_STORE = 'json'  # 'json' (pages/ dir), 'jsonl' or 'sqlite'
+DEFAULT_FRONTIER_MEMORY_LIMIT = 100000  # unlimited mode: queued URLs kept in memory before spilling to disk
+URL_DECISION_CACHE_SIZE = 50000  # is_valid_url / resolved-link results cached per crawl
+DEFAULT_MAX_RETRIES = 3  # retries per page for connection errors, timeouts and 429/5xx
+DEFAULT_WRITER_QUEUE_SIZE = 256  # async mode: parsed pages waiting for the writer thread
 
 # Content analysis limits
 CONTENT_PREVIEW_LENGTH = 500  # characters to check for categorization
@@ -37,6 +45,7 @@ LOCAL_PREVIEW_LIMIT = 20000  # max characters for preview
 # Estimation and discovery settings
 DEFAULT_MAX_DISCOVERY = 1000  # default max pages to discover
 DISCOVERY_THRESHOLD = 10000   # threshold for warnings
+DEFAULT_ESTIMATE_WORKERS = 8  # minimum concurrent requests for --estimate
 
 # ===== FILE LIMITS =====
 
@@ -52,6 +61,14 @@ __all__ = [
     'DEFAULT_MAX_PAGES',
     'DEFAULT_CHECKPOINT_INTERVAL',
     'DEFAULT_ASYNC_MODE',
+    'DEFAULT_PARSE_WORKERS',
+    'DEFAULT_PARSER_BACKEND',
+    'DEFAULT_HTTP_TIMEOUT',
+    'DEFAULT_PAGE_STORE',
+    'DEFAULT_FRONTIER_MEMORY_LIMIT',
+    'URL_DECISION_CACHE_SIZE',
+    'DEFAULT_MAX_RETRIES',
+    'DEFAULT_WRITER_QUEUE_SIZE',
     'CONTENT_PREVIEW_LENGTH',
     'MAX_PAGES_WARNING_THRESHOLD',
     'MIN_CATEGORIZATION_SCORE',
@@ -66,6 +83,7 @@ __all__ = [
     # Estimation
     'DEFAULT_MAX_DISCOVERY',
     'DISCOVERY_THRESHOLD',
+    'DEFAULT_ESTIMATE_WORKERS',
     # Limits
     'MAX_REFERENCE_FILES',
     'MAX_CODE_BLOCKS_PER_PAGE',
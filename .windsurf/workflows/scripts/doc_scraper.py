@@ -15,16 +15,36 @@ import json
 import time
 import re
 import argparse
-import hashlib
+import codecs
+import fnmatch
+import importlib.util
 import logging
 import asyncio
+import bisect
+import itertools
+import threading
+from array import array
 import requests
 import httpx
-from pathlib import Path
-from urllib.parse import urljoin, urlparse
-from bs4 import BeautifulSoup
-from collections import deque, defaultdict
-from typing import Optional, Dict, List, Tuple, Set, Deque, Any
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib.parse import urljoin, urlparse, urlsplit, urlunsplit, parse_qsl, urlencode
+from urllib.robotparser import RobotFileParser
+from html.parser import HTMLParser
+from bs4 import BeautifulSoup, UnicodeDammit
+from bs4.element import CData, NavigableString, Tag
+from collections import Counter, deque, defaultdict
+from typing import Optional, Dict, List, Tuple, Set, Deque, Any, Iterable, Union
+
+# Optional fast HTML parsing backends
+try:
+    import lxml.html
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+# Only used through lxml's cssselect(), so check for it without importing
+CSSSELECT_AVAILABLE = importlib.util.find_spec('cssselect') is not None
 
 # Add parent directory to path for imports when run as script
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -32,11 +52,37 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from cli.llms_txt_detector import LlmsTxtDetector
 from cli.llms_txt_parser import LlmsTxtParser
 from cli.llms_txt_downloader import LlmsTxtDownloader
+from cli.page_store import PAGE_STORE_BACKENDS, PageStore, PageWriter, open_page_store
+from cli.serialization import read_json, write_json
+from cli.frontier import CrawlFrontier, FingerprintSet, url_depth_priority
+from cli.journal import CrawlJournal
+from cli.fetch_policy import (
+    ConcurrencyController,
+    HostCircuitBreaker,
+    HostRateLimiter,
+    RetryPolicy,
+    RetryQueue,
+    parse_retry_after
+)
+from cli.sitemap import SitemapReader
+from cli.http_cache import HttpMetadataCache
+from cli.html_archive import RawHtmlArchive, decompress_html
 from cli.constants import (
     DEFAULT_RATE_LIMIT,
     DEFAULT_MAX_PAGES,
     DEFAULT_CHECKPOINT_INTERVAL,
     DEFAULT_ASYNC_MODE,
+    DEFAULT_PARSE_WORKERS,
+    DEFAULT_PARSER_BACKEND,
+    DEFAULT_HTTP_TIMEOUT,
+    DEFAULT_PAGE_STORE,
+    DEFAULT_FRONTIER_MEMORY_LIMIT,
+    URL_DECISION_CACHE_SIZE,
+    DEFAULT_MAX_RETRIES,
+    DEFAULT_WRITER_QUEUE_SIZE,
+    DEFAULT_MAX_DISCOVERY,
+    DISCOVERY_THRESHOLD,
+    DEFAULT_ESTIMATE_WORKERS,
     CONTENT_PREVIEW_LENGTH,
     MAX_PAGES_WARNING_THRESHOLD,
     MIN_CATEGORIZATION_SCORE
@@ -67,6 +113,506 @@ def setup_logging(verbose: bool = False, quiet: bool = False) -> None:
     )
 
 
+PARSER_BACKENDS = ('html.parser', 'lxml', 'lxml-direct')
+
+
+def resolve_parser_backend(requested: str) -> str:
+    """Pick the requested HTML parser backend, falling back if it's unavailable.
+
+    Backends:
+        - ``html.parser``: BeautifulSoup with the stdlib parser (always available)
+        - ``lxml``: BeautifulSoup with the lxml tree builder
+        - ``lxml-direct``: lxml.html + cssselect, bypassing BeautifulSoup
+
+    Args:
+        requested: Backend name from config
+
+    Returns:
+        str: Backend that will actually be used
+    """
+    if requested == 'lxml-direct' and not (LXML_AVAILABLE and CSSSELECT_AVAILABLE):
+        fallback = 'lxml' if LXML_AVAILABLE else 'html.parser'
+        logger.warning("⚠️  Parser 'lxml-direct' needs lxml and cssselect - falling back to '%s'", fallback)
+        return fallback
+    if requested == 'lxml' and not LXML_AVAILABLE:
+        logger.warning("⚠️  Parser 'lxml' not installed - falling back to 'html.parser'")
+        return 'html.parser'
+    if requested not in PARSER_BACKENDS:
+        logger.warning("⚠️  Unknown parser '%s' - using 'html.parser'", requested)
+        return 'html.parser'
+    return requested
+
+
+# One lxml parser per encoding and thread (parsers must not be shared across threads)
+_lxml_parsers = threading.local()
+
+
+def _lxml_document(content: bytes) -> Any:
+    """Parse raw HTML with lxml, decoding it the way BeautifulSoup would.
+
+    Without a charset declaration lxml assumes Latin-1, so the encoding is
+    detected with UnicodeDammit (declaration, then sniffing, then UTF-8 and
+    Windows-1252) to keep ``lxml-direct`` text identical to the soup backends.
+    """
+    encoding = UnicodeDammit(content, is_html=True).original_encoding
+    parsers = _lxml_parsers.__dict__
+    parser = parsers.get(encoding)
+    if parser is None:
+        parser = parsers[encoding] = lxml.html.HTMLParser(encoding=encoding)
+    return lxml.html.document_fromstring(content, parser=parser)
+
+
+# Text of a <p>/<div> containing one of these marks it as a pattern anchor
+PATTERN_KEYWORDS = ('example:', 'pattern:', 'usage:', 'typical use')
+_PATTERN_KEYWORD_RE = re.compile('|'.join(re.escape(word) for word in PATTERN_KEYWORDS))
+
+# Tags whose strings BeautifulSoup's get_text() leaves out of ordinary elements
+_STRING_CONTAINER_TAGS = frozenset(('script', 'style', 'template', 'rt', 'rp'))
+_SOUP_TEXT_TYPES = (NavigableString, CData)
+_HEADING_TAGS = frozenset(('h1', 'h2', 'h3', 'h4', 'h5', 'h6'))
+
+# DOM walk events
+_START, _TEXT, _END = 0, 1, 2
+
+
+def _soup_events(main: Any) -> Any:
+    """Yield start/text/end events for the descendants of a BeautifulSoup tag.
+
+    Only NavigableString and CData count as text, matching get_text().
+    """
+    stack = [iter(main.contents)]
+    while stack:
+        for node in stack[-1]:
+            if isinstance(node, Tag):
+                yield _START, node, node.name
+                stack.append(iter(node.contents))
+                break
+            if type(node) in _SOUP_TEXT_TYPES:
+                yield _TEXT, node, None
+        else:
+            stack.pop()
+            if stack:
+                yield _END, None, None
+
+
+def _lxml_events(main: Any) -> Any:
+    """Yield start/text/end events for the descendants of an lxml element.
+
+    Text inside script/style/template/rt/rp is skipped so element text
+    matches BeautifulSoup's get_text().
+    """
+    suppressed = 1 if main.tag in _STRING_CONTAINER_TAGS else 0
+    if main.text and not suppressed:
+        yield _TEXT, main.text, None
+
+    stack = [(main, iter(main))]
+    while stack:
+        for node in stack[-1][1]:
+            if not isinstance(node.tag, str):
+                # Comment / processing instruction: only its tail is text
+                if node.tail and not suppressed:
+                    yield _TEXT, node.tail, None
+                continue
+            yield _START, node, node.tag
+            if node.tag in _STRING_CONTAINER_TAGS:
+                suppressed += 1
+            if node.text and not suppressed:
+                yield _TEXT, node.text, None
+            stack.append((node, iter(node)))
+            break
+        else:
+            node = stack.pop()[0]
+            if stack:
+                yield _END, None, None
+                if node.tag in _STRING_CONTAINER_TAGS:
+                    suppressed -= 1
+                if node.tail and not suppressed:
+                    yield _TEXT, node.tail, None
+
+
+def _events_text(events: Any) -> str:
+    """Concatenate the text events of a DOM walk."""
+    return ''.join(node for kind, node, _ in events if kind == _TEXT)
+
+
+class _MainContentWalk:
+    """Everything extract_content needs, collected in one DOM traversal.
+
+    Text is stored once as a flat list of fragments; each interesting
+    element only records its [start, end) fragment range, so nested
+    elements never re-walk their subtree to get their text. Every record
+    is a list starting with ``start, end``.
+    """
+
+    def __init__(self, main: Any, events: Any, code_elems: Set[int]) -> None:
+        self.fragments: List[str] = []
+        self.headings: List[List[Any]] = []  # [start, end, tag, name]
+        self.code_blocks: List[List[Any]] = []  # [start, end, tag, parent]
+        self.blocks: List[List[Any]] = []  # <p>/<div>: [start, end, tag, name, order]
+        self.code_anchors: List[List[Any]] = []  # <pre>/<code>: [start, end, order]
+        self.link_tags: List[Any] = []
+        self.last_tag: Any = None
+
+        fragments = self.fragments
+        open_records: List[Optional[List[Any]]] = []
+        open_tags: List[Any] = [main]
+        order = 0
+
+        for kind, node, name in events:
+            if kind == _TEXT:
+                fragments.append(node)
+                continue
+
+            if kind == _END:
+                open_tags.pop()
+                records = open_records.pop()
+                if records:
+                    end = len(fragments)
+                    for record in records:
+                        record[1] = end
+                continue
+
+            # _START
+            start = len(fragments)
+            records = []
+            if name in _HEADING_TAGS:
+                record = [start, start, node, name]
+                self.headings.append(record)
+                records.append(record)
+            if name == 'p' or name == 'div':
+                record = [start, start, node, name, order]
+                self.blocks.append(record)
+                records.append(record)
+            if name == 'pre' or name == 'code':
+                record = [start, start, order]
+                self.code_anchors.append(record)
+                records.append(record)
+            if id(node) in code_elems:
+                record = [start, start, node, open_tags[-1]]
+                self.code_blocks.append(record)
+                records.append(record)
+            if name == 'a':
+                self.link_tags.append(node)
+
+            open_tags.append(node)
+            open_records.append(records or None)
+            self.last_tag = node
+            order += 1
+
+    def text(self, start: int, end: int) -> str:
+        """Concatenated text of a recorded fragment range."""
+        return ''.join(self.fragments[start:end])
+
+    def pattern_anchors(self) -> Any:
+        """Yield (block, next_code_anchor) for <p>/<div> blocks mentioning a pattern keyword.
+
+        Blocks come in document order. next_code_anchor is the first
+        <pre>/<code> after the block's start tag (descendants included),
+        or None if it lies beyond the walked element.
+        """
+        lowered_parts = [fragment.lower() for fragment in self.fragments]
+        offsets = list(itertools.accumulate(map(len, lowered_parts), initial=0))
+        hits = [(m.start(), m.end()) for m in _PATTERN_KEYWORD_RE.finditer(''.join(lowered_parts))]
+        if not hits:
+            return
+
+        # Keywords never overlap, so hit starts and ends are both sorted
+        hit_starts = [start for start, _ in hits]
+        anchor_orders = [anchor[2] for anchor in self.code_anchors]
+
+        for block in self.blocks:
+            lo, hi = offsets[block[0]], offsets[block[1]]
+            i = bisect.bisect_left(hit_starts, lo)
+            if i == len(hits) or hits[i][1] > hi:
+                continue
+            j = bisect.bisect_right(anchor_orders, block[4])
+            yield block, (self.code_anchors[j] if j < len(self.code_anchors) else None)
+
+
+class UrlCanonicalizer:
+    """Rewrites URLs to one canonical form so variants are fetched once.
+
+    Always strips ``#fragments``. When enabled (config ``canonicalize``:
+    true, or a dict overriding DEFAULT_RULES) it also:
+
+    - lowercases the host and drops default ports
+    - rewrites the scheme ('keep', 'http', 'https'; default: base_url's)
+    - drops query keys matching ``drop_query_keys`` globs (or the whole
+      query with ``drop_query``) and sorts the rest (``sort_query``)
+    - collapses ``index_documents`` (``/guide/index.html`` -> ``/guide/``)
+    - normalizes the trailing slash ('strip', 'add' or 'keep'; default
+      'keep', since servers may serve ``/guide`` and ``/guide/`` differently)
+
+    URLs carrying userinfo (``user:pw@host``) are left as they are. The
+    canonical form is only a dedup key; the crawler still fetches the URL
+    it discovered.
+    """
+
+    DEFAULT_RULES: Dict[str, Any] = {
+        'scheme': None,  # None: same as base_url
+        'drop_query_keys': ['utm_*', 'gclid', 'fbclid', 'mc_cid', 'mc_eid', '_ga', 'ref'],
+        'drop_query': False,
+        'sort_query': True,
+        'index_documents': ['index.html', 'index.htm'],
+        'trailing_slash': 'keep',
+    }
+
+    TRAILING_SLASH_MODES = ('strip', 'add', 'keep')
+    SCHEME_MODES = ('keep', 'http', 'https')
+    DEFAULT_PORTS = {'http': '80', 'https': '443'}
+
+    def __init__(self, rules: Union[bool, Dict[str, Any], None] = None, base_url: str = '') -> None:
+        self.enabled = bool(rules)
+        merged = dict(self.DEFAULT_RULES)
+        if isinstance(rules, dict):
+            merged.update(rules)
+        self.scheme = merged['scheme'] or urlsplit(base_url).scheme or 'keep'
+        self.drop_query_keys = list(merged['drop_query_keys'])
+        self.drop_query = merged['drop_query']
+        self.sort_query = merged['sort_query']
+        self.index_documents = set(merged['index_documents'])
+        self.trailing_slash = merged['trailing_slash']
+
+    def _keep_query_key(self, key: str) -> bool:
+        return not any(fnmatch.fnmatchcase(key, pattern) for pattern in self.drop_query_keys)
+
+    def __call__(self, url: str) -> str:
+        url = url.split('#')[0]
+        if not self.enabled:
+            return url
+
+        parts = urlsplit(url)
+        scheme, path, query = parts.scheme, parts.path, parts.query
+        if scheme not in self.DEFAULT_PORTS or not parts.hostname:
+            return url
+        if parts.username is not None or parts.password is not None:
+            return url
+        try:
+            port = parts.port
+        except ValueError:
+            return url
+
+        # Default port is judged against the original scheme, before any rewrite
+        host = f"[{parts.hostname}]" if ':' in parts.hostname else parts.hostname
+        if port is not None and str(port) != self.DEFAULT_PORTS[scheme]:
+            host = f"{host}:{port}"
+        if self.scheme != 'keep':
+            scheme = self.scheme
+
+        if self.drop_query or not query:
+            query = ''
+        else:
+            params = [(k, v) for k, v in parse_qsl(query, keep_blank_values=True) if self._keep_query_key(k)]
+            if self.sort_query:
+                params.sort()
+            query = urlencode(params)
+
+        head, _, last = path.rpartition('/')
+        if last in self.index_documents:
+            path = head + '/'
+        if not path:
+            path = '/'
+        if path != '/':
+            if self.trailing_slash == 'strip':
+                path = path.rstrip('/') or '/'
+            elif self.trailing_slash == 'add' and not path.endswith('/') and '.' not in path.rsplit('/', 1)[-1]:
+                path += '/'
+
+        return urlunsplit((scheme, host, path, query, ''))
+
+
+class UrlPatternMatcher:
+    """``url_patterns`` include/exclude list compiled into one regex.
+
+    Pattern types:
+    - ``"/api/"``: substring anywhere in the URL (the original behavior)
+    - ``"glob:*/v2/*"``: shell-style glob matched against the whole URL
+    - ``"re:/v[0-9]+/"``: regular expression searched in the URL
+
+    Substring and glob patterns are joined into a single alternation, so a
+    URL is tested with one regex search instead of one ``in`` check per
+    pattern. ``re:`` patterns are compiled one by one: joined, their inline
+    global flags (``(?i)``) would be rejected and their backreferences
+    renumbered.
+    """
+
+    GLOB_PREFIX = 'glob:'
+    REGEX_PREFIX = 're:'
+
+    def __init__(self, patterns: List[str]) -> None:
+        self.patterns = list(patterns)
+        parts = [self.pattern_regex(pattern) for pattern in self.patterns
+                 if not pattern.startswith(self.REGEX_PREFIX)]
+        self._regex = re.compile('|'.join(f'(?:{part})' for part in parts)) if parts else None
+        self._regexes = [re.compile(self.pattern_regex(pattern)) for pattern in self.patterns
+                         if pattern.startswith(self.REGEX_PREFIX)]
+
+    @classmethod
+    def pattern_regex(cls, pattern: str) -> str:
+        """Regex source for one pattern (raises re.error for a bad ``re:``)."""
+        if pattern.startswith(cls.REGEX_PREFIX):
+            source = pattern[len(cls.REGEX_PREFIX):]
+            re.compile(source)
+            return source
+        if pattern.startswith(cls.GLOB_PREFIX):
+            return r'\A' + fnmatch.translate(pattern[len(cls.GLOB_PREFIX):])
+        return re.escape(pattern)
+
+    def __bool__(self) -> bool:
+        return bool(self.patterns)
+
+    def matches(self, url: str) -> bool:
+        if self._regex is not None and self._regex.search(url) is not None:
+            return True
+        return any(regex.search(url) is not None for regex in self._regexes)
+
+
+class EventLoopLagMonitor:
+    """Measure how late the event loop resumes a sleeping coroutine.
+
+    Anything that blocks the loop (disk writes, parsing, a slow callback)
+    delays every other task by the same amount; sampling the overshoot of
+    a short ``asyncio.sleep`` shows how much of that is happening.
+    """
+
+    def __init__(self, interval: float = 0.05) -> None:
+        self.interval = interval
+        self.samples = array('d')
+
+    async def run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            await asyncio.sleep(self.interval)
+            self.samples.append(max(0.0, loop.time() - started - self.interval))
+
+    def stats(self) -> Dict[str, float]:
+        """Mean, p99 and max lag in seconds."""
+        if not self.samples:
+            return {'mean': 0.0, 'p99': 0.0, 'max': 0.0}
+        ordered = sorted(self.samples)
+        return {
+            'mean': sum(ordered) / len(ordered),
+            'p99': ordered[int(0.99 * (len(ordered) - 1))],
+            'max': ordered[-1]
+        }
+
+
+class StreamingLinkExtractor(HTMLParser):
+    """Collect ``<a href>`` values from HTML fed in chunks, without a DOM.
+
+    Used by ``--estimate``. Like extract_content, only links inside the
+    first element matching the main-content selector are kept. Simple
+    selectors are supported (``tag``, ``#id``, ``.class``,
+    ``[attr]``/``[attr=value]`` compounds, comma-separated lists); for
+    anything else every link on the page is collected. Open elements
+    are tracked on a stack and an end tag closes everything opened after
+    its start tag (so unclosed ``<p>``/``<li>`` don't leak), which is
+    close enough to a browser's tree for sizing a crawl.
+    """
+
+    VOID_TAGS = frozenset(('area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input',
+                           'link', 'meta', 'param', 'source', 'track', 'wbr'))
+    _COMPOUND = re.compile(r'^([a-zA-Z][\w-]*|\*)?((?:#[\w-]+|\.[\w-]+|\[[^\]]+\])*)$')
+    _PART = re.compile(r'#([\w-]+)|\.([\w-]+)|\[\s*([\w-]+)\s*(?:=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\]\s]*))\s*)?\]')
+
+    @classmethod
+    def compile_selector(cls, selector: str) -> Optional[List[Tuple[Optional[str], List[Tuple[str, Optional[str]]]]]]:
+        """Parse a simple selector list into (tag, [(attr, value)]) rules, or None if unsupported."""
+        rules = []
+        for compound in selector.split(','):
+            match = cls._COMPOUND.match(compound.strip())
+            if not match or not compound.strip():
+                return None
+            tag = match.group(1) if match.group(1) not in (None, '*') else None
+            conditions: List[Tuple[str, Optional[str]]] = []
+            for part in cls._PART.finditer(match.group(2)):
+                if part.group(1):
+                    conditions.append(('id', part.group(1)))
+                elif part.group(2):
+                    conditions.append(('.class', part.group(2)))
+                else:
+                    value = next((v for v in part.group(4, 5, 6) if v is not None), None)
+                    conditions.append((part.group(3).lower(), value))
+            rules.append((tag.lower() if tag else None, conditions))
+        return rules
+
+    def __init__(self, selector: Optional[str] = None) -> None:
+        super().__init__(convert_charrefs=True)
+        self.links: List[str] = []
+        self.rules = self.compile_selector(selector) if selector else None
+        self._open: List[str] = []  # open tags inside the main-content element
+        self._done = False          # first match closed: ignore the rest (select_one)
+
+    def _matches(self, tag: str, attrs: Dict[str, Optional[str]]) -> bool:
+        for rule_tag, conditions in self.rules:
+            if rule_tag and rule_tag != tag:
+                continue
+            for attr, value in conditions:
+                if attr == '.class':
+                    if value not in (attrs.get('class') or '').split():
+                        break
+                elif attr not in attrs or (value is not None and attrs[attr] != value):
+                    break
+            else:
+                return True
+        return False
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        if self.rules is None:
+            inside = True
+        elif self._open:
+            inside = True
+            if tag not in self.VOID_TAGS:
+                self._open.append(tag)
+        elif not self._done and self._matches(tag, dict(attrs)):
+            inside = False
+            if tag not in self.VOID_TAGS:
+                self._open.append(tag)
+        else:
+            inside = False
+        if inside and tag == 'a':
+            href = dict(attrs).get('href')
+            if href:
+                self.links.append(href.strip())
+
+    def handle_startendtag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        if tag == 'a' and (self.rules is None or self._open):
+            href = dict(attrs).get('href')
+            if href:
+                self.links.append(href.strip())
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in self._open:
+            # Close this element and anything left unclosed inside it
+            while self._open.pop() != tag:
+                pass
+            if not self._open:
+                self._done = True
+
+
+# Converter used by parse worker processes (set by _init_parse_worker)
+_parse_converter: Optional['DocToSkillConverter'] = None
+
+
+def _init_parse_worker(config: Dict[str, Any]) -> None:
+    """ProcessPoolExecutor initializer: build a converter once per worker process."""
+    global _parse_converter
+    _parse_converter = DocToSkillConverter(config, dry_run=True)
+
+
+def _parse_page_in_worker(content: bytes, url: str, base: Optional[str] = None) -> Dict[str, Any]:
+    """Parse raw HTML into a page dict inside a parse worker process."""
+    assert _parse_converter is not None, "parse worker not initialized"
+    return _parse_converter.parse_html(content, url, base)
+
+
+def _reextract_in_worker(records: List[Tuple[str, str, str, bytes]]) -> List[Dict[str, Any]]:
+    """Decompress and parse a batch of archived pages inside a parse worker process."""
+    return [_parse_page_in_worker(decompress_html(codec, blob), url, base)
+            for url, base, codec, blob in records]
+
+
 class DocToSkillConverter:
     def __init__(self, config: Dict[str, Any], dry_run: bool = False, resume: bool = False) -> None:
         self.config = config
@@ -84,6 +630,7 @@ class DocToSkillConverter:
         checkpoint_config = config.get('checkpoint', {})
         self.checkpoint_enabled = checkpoint_config.get('enabled', False)
         self.checkpoint_interval = checkpoint_config.get('interval', DEFAULT_CHECKPOINT_INTERVAL)
+        self.checkpoint_lock = threading.Lock()
 
         # llms.txt detection state
         self.llms_txt_detected = False
@@ -93,23 +640,135 @@ class DocToSkillConverter:
         # Parallel scraping config
         self.workers = config.get('workers', 1)
         self.async_mode = config.get('async_mode', DEFAULT_ASYNC_MODE)
+        # Adaptive concurrency: 'workers' becomes the ceiling for an AIMD limit
+        self.concurrency: Optional[ConcurrencyController] = None
+        adaptive = config.get('adaptive_concurrency', False)
+        if adaptive and self.workers > 1:
+            options = adaptive if isinstance(adaptive, dict) else {}
+            self.concurrency = ConcurrencyController(
+                options.get('min_workers', 1),
+                self.workers,
+                window=options.get('window', 20),
+                latency_target=options.get('latency_target'),
+                error_threshold=options.get('error_threshold', 0.05)
+            )
+        elif adaptive:
+            logger.warning("⚠️  adaptive_concurrency needs workers > 1 (it adapts up to 'workers'); ignoring")
+        # Async mode: parse HTML in this many processes instead of on the event loop
+        self.parse_workers = config.get('parse_workers', DEFAULT_PARSE_WORKERS)
+        self.parse_pool: Optional[Any] = None
+        # Async mode: persist pages on a writer thread instead of the event loop
+        self.async_writer = config.get('async_writer', True)
+        self.page_writer: Optional[PageWriter] = None
+        self.loop_lag: Optional[Dict[str, float]] = None  # EventLoopLagMonitor stats of the last async crawl
+
+        # HTML parser backend (falls back automatically if a library is missing)
+        self.parser_backend = resolve_parser_backend(config.get('parser', DEFAULT_PARSER_BACKEND))
+        # Tree builder for code paths that always need a BeautifulSoup tree
+        self.soup_features = 'html.parser' if self.parser_backend == 'html.parser' else 'lxml'
+
+        # Write-ahead journal behind checkpoints/--resume
+        self.journal: Optional[CrawlJournal] = None
+        if self.checkpoint_enabled and not dry_run:
+            self.journal = CrawlJournal(self.data_dir, self.checkpoint_file)
 
         # State
-        self.visited_urls: set[str] = set()
+        # compact_visited: fingerprint set (no URL strings kept) for huge crawls
+        self.visited_urls: Union[Set[str], FingerprintSet] = (
+            FingerprintSet() if config.get('compact_visited', False) else set()
+        )
+        # URL filters, compiled once; decisions cached for repeated nav links
+        url_patterns = config.get('url_patterns', {})
+        self.include_matcher = UrlPatternMatcher(url_patterns.get('include', []))
+        self.exclude_matcher = UrlPatternMatcher(url_patterns.get('exclude', []))
+        self.url_decisions: Dict[str, bool] = {}
+        self.link_cache: Dict[Tuple[str, str], Optional[str]] = {}
+
+        # One canonical form per URL: the dedupe and page-store key, never
+        # the URL that is fetched
+        self.canonicalize_url = UrlCanonicalizer(config.get('canonicalize'), self.base_url)
+        # Scope check runs on canonical URLs, so compare against the canonical
+        # base; keep base_url's trailing slash as the path boundary
+        self.url_prefix = (self.canonicalize_url(self.base_url).rstrip('/')
+                           + ('/' if self.base_url.endswith('/') else ''))
+
         # Support multiple starting URLs
         start_urls = config.get('start_urls', [self.base_url])
-        self.pending_urls = deque(start_urls)
-        self.pages: List[Dict[str, Any]] = []
+        self.frontier = self._new_frontier(start_urls)
+        # Streaming mode keeps only (title, url) per page; content lives in the page store
+        self.streaming = config.get('streaming', False)
+        self.pages: List[Any] = []
         self.pages_scraped = 0
+        # Set by load_checkpoint: summary then lists earlier sessions' pages from the store
+        self.resumed = False
+
+        # Compact JSON output unless pretty_json (indented, ~30% larger)
+        self.pretty_json = config.get('pretty_json', False)
+
+        # Page storage backend (pages/ directory, JSONL or SQLite)
+        self.page_store: Optional[PageStore] = None
+        if not dry_run:
+            self.page_store = open_page_store(self.data_dir, config.get('page_store', DEFAULT_PAGE_STORE),
+                                              self.pretty_json)
+
+        # Shared per-host request budget (replaces sleeping after each page)
+        self.rate_limiter = HostRateLimiter(
+            float(config.get('rate_limit', DEFAULT_RATE_LIMIT) or 0),
+            config.get('rate_limit_burst', 1)
+        )
+        self.honor_retry_after = config.get('honor_retry_after', True)
+
+        # Retries with backoff, per-host circuit breaker, failed-URL log
+        retry_config = config.get('retry', {})
+        self.retry_policy = RetryPolicy(
+            config.get('max_retries', DEFAULT_MAX_RETRIES),
+            retry_config.get('base_delay', 1.0),
+            retry_config.get('max_delay', 60.0)
+        )
+        self.retry_queue = RetryQueue(retry_config.get('queue_size', 1000))
+        self.circuit_breaker = HostCircuitBreaker(
+            self.rate_limiter,
+            retry_config.get('breaker_threshold', 5),
+            retry_config.get('breaker_cooldown', 30.0)
+        )
+        # Last failure of each URL waiting in retry_queue (saved with failed_urls)
+        self.retrying: Dict[str, Dict[str, Any]] = {}
+        self.failed_urls: Dict[str, Dict[str, Any]] = {}
+        self.failed_file = f"{self.data_dir}/failed_urls.json"
+        self.retrying_failed = False
+
+        # Sitemap seeding (opt-in): <lastmod> per URL from the last run
+        self.sitemap_file = f"{self.data_dir}/sitemap_lastmod.json"
+        self.sitemap_lastmod: Dict[str, str] = {}
+
+        # Conditional-request cache for incremental re-scrapes (opt-in)
+        self.http_cache: Optional[HttpMetadataCache] = None
+        if config.get('http_cache', False) and self.page_store is not None:
+            self.http_cache = HttpMetadataCache(self.data_dir, self.page_store)
+
+        # Raw HTML archive for offline re-extraction (opt-in)
+        archive_setting = config.get('archive_html', False)
+        self.html_archive: Optional[RawHtmlArchive] = None
+        if archive_setting and not dry_run:
+            codec = archive_setting if isinstance(archive_setting, str) else 'auto'
+            self.html_archive = RawHtmlArchive(self.data_dir, codec)
+
+        # Pooled keep-alive HTTP sessions, one per scraping thread
+        self.pool_size = config.get('pool_size', max(self.workers, 1))
+        self.session_local = threading.local()
+        self.sessions: List[requests.Session] = []
+        self.sessions_lock = threading.Lock()
 
         # Thread-safe lock for parallel scraping
         if self.workers > 1:
-            import threading
             self.lock = threading.Lock()
+            # Signalled when links are queued or a page finishes (shares self.lock)
+            self.work_available = threading.Condition(self.lock)
+            self.in_flight = 0
+            self.stop_requested = False
 
         # Create directories (unless dry-run)
         if not dry_run:
-            os.makedirs(f"{self.data_dir}/pages", exist_ok=True)
             os.makedirs(f"{self.skill_dir}/references", exist_ok=True)
             os.makedirs(f"{self.skill_dir}/scripts", exist_ok=True)
             os.makedirs(f"{self.skill_dir}/assets", exist_ok=True)
@@ -117,70 +776,193 @@ class DocToSkillConverter:
         # Load checkpoint if resuming
         if resume and not dry_run:
             self.load_checkpoint()
+
+        if self.http_cache:
+            self.http_cache.load()
     
-    def is_valid_url(self, url: str) -> bool:
-        """Check if URL should be scraped based on patterns.
+    def _new_frontier(self, urls: List[str],
+                      seen: Optional[Union[Set[str], FingerprintSet]] = None) -> CrawlFrontier:
+        """Create a frontier honoring the configured crawl order.
 
         Args:
-            url (str): URL to validate
+            urls: URLs to queue initially
+            seen: URLs already visited (never re-queued)
 
         Returns:
-            bool: True if URL matches include patterns and doesn't match exclude patterns
+            CrawlFrontier: FIFO frontier, or shallow-first when
+            ``crawl_order`` is ``"shallow_first"``
         """
-        if not url.startswith(self.base_url):
-            return False
+        crawl_order = self.config.get('crawl_order', 'fifo')
+        priority = url_depth_priority if crawl_order == 'shallow_first' else None
+        on_queue = self.journal.record_queued if self.journal else None
+        compact = isinstance(self.visited_urls, FingerprintSet)
 
-        # Include patterns
-        includes = self.config.get('url_patterns', {}).get('include', [])
-        if includes and not any(pattern in url for pattern in includes):
-            return False
+        # Unlimited crawls spill the queue tail to disk by default
+        max_pages = self.config.get('max_pages', DEFAULT_MAX_PAGES)
+        unlimited = max_pages is None or max_pages == -1
+        memory_limit = self.config.get('frontier_memory_limit',
+                                       DEFAULT_FRONTIER_MEMORY_LIMIT if unlimited else 0)
+        if memory_limit and priority is not None:
+            logger.warning("⚠️  frontier_memory_limit is ignored with crawl_order 'shallow_first' (in-memory only)")
+        spill_dir = None if self.dry_run else self.data_dir
 
-        # Exclude patterns
-        excludes = self.config.get('url_patterns', {}).get('exclude', [])
-        if any(pattern in url for pattern in excludes):
-            return False
+        return CrawlFrontier(urls, seen=seen, priority=priority, on_queue=on_queue, compact=compact,
+                             memory_limit=memory_limit, spill_dir=spill_dir, key=self.canonicalize_url)
+
+    def _mark_visited(self, url: str) -> bool:
+        """Add a URL's canonical key to visited_urls (and the URL to the crawl journal).
 
+        Returns:
+            bool: False (and nothing recorded) if the key was already visited
+        """
+        key = self.canonicalize_url(url)
+        if key in self.visited_urls:
+            return False
+        self.visited_urls.add(key)
+        if self.journal:
+            self.journal.record_visited(url)
         return True
 
+    def _mark_completed(self, url: str) -> None:
+        """Note that a claimed URL's page is stored or has failed for good."""
+        if self.journal:
+            self.journal.record_completed(url)
+
+    def http_session(self) -> requests.Session:
+        """Return this thread's pooled HTTP session, creating it on first use.
+
+        Sessions keep connections alive between pages (no TCP/TLS handshake
+        per fetch) and advertise every content encoding urllib3 can decode.
+        requests.Session is not guaranteed thread-safe, so each worker thread
+        gets its own; ``pool_size`` (default: workers) caps connections per host.
+
+        Returns:
+            requests.Session: Session for the calling thread
+        """
+        session = getattr(self.session_local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            session.headers.update({
+                'User-Agent': 'Mozilla/5.0 (Documentation Scraper)',
+                'Accept-Encoding': ACCEPT_ENCODING,
+            })
+            self.session_local.session = session
+            with self.sessions_lock:
+                self.sessions.append(session)
+        return session
+
+    def close_http_sessions(self) -> None:
+        """Close every pooled session opened by http_session()."""
+        with self.sessions_lock:
+            for session in self.sessions:
+                session.close()
+            self.sessions = []
+        self.session_local = threading.local()
+
+    def is_valid_url(self, url: str) -> bool:
+        """Check if URL should be scraped based on patterns.
+
+        Args:
+            url (str): URL to validate
+
+        Returns:
+            bool: True if URL matches include patterns and doesn't match exclude patterns
+        """
+        decision = self.url_decisions.get(url)
+        if decision is not None:
+            return decision
+
+        decision = (
+            (url.startswith(self.url_prefix) or url + '/' == self.url_prefix)
+            and (not self.include_matcher or self.include_matcher.matches(url))
+            and not self.exclude_matcher.matches(url)
+        )
+
+        # Bounded: start over rather than grow without limit on huge crawls
+        if len(self.url_decisions) >= URL_DECISION_CACHE_SIZE:
+            self.url_decisions.clear()
+        self.url_decisions[url] = decision
+        return decision
+
     def save_checkpoint(self) -> None:
-        """Save progress checkpoint"""
-        if not self.checkpoint_enabled or self.dry_run:
-            return
+        """Save progress checkpoint
 
-        checkpoint_data = {
-            "config": self.config,
-            "visited_urls": list(self.visited_urls),
-            "pending_urls": list(self.pending_urls),
-            "pages_scraped": self.pages_scraped,
-            "last_updated": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
-            "checkpoint_interval": self.checkpoint_interval
-        }
+        Progress is already in the crawl journal; this makes stored pages
+        durable, journals their completion and compacts the journal into a
+        new snapshot when it has grown large enough. Safe to call from any
+        thread (async mode runs it in an executor); calls are serialized.
+        """
+        if not self.journal:
+            return
 
-        try:
-            with open(self.checkpoint_file, 'w') as f:
-                json.dump(checkpoint_data, f, indent=2)
-            logger.info("  💾 Checkpoint saved (%d pages)", self.pages_scraped)
-        except Exception as e:
-            logger.warning("  ⚠️  Failed to save checkpoint: %s", e)
+        with self.checkpoint_lock:
+            try:
+                # Only pages noted before the flush are known to be on disk after it
+                completed = self.journal.take_completed()
+                if self.page_writer:
+                    self.page_writer.join()
+                self.page_store.flush()
+                if self.html_archive:
+                    # --reextract must find every page the journal calls done
+                    self.html_archive.flush()
+                if self.http_cache:
+                    self.http_cache.flush()
+                self._save_failed_urls()
+                self.journal.commit_completed(completed)
+
+                if not self.journal.should_compact(len(self.visited_urls) + len(self.frontier)):
+                    logger.debug("  💾 Checkpoint: journal current (%d pages)", self.pages_scraped)
+                    return
+
+                # Fold the page store's index log and the HTTP cache log back into full files
+                self.page_store.compact()
+                if self.http_cache:
+                    self.http_cache.save()
+
+                # Rotate first: events racing the snapshot land in the new
+                # journal and are replayed (idempotently) on resume
+                generation = self.journal.rotate()
+                checkpoint_data = {
+                    "config": self.config,
+                    "last_updated": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                    "checkpoint_interval": self.checkpoint_interval
+                }
+                if isinstance(self.visited_urls, FingerprintSet):
+                    checkpoint_data["visited_fingerprints"] = self.visited_urls.dumps()
+                else:
+                    checkpoint_data["visited_urls"] = list(self.visited_urls.copy())
+                self.journal.write_snapshot(checkpoint_data, self.frontier.iter_pending(), generation)
+                logger.info("  💾 Checkpoint saved (%d pages)", self.pages_scraped)
+            except Exception as e:
+                logger.warning("  ⚠️  Failed to save checkpoint: %s", e)
 
     def load_checkpoint(self) -> None:
-        """Load progress from checkpoint"""
-        if not os.path.exists(self.checkpoint_file):
+        """Load progress from checkpoint snapshot plus crawl journal"""
+        if not self.journal or not self.journal.exists():
             logger.info("ℹ️  No checkpoint found, starting fresh")
             return
 
         try:
-            with open(self.checkpoint_file, 'r') as f:
-                checkpoint_data = json.load(f)
+            empty_visited = FingerprintSet() if isinstance(self.visited_urls, FingerprintSet) else set()
+            start_urls = self.config.get('start_urls', [self.base_url])
+            checkpoint_data = self.journal.load(start_urls, empty_visited, key=self.canonicalize_url)
 
-            self.visited_urls = set(checkpoint_data["visited_urls"])
-            self.pending_urls = deque(checkpoint_data["pending_urls"])
+            self.visited_urls = checkpoint_data["visited_urls"]
+            self.frontier.close()
+            self.frontier = self._new_frontier(checkpoint_data["pending_urls"], seen=self.visited_urls)
             self.pages_scraped = checkpoint_data["pages_scraped"]
+            self.resumed = True
+            self._load_failed_urls()
 
             logger.info("✅ Resumed from checkpoint")
             logger.info("   Pages already scraped: %d", self.pages_scraped)
+            logger.info("   Pages in store: %d", len(self.page_store))
             logger.info("   URLs visited: %d", len(self.visited_urls))
-            logger.info("   URLs pending: %d", len(self.pending_urls))
+            logger.info("   URLs pending: %d", len(self.frontier))
+            logger.info("   Journals replayed: %d", checkpoint_data['replayed_journals'])
             logger.info("   Last updated: %s", checkpoint_data['last_updated'])
             logger.info("")
 
@@ -189,26 +971,39 @@ class DocToSkillConverter:
             logger.info("   Starting fresh")
 
     def clear_checkpoint(self) -> None:
-        """Remove checkpoint file"""
-        if os.path.exists(self.checkpoint_file):
+        """Remove checkpoint snapshot and crawl journal"""
+        journal = self.journal or CrawlJournal(self.data_dir, self.checkpoint_file)
+        if journal.exists():
             try:
-                os.remove(self.checkpoint_file)
+                journal.clear()
                 logger.info("✅ Checkpoint cleared")
             except Exception as e:
                 logger.warning("⚠️  Failed to clear checkpoint: %s", e)
 
+    def parse_html(self, content: bytes, url: str, base: Optional[str] = None) -> Dict[str, Any]:
+        """Parse raw HTML and extract the page dict.
+
+        Args:
+            content: Raw response body
+            url: URL the content was requested as
+            base: Final response URL after redirects; relative links
+                resolve against it (default: url)
+
+        Returns:
+            dict: Page data as returned by extract_content
+        """
+        if self.parser_backend == 'lxml-direct':
+            tree = _lxml_document(content)
+            page = self.extract_content_lxml(tree, base or url)
+        else:
+            soup = BeautifulSoup(content, self.soup_features)
+            page = self.extract_content(soup, base or url)
+        page['url'] = url
+        return page
+
     def extract_content(self, soup: Any, url: str) -> Dict[str, Any]:
         """Extract content with improved code and pattern detection"""
-        page = {
-            'url': url,
-            'title': '',
-            'content': '',
-            'headings': [],
-            'code_samples': [],
-            'patterns': [],  # NEW: Extract common patterns
-            'links': []
-        }
-        
+        page = self._empty_page(url)
         selectors = self.config.get('selectors', {})
         
         # Extract title
@@ -224,50 +1019,202 @@ class DocToSkillConverter:
             logger.warning("⚠ No content: %s", url)
             return page
         
+        # One traversal collects headings, code, paragraphs, links and pattern anchors
+        code_selector = selectors.get('code_blocks', 'pre code')
+        code_elems = {id(elem) for elem in main.select(code_selector)}
+        walk = _MainContentWalk(main, _soup_events(main), code_elems)
+        return self._fill_page(page, main, walk, lxml_tree=False)
+
+    def extract_content_lxml(self, tree: Any, url: str) -> Dict[str, Any]:
+        """Extract content from an lxml.html tree (``lxml-direct`` backend).
+
+        Mirrors extract_content selector for selector, producing the same
+        page dict without building a BeautifulSoup tree.
+        """
+        page = self._empty_page(url)
+        selectors = self.config.get('selectors', {})
+
+        # Extract title
+        title_matches = tree.cssselect(selectors.get('title', 'title'))
+        if title_matches:
+            page['title'] = self.clean_text(_events_text(_lxml_events(title_matches[0])))
+
+        # Find main content
+        main_matches = tree.cssselect(selectors.get('main_content', 'div[role="main"]'))
+        if not main_matches:
+            logger.warning("⚠ No content: %s", url)
+            return page
+        main = main_matches[0]
+
+        # BeautifulSoup's select() never matches the element itself, cssselect() can.
+        # Keep the matches referenced: lxml proxies (and their ids) only live
+        # as long as something holds them.
+        code_selector = selectors.get('code_blocks', 'pre code')
+        code_matches = [elem for elem in main.cssselect(code_selector) if elem is not main]
+        walk = _MainContentWalk(main, _lxml_events(main), {id(elem) for elem in code_matches})
+        return self._fill_page(page, main, walk, lxml_tree=True)
+
+    def _empty_page(self, url: str) -> Dict[str, Any]:
+        return {
+            'url': url,
+            'title': '',
+            'content': '',
+            'headings': [],
+            'code_samples': [],
+            'patterns': [],  # NEW: Extract common patterns
+            'links': []
+        }
+
+    def _fill_page(self, page: Dict[str, Any], main: Any, walk: '_MainContentWalk',
+                   lxml_tree: bool) -> Dict[str, Any]:
+        """Fill a page dict from a completed main-content walk.
+
+        Args:
+            page: Page dict with url/title already set
+            main: Main content element (BeautifulSoup tag or lxml element)
+            walk: Traversal of ``main``
+            lxml_tree: True if ``main`` is an lxml element
+        """
         # Extract headings with better structure
-        for h in main.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6']):
-            text = self.clean_text(h.get_text())
+        for start, end, h, name in walk.headings:
+            text = self.clean_text(walk.text(start, end))
             if text:
                 page['headings'].append({
-                    'level': h.name,
+                    'level': name,
                     'text': text,
                     'id': h.get('id', '')
                 })
-        
+
         # Extract code with language detection
-        code_selector = selectors.get('code_blocks', 'pre code')
-        for code_elem in main.select(code_selector):
-            code = code_elem.get_text()
+        for start, end, code_elem, parent in walk.code_blocks:
+            code = self._walked_text(walk, start, end, code_elem, lxml_tree)
             if len(code.strip()) > 10:
                 # Try to detect language
-                lang = self.detect_language(code_elem, code)
+                if lxml_tree:
+                    classes = (code_elem.get('class') or '').split()
+                    is_pre = parent is not None and parent.tag == 'pre'
+                    parent_classes = (parent.get('class') or '').split() if is_pre else None
+                else:
+                    classes = code_elem.get('class', [])
+                    is_pre = parent is not None and parent.name == 'pre'
+                    parent_classes = parent.get('class', []) if is_pre else None
+                lang = self._detect_language(classes, parent_classes, code)
                 page['code_samples'].append({
                     'code': code.strip(),
                     'language': lang
                 })
         
         # Extract patterns (NEW: common code patterns)
-        page['patterns'] = self.extract_patterns(main, page['code_samples'])
+        page['patterns'] = self._patterns_from_walk(main, walk, lxml_tree)
         
         # Extract paragraphs
         paragraphs = []
-        for p in main.find_all('p'):
-            text = self.clean_text(p.get_text())
+        for start, end, _, name, _ in walk.blocks:
+            if name != 'p':
+                continue
+            text = self.clean_text(walk.text(start, end))
             if text and len(text) > 20:  # Skip very short paragraphs
                 paragraphs.append(text)
         
         page['content'] = '\n\n'.join(paragraphs)
         
-        # Extract links
-        for link in main.find_all('a', href=True):
-            href = urljoin(url, link['href'])
-            # Strip anchor fragments to avoid treating #anchors as separate pages
-            href = href.split('#')[0]
-            if self.is_valid_url(href) and href not in page['links']:
-                page['links'].append(href)
+        # Extract links (dict as insertion-ordered set: O(1) dedupe)
+        url = page['url']
+        links: Dict[str, None] = {}
+        for link in walk.link_tags:
+            href = link.get('href')
+            if href is None:
+                continue
+            resolved = self.resolve_link(url, href)
+            if resolved is not None:
+                links[resolved] = None
+        page['links'] = list(links)
         
         return page
 
+    def resolve_link(self, base: str, href: str) -> Optional[str]:
+        """Resolve an href to a canonical crawlable URL, or None.
+
+        Results are cached per crawl. The key only keeps the part of the
+        base URL the href depends on (nothing for absolute links, the
+        origin for root-relative ones, the directory for relative paths),
+        so sidebar links repeated on thousands of pages resolve once.
+        """
+        if href.startswith(('http://', 'https://')):
+            key: Tuple[str, str] = ('', href)
+        elif href.startswith('//'):
+            key = (base.split(':', 1)[0], href)
+        elif not href or href.startswith(('?', '#')):
+            key = (base, href)
+        else:
+            parts = urlsplit(base)
+            origin = f"{parts.scheme}://{parts.netloc}"
+            if href.startswith('/'):
+                key = (origin, href)
+            else:
+                key = (origin + parts.path.rsplit('/', 1)[0] + '/', href)
+
+        try:
+            return self.link_cache[key]
+        except KeyError:
+            pass
+
+        # #anchors are never separate pages; the scope check runs on the
+        # canonical key, but the link itself is fetched as written
+        resolved: Optional[str] = urljoin(base, href).split('#')[0]
+        if not self.is_valid_url(self.canonicalize_url(resolved)):
+            resolved = None
+
+        if len(self.link_cache) >= URL_DECISION_CACHE_SIZE:
+            self.link_cache.clear()
+        self.link_cache[key] = resolved
+        return resolved
+
+    def _walked_text(self, walk: '_MainContentWalk', start: int, end: int,
+                     elem: Any, lxml_tree: bool) -> str:
+        """Text of a walked element, equal to BeautifulSoup's get_text()."""
+        name = elem.tag if lxml_tree else elem.name
+        if name in _STRING_CONTAINER_TAGS:
+            # <script>/<style>/... only expose their own kind of strings
+            return elem.text_content() if lxml_tree else elem.get_text()
+        return walk.text(start, end)
+
+    def _patterns_from_walk(self, main: Any, walk: '_MainContentWalk',
+                            lxml_tree: bool) -> List[Dict[str, str]]:
+        """Build up to 5 patterns from the pattern anchors found by a walk."""
+        patterns: List[Dict[str, str]] = []
+        after_main: Any = False  # first <pre>/<code> after main, looked up lazily
+
+        for (start, end, _, _, _), anchor in walk.pattern_anchors():
+            if anchor is not None:
+                code = walk.text(anchor[0], anchor[1])
+            else:
+                # The code that follows lies past the main content
+                if after_main is False:
+                    after_main = self._find_code_after(main, walk, lxml_tree)
+                if after_main is None:
+                    continue
+                code = after_main
+            patterns.append({
+                'description': self.clean_text(walk.text(start, end)),
+                'code': code.strip()
+            })
+            if len(patterns) >= 5:  # Limit to 5 most relevant patterns
+                break
+
+        return patterns
+
+    def _find_code_after(self, main: Any, walk: '_MainContentWalk', lxml_tree: bool) -> Optional[str]:
+        """Text of the first <pre>/<code> after the end of ``main``, if any."""
+        if lxml_tree:
+            found = main.xpath('(following::*[self::pre or self::code])[1]')
+            return _events_text(_lxml_events(found[0])) if found else None
+
+        # last_tag has no element descendants, so find_next() starts past main
+        start = walk.last_tag if walk.last_tag is not None else main
+        found = start.find_next(['pre', 'code'])
+        return found.get_text() if found else None
+
     def _extract_language_from_classes(self, classes):
         """Extract language from class list
 
@@ -310,16 +1257,27 @@ class DocToSkillConverter:
 
     def detect_language(self, elem, code):
         """Detect programming language from code block"""
+        parent = elem.parent
+        parent_classes = parent.get('class', []) if parent and parent.name == 'pre' else None
+        return self._detect_language(elem.get('class', []), parent_classes, code)
 
+    def _detect_language(self, classes, pre_parent_classes, code):
+        """Backend-independent language detection.
+
+        Args:
+            classes: Class list of the code element
+            pre_parent_classes: Class list of the parent <pre>, or None if the
+                parent is not a <pre>
+            code: Code text
+        """
         # Check element classes
-        lang = self._extract_language_from_classes(elem.get('class', []))
+        lang = self._extract_language_from_classes(classes)
         if lang:
             return lang
 
         # Check parent pre element
-        parent = elem.parent
-        if parent and parent.name == 'pre':
-            lang = self._extract_language_from_classes(parent.get('class', []))
+        if pre_parent_classes is not None:
+            lang = self._extract_language_from_classes(pre_parent_classes)
             if lang:
                 return lang
 
@@ -338,135 +1296,528 @@ class DocToSkillConverter:
         return 'unknown'
     
     def extract_patterns(self, main: Any, code_samples: List[Dict[str, Any]]) -> List[Dict[str, str]]:
-        """Extract common coding patterns (NEW FEATURE)"""
-        patterns = []
-        
-        # Look for "Example:" or "Pattern:" sections
-        for elem in main.find_all(['p', 'div']):
-            text = elem.get_text().lower()
-            if any(word in text for word in ['example:', 'pattern:', 'usage:', 'typical use']):
-                # Get the code that follows
-                next_code = elem.find_next(['pre', 'code'])
-                if next_code:
-                    patterns.append({
-                        'description': self.clean_text(elem.get_text()),
-                        'code': next_code.get_text().strip()
-                    })
-        
-        return patterns[:5]  # Limit to 5 most relevant patterns
+        """Extract common coding patterns (NEW FEATURE)
+
+        Looks for "Example:"/"Pattern:"/"Usage:" sections and the code that
+        follows them. extract_content gets the same result from its shared
+        traversal; this entry point walks ``main`` on its own.
+        """
+        walk = _MainContentWalk(main, _soup_events(main), set())
+        return self._patterns_from_walk(main, walk, lxml_tree=False)
     
     def clean_text(self, text: str) -> str:
         """Clean text content"""
         text = re.sub(r'\s+', ' ', text)
         return text.strip()
     
-    def save_page(self, page: Dict[str, Any]) -> None:
-        """Save page data"""
-        url_hash = hashlib.md5(page['url'].encode()).hexdigest()[:10]
-        safe_title = re.sub(r'[^\w\s-]', '', page['title'])[:50]
-        safe_title = re.sub(r'[-\s]+', '_', safe_title)
-        
-        filename = f"{safe_title}_{url_hash}.json"
-        filepath = os.path.join(self.data_dir, "pages", filename)
-        
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(page, f, indent=2, ensure_ascii=False)
+    def save_page(self, page: Dict[str, Any]) -> str:
+        """Save page data
+
+        Returns:
+            str: Backend-specific reference to the stored page
+        """
+        page['url'] = self.canonicalize_url(page['url'])
+        return self.page_store.put(page)
     
-    def scrape_page(self, url: str) -> None:
+    def _keep_page(self, page: Dict[str, Any]) -> None:
+        """Remember a saved page for the summary.
+
+        In streaming mode only a (title, url) tuple is kept, so memory stays
+        flat however many pages are crawled.
+        """
+        if self.streaming:
+            self.pages.append((page['title'], page['url']))
+        else:
+            self.pages.append(page)
+
+    def _save_fetched_page(self, page: Dict[str, Any], headers: Any, content: bytes) -> None:
+        """Save a freshly parsed page and record its HTTP cache metadata."""
+        self.save_page(page)
+        if self.http_cache:
+            self.http_cache.store(page['url'], headers, content)
+
+    def _write_page_batch(self, items: List[Tuple[Any, ...]]) -> None:
+        """Writer-thread side of async mode: archive raw HTML and store pages."""
+        pages = []
+        for item in items:
+            if item[0] == 'html':
+                self.html_archive.append(item[1], item[2], item[3])
+            else:
+                pages.append(item[1:])
+        if not pages:
+            return
+        self.page_store.put_many([page for page, _, _ in pages])
+        if self.http_cache:
+            for page, headers, content in pages:
+                self.http_cache.store(page['url'], headers, content)
+
+    def _close_page_writer(self) -> None:
+        """Stop the async page writer once no checkpoint is using it."""
+        with self.checkpoint_lock:
+            try:
+                self.page_writer.close()
+            finally:
+                self.page_writer = None
+
+    def _observe_response(self, url: str, response: Any, elapsed: float) -> bool:
+        """Feed a response to the concurrency controller and rate limiter.
+
+        Pauses the host when the server asks us to back off (429/503 with
+        Retry-After).
+
+        Returns:
+            bool: Always True (lets callers tell "got a response" apart
+            from connection failures)
+        """
+        if self.concurrency:
+            self.concurrency.record(elapsed, response.status_code)
+        if not self.honor_retry_after or response.status_code not in (429, 503):
+            return True
+        seconds = parse_retry_after(response.headers.get('Retry-After'))
+        if seconds:
+            host = HostRateLimiter.host_of(url)
+            self.rate_limiter.pause(host, seconds)
+            logger.warning("  ⏳ %s asked to retry after %.0fs - pausing requests to it", host, seconds)
+        return True
+
+    def _fetch_succeeded(self, url: str) -> None:
+        self.circuit_breaker.record_success(HostRateLimiter.host_of(url))
+        self.retrying.pop(url, None)
+        self.failed_urls.pop(url, None)
+
+    def _schedule_retry(self, url: str, error: Exception) -> bool:
+        """Queue a failed fetch for another attempt if the error is transient.
+
+        Returns:
+            bool: True if the URL was rescheduled, False if it has failed
+            for good (recorded in ``failed_urls``)
+        """
+        response = getattr(error, 'response', None)
+        status = response.status_code if response is not None else None
+        attempt = self.retrying.pop(url, {}).get('attempts', 0)
+        host = HostRateLimiter.host_of(url)
+        failure = {
+            'error': f"{type(error).__name__}: {error}",
+            'status': status,
+            'attempts': attempt + 1
+        }
+
+        if self.retry_policy.is_retryable(status, error):
+            self.circuit_breaker.record_failure(host)
+            if attempt < self.retry_policy.max_retries:
+                delay = max(self.retry_policy.delay(attempt), self.rate_limiter.paused_for(host))
+                if self.retry_queue.schedule(url, delay):
+                    self.retrying[url] = failure
+                    logger.warning("  ↻ Retry %d/%d for %s in %.1fs (%s)", attempt + 1,
+                                   self.retry_policy.max_retries, url, delay, status or type(error).__name__)
+                    return True
+                logger.warning("  ⚠️  Retry queue full - giving up on %s", url)
+
+        self.failed_urls[url] = failure
+        return False
+
+    def _save_failed_urls(self) -> None:
+        """Persist URLs that failed after retries for a later --retry-failed run.
+
+        URLs still waiting in the retry queue are included (marked
+        ``retrying``): the queue lives in memory only, so after a crash or
+        interrupt this file is what still knows about them.
+        """
+        if self.dry_run:
+            return
+        # Copies: workers may still be adding entries
+        failed = {url: dict(failure, retrying=True) for url, failure in dict(self.retrying).items()}
+        failed.update(self.failed_urls.copy())
+        if failed:
+            write_json(self.failed_file, failed, pretty=self.pretty_json)
+        elif os.path.exists(self.failed_file):
+            os.remove(self.failed_file)
+
+    def _load_failed_urls(self) -> None:
+        if os.path.exists(self.failed_file):
+            self.failed_urls = read_json(self.failed_file)
+            for failure in self.failed_urls.values():
+                failure.pop('retrying', None)
+
+    def seed_failed_urls(self) -> int:
+        """Re-queue the URLs a previous run gave up on (``--retry-failed``).
+
+        Pages already in the store count as visited, so only the failed
+        URLs and any new links they lead to are fetched.
+
+        Returns:
+            int: Number of failed URLs queued
+        """
+        self._load_failed_urls()
+        if not self.failed_urls:
+            return 0
+
+        stored = {url for _, url in self.page_store.catalog()} if self.page_store else set()
+        self.frontier.close()
+        self.frontier = self._new_frontier(list(self.failed_urls), seen=stored)
+        self.retrying_failed = True
+        self.resumed = True
+        return len(self.failed_urls)
+
+    def apply_crawl_delay(self) -> None:
+        """Honor robots.txt Crawl-delay for the crawl's hosts (opt-in)."""
+        if not self.config.get('respect_crawl_delay', False) or self.dry_run:
+            return
+
+        start_urls = self.config.get('start_urls', [self.base_url])
+        hosts = dict.fromkeys(urlsplit(url)._replace(path='', query='', fragment='').geturl()
+                              for url in [self.base_url] + start_urls)
+        for origin in hosts:
+            robots = RobotFileParser()
+            try:
+                response = self.http_session().get(f"{origin}/robots.txt", timeout=DEFAULT_HTTP_TIMEOUT)
+                if response.status_code != 200:
+                    continue
+                robots.parse(response.text.splitlines())
+            except Exception as e:
+                logger.warning("⚠️  Could not read %s/robots.txt: %s", origin, e)
+                continue
+
+            delay = robots.crawl_delay('*')
+            if delay:
+                host = HostRateLimiter.host_of(origin)
+                self.rate_limiter.set_min_interval(host, float(delay))
+                logger.info("🤖 robots.txt Crawl-delay for %s: %ss", host, delay)
+
+    def _sitemap_locations(self) -> List[str]:
+        """Sitemap URLs from config, or from robots.txt / /sitemap.xml when ``sitemap: true``."""
+        setting = self.config.get('sitemap', False)
+        if isinstance(setting, str):
+            return [setting]
+        if isinstance(setting, list):
+            return list(setting)
+
+        start_urls = self.config.get('start_urls', [self.base_url])
+        origins = dict.fromkeys(urlsplit(url)._replace(path='', query='', fragment='').geturl()
+                                for url in [self.base_url] + start_urls)
+        locations: List[str] = []
+        for origin in origins:
+            found = []
+            try:
+                response = self.http_session().get(f"{origin}/robots.txt", timeout=DEFAULT_HTTP_TIMEOUT)
+                if response.status_code == 200:
+                    found = [line.split(':', 1)[1].strip() for line in response.text.splitlines()
+                             if line.lower().startswith('sitemap:')]
+            except requests.RequestException as e:
+                logger.debug("No robots.txt for %s: %s", origin, e)
+            locations.extend(found or [f"{origin}/sitemap.xml"])
+        return locations
+
+    def seed_from_sitemaps(self, limit: float) -> int:
+        """Bulk-queue URLs listed in the site's sitemaps (``sitemap`` config).
+
+        Entries pass through ``is_valid_url`` like discovered links. On an
+        incremental run, a URL whose ``<lastmod>`` matches the previous
+        run's is not re-fetched: its stored page is reused and its links
+        are queued instead.
+
+        Args:
+            limit: Stop seeding once this many URLs are queued or visited
+
+        Returns:
+            int: Number of URLs queued
+        """
+        if not self.config.get('sitemap', False) or self.retrying_failed:
+            return 0
+
+        previous: Dict[str, str] = {}
+        if self.page_store is not None and os.path.exists(self.sitemap_file):
+            try:
+                previous = read_json(self.sitemap_file)
+            except (OSError, ValueError) as e:
+                logger.warning("⚠️  Ignoring unreadable %s: %s", self.sitemap_file, e)
+
+        def fetch(url: str) -> requests.Response:
+            self.rate_limiter.acquire(url)
+            return self.http_session().get(url, timeout=DEFAULT_HTTP_TIMEOUT, stream=True)
+
+        reader = SitemapReader(fetch)
+        entries = itertools.chain.from_iterable(
+            reader.iter_urls(location) for location in self._sitemap_locations()
+        )
+        queued = unchanged = listed = 0
+        for loc, lastmod in entries:
+            # Reused pages are visited pages: max_pages covers them too
+            if len(self.visited_urls) >= limit:
+                break
+            listed += 1
+            url = loc.split('#')[0]
+            key = self.canonicalize_url(url)
+            if not self.is_valid_url(key) or key in self.visited_urls:
+                continue
+            if lastmod:
+                self.sitemap_lastmod[key] = lastmod
+                if previous.get(key) == lastmod:
+                    page = self.page_store.get(key)
+                    if page is not None:
+                        # Unchanged since the last run: reuse the stored page
+                        self._mark_visited(url)
+                        self._mark_completed(url)
+                        self._keep_page(page)
+                        self.frontier.push_many(page.get('links', []))
+                        self.pages_scraped += 1
+                        unchanged += 1
+                        continue
+            if self.frontier.push(url):
+                queued += 1
+            if len(self.frontier) + len(self.visited_urls) >= limit:
+                break
+
+        logger.info("🗺️  Sitemaps: %d documents, %d URLs listed, %d queued, %d unchanged (skipped)",
+                    reader.fetched, listed, queued, unchanged)
+        return queued
+
+    def _save_sitemap_lastmod(self) -> None:
+        """Remember <lastmod> of pages stored this run for the next incremental run."""
+        if self.dry_run or not self.sitemap_lastmod:
+            return
+        failed = {self.canonicalize_url(url) for url in self.failed_urls}
+        fetched = {url: lastmod for url, lastmod in self.sitemap_lastmod.items()
+                   if url in self.visited_urls and url not in failed}
+        write_json(self.sitemap_file, fetched, pretty=self.pretty_json, atomic=True)
+
+    def scrape_page(self, url: str) -> bool:
         """Scrape a single page with thread-safe operations.
 
         Args:
             url (str): URL to scrape
 
         Returns:
-            dict or None: Page data dict on success, None on failure
+            bool: True once the page is stored or has failed for good,
+            False if it was queued for another attempt
 
         Note:
             Uses threading locks when workers > 1 for thread safety
         """
+        observed = False
         try:
             # Scraping part (no lock needed - independent)
-            headers = {'User-Agent': 'Mozilla/5.0 (Documentation Scraper)'}
-            response = requests.get(url, headers=headers, timeout=30)
-            response.raise_for_status()
+            session = self.http_session()
+            cached_page = None
+            self.rate_limiter.acquire(url)
+            started = time.monotonic()
+            if self.http_cache:
+                # The cache is keyed like the page store: by canonical URL
+                key = self.canonicalize_url(url)
+                conditional = self.http_cache.request_headers(key)
+                response = session.get(url, headers=conditional, timeout=DEFAULT_HTTP_TIMEOUT)
+                cached_page = self.http_cache.cached_page(key, response.status_code, response.content)
+                if cached_page is None and response.status_code == 304:
+                    # Stored page is gone - fetch unconditionally
+                    self.rate_limiter.acquire(url)
+                    response = session.get(url, timeout=DEFAULT_HTTP_TIMEOUT)
+            else:
+                response = session.get(url, timeout=DEFAULT_HTTP_TIMEOUT)
+            observed = self._observe_response(url, response, time.monotonic() - started)
 
-            soup = BeautifulSoup(response.content, 'html.parser')
-            page = self.extract_content(soup, url)
+            if cached_page is not None:
+                page = cached_page
+            else:
+                response.raise_for_status()
+                if self.html_archive:
+                    self.html_archive.append(url, response.content, response.url)
+                page = self.parse_html(response.content, url, response.url)
 
             # Thread-safe operations (lock required)
             if self.workers > 1:
                 with self.lock:
                     logger.info("  %s", url)
-                    self.save_page(page)
-                    self.pages.append(page)
+                    if cached_page is None:
+                        self._save_fetched_page(page, response.headers, response.content)
+                    self._keep_page(page)
 
-                    # Add new URLs
-                    for link in page['links']:
-                        if link not in self.visited_urls and link not in self.pending_urls:
-                            self.pending_urls.append(link)
+                    # Add new URLs (frontier dedupes against seen/queued)
+                    if self.frontier.push_many(page['links']):
+                        self.work_available.notify_all()
             else:
                 # Single-threaded mode (no lock needed)
                 logger.info("  %s", url)
-                self.save_page(page)
-                self.pages.append(page)
+                if cached_page is None:
+                    self._save_fetched_page(page, response.headers, response.content)
+                self._keep_page(page)
 
-                # Add new URLs
-                for link in page['links']:
-                    if link not in self.visited_urls and link not in self.pending_urls:
-                        self.pending_urls.append(link)
-
-            # Rate limiting
-            rate_limit = self.config.get('rate_limit', DEFAULT_RATE_LIMIT)
-            if rate_limit > 0:
-                time.sleep(rate_limit)
+                # Add new URLs (frontier dedupes against seen/queued)
+                self.frontier.push_many(page['links'])
+            self._fetch_succeeded(url)
+            self._mark_completed(url)
+            return True
 
         except Exception as e:
+            if self.concurrency and not observed:
+                self.concurrency.record(None, None)
+            if self._schedule_retry(url, e):
+                return False
+            self._mark_completed(url)
             if self.workers > 1:
                 with self.lock:
                     logger.error("  ✗ Error scraping %s: %s: %s", url, type(e).__name__, e)
             else:
                 logger.error("  ✗ Error scraping page: %s: %s", type(e).__name__, e)
                 logger.error("     URL: %s", url)
+            return True
 
-    async def scrape_page_async(self, url: str, semaphore: asyncio.Semaphore, client: httpx.AsyncClient) -> None:
+    async def scrape_page_async(self, url: str, client: httpx.AsyncClient) -> bool:
         """Scrape a single page asynchronously.
 
         Args:
             url: URL to scrape
-            semaphore: Asyncio semaphore for concurrency control
             client: Shared httpx AsyncClient for connection pooling
 
+        Returns:
+            bool: True once the page is stored or has failed for good,
+            False if it was queued for another attempt
+
         Note:
-            Uses asyncio.Lock for async-safe operations instead of threading.Lock
+            Concurrency is bounded by the fixed worker pool in
+            scrape_all_async; no lock needed on a single event loop
         """
-        async with semaphore:  # Limit concurrent requests
-            try:
-                # Async HTTP request
-                headers = {'User-Agent': 'Mozilla/5.0 (Documentation Scraper)'}
+        observed = False
+        try:
+            # Async HTTP request (conditional when the HTTP cache knows the URL)
+            headers = {'User-Agent': 'Mozilla/5.0 (Documentation Scraper)'}
+            cached_page = None
+            await self.rate_limiter.acquire_async(url)
+            started = time.monotonic()
+            if self.http_cache:
+                key = self.canonicalize_url(url)
+                conditional = self.http_cache.request_headers(key)
+                response = await client.get(url, headers={**headers, **conditional}, timeout=30.0)
+                # Hashes the body and reads the stored page from disk
+                cached_page = await asyncio.get_running_loop().run_in_executor(
+                    None, self.http_cache.cached_page, key, response.status_code, response.content
+                )
+                if cached_page is None and response.status_code == 304:
+                    # Stored page is gone - fetch unconditionally
+                    await self.rate_limiter.acquire_async(url)
+                    response = await client.get(url, headers=headers, timeout=30.0)
+            else:
                 response = await client.get(url, headers=headers, timeout=30.0)
+            observed = self._observe_response(url, response, time.monotonic() - started)
+
+            if cached_page is not None:
+                page = cached_page
+            else:
                 response.raise_for_status()
+                if self.html_archive:
+                    if self.page_writer:
+                        await self.page_writer.put_async(('html', url, response.content, str(response.url)))
+                    else:
+                        self.html_archive.append(url, response.content, str(response.url))
+
+                # Parse in the process pool if configured, otherwise on the loop
+                if self.parse_pool is not None:
+                    loop = asyncio.get_running_loop()
+                    page = await loop.run_in_executor(
+                        self.parse_pool, _parse_page_in_worker, response.content, url, str(response.url)
+                    )
+                else:
+                    page = self.parse_html(response.content, url, str(response.url))
+
+            # Async-safe operations (no lock needed - single event loop)
+            logger.info("  %s", url)
+            if cached_page is None:
+                if self.page_writer:
+                    page['url'] = self.canonicalize_url(page['url'])
+                    await self.page_writer.put_async(('page', page, response.headers, response.content))
+                else:
+                    self._save_fetched_page(page, response.headers, response.content)
+            self._keep_page(page)
 
-                # BeautifulSoup parsing (still synchronous, but fast)
-                soup = BeautifulSoup(response.content, 'html.parser')
-                page = self.extract_content(soup, url)
+            # Add new URLs (frontier dedupes against seen/queued)
+            self.frontier.push_many(page['links'])
+            self._fetch_succeeded(url)
+            self._mark_completed(url)
+            return True
 
-                # Async-safe operations (no lock needed - single event loop)
-                logger.info("  %s", url)
-                self.save_page(page)
-                self.pages.append(page)
+        except Exception as e:
+            if self.concurrency and not observed:
+                self.concurrency.record(None, None)
+            if self._schedule_retry(url, e):
+                return False
+            self._mark_completed(url)
+            logger.error("  ✗ Error scraping %s: %s: %s", url, type(e).__name__, e)
+            return True
+
+    async def _feed_async_queue(self, queue: asyncio.Queue, unlimited: bool, limit: float) -> None:
+        """Move URLs from the frontier into the bounded worker queue.
+
+        ``queue.put`` blocks while all workers are busy, so discovered links
+        stay in the (deduplicated) frontier instead of piling up as tasks.
+        Due retries go first. Returns once max_pages is reached (or the
+        frontier is empty) with no page in flight that could still discover
+        links and no retry waiting out its backoff.
+
+        Args:
+            queue: Bounded queue drained by the worker coroutines
+            unlimited: True if max_pages is disabled
+            limit: Maximum number of pages to visit
+        """
+        while True:
+            url = self.retry_queue.pop_ready()
+            if url is None and (unlimited or len(self.visited_urls) < limit):
+                url = self.frontier.pop()
+                if url is not None:
+                    if not self._mark_visited(url):
+                        continue
+
+                    if self.dry_run:
+                        logger.info("  [Preview] %s", url)
+                        continue
+
+            if url is None:
+                if self.in_flight == 0 and not self.retry_queue:
+                    return
+                # Wait until a worker finishes (and possibly adds links) or a retry is due
+                self.async_work_changed.clear()
+                try:
+                    await asyncio.wait_for(self.async_work_changed.wait(),
+                                           timeout=self.retry_queue.next_ready_in())
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            self.in_flight += 1
+            await queue.put(url)
+
+    async def _async_worker(self, queue: asyncio.Queue, client: httpx.AsyncClient) -> None:
+        """Long-lived worker coroutine: scrape URLs from the queue until cancelled."""
+        while True:
+            url = await queue.get()
+            done = True  # pages that raise count as finished, like final failures
+            try:
+                if self.concurrency:
+                    async with self.concurrency_slots:
+                        await self.concurrency_slots.wait_for(
+                            lambda: self.active_requests < self.concurrency.current())
+                        self.active_requests += 1
+                    try:
+                        done = await self.scrape_page_async(url, client)
+                    finally:
+                        async with self.concurrency_slots:
+                            self.active_requests -= 1
+                            self.concurrency_slots.notify_all()
+                else:
+                    done = await self.scrape_page_async(url, client)
+            finally:
+                self.in_flight -= 1
+                # Retries are counted once, when they finally succeed or fail
+                if done:
+                    self.pages_scraped += 1
 
-                # Add new URLs
-                for link in page['links']:
-                    if link not in self.visited_urls and link not in self.pending_urls:
-                        self.pending_urls.append(link)
+                    if self.pages_scraped % 10 == 0:
+                        logger.info("  [%d pages scraped]", self.pages_scraped)
 
-                # Rate limiting
-                rate_limit = self.config.get('rate_limit', DEFAULT_RATE_LIMIT)
-                if rate_limit > 0:
-                    await asyncio.sleep(rate_limit)
+                    if self.checkpoint_enabled and self.pages_scraped % self.checkpoint_interval == 0:
+                        # Flush, fsync and snapshot block: keep them off the event loop
+                        await asyncio.get_running_loop().run_in_executor(None, self.save_checkpoint)
 
-            except Exception as e:
-                logger.error("  ✗ Error scraping %s: %s: %s", url, type(e).__name__, e)
+                self.async_work_changed.set()
+                queue.task_done()
 
     def _try_llms_txt(self) -> bool:
         """
@@ -529,7 +1880,7 @@ class DocToSkillConverter:
                 if pages:
                     for page in pages:
                         self.save_page(page)
-                        self.pages.append(page)
+                        self._keep_page(page)
 
                     self.llms_txt_detected = True
                     self.llms_txt_variant = 'explicit'
@@ -593,7 +1944,7 @@ class DocToSkillConverter:
         # Save pages for skill building
         for page in pages:
             self.save_page(page)
-            self.pages.append(page)
+            self._keep_page(page)
 
         self.llms_txt_detected = True
         self.llms_txt_variants = list(downloaded.keys())
@@ -605,13 +1956,15 @@ class DocToSkillConverter:
 
         Routes to async version if async_mode is enabled in config.
         """
+        self.apply_crawl_delay()
+
         # Route to async version if enabled
         if self.async_mode:
             asyncio.run(self.scrape_all_async())
             return
 
-        # Try llms.txt first (unless dry-run)
-        if not self.dry_run:
+        # Try llms.txt first (unless dry-run or re-fetching failed pages)
+        if not self.dry_run and not self.retrying_failed:
             llms_result = self._try_llms_txt()
             if llms_result:
                 logger.info("\n✅ Used llms.txt (%s) - skipping HTML scraping", self.llms_txt_variant)
@@ -647,37 +2000,62 @@ class DocToSkillConverter:
         # Dry run: preview first 20 URLs
         preview_limit = 20 if self.dry_run else max_pages
 
-        # Single-threaded mode (original sequential logic)
-        if self.workers <= 1:
-            while self.pending_urls and (unlimited or len(self.visited_urls) < preview_limit):
-                url = self.pending_urls.popleft()
+        try:
+            self.seed_from_sitemaps(float('inf') if unlimited else preview_limit)
+            self._scrape_html(unlimited, preview_limit)
+        finally:
+            self.close_http_sessions()
 
-                if url in self.visited_urls:
-                    continue
+        if self.dry_run:
+            logger.info("\n✅ Dry run complete: would scrape ~%d pages", len(self.visited_urls))
+            if len(self.visited_urls) >= preview_limit:
+                logger.info("   (showing first %d, actual scraping may find more)", preview_limit)
+            logger.info("\n💡 To actually scrape, run without --dry-run")
+        else:
+            logger.info("\n✅ Scraped %d pages", len(self.visited_urls))
+            self.save_summary()
+
+    def _scrape_html(self, unlimited: bool, preview_limit: int) -> None:
+        """Run the sync HTML crawl (sequential or threaded).
 
-                self.visited_urls.add(url)
+        Args:
+            unlimited: True if max_pages is disabled
+            preview_limit: Maximum number of pages to visit
+        """
+        # Single-threaded mode (original sequential logic)
+        if self.workers <= 1:
+            while self.retry_queue or (self.frontier and (unlimited or len(self.visited_urls) < preview_limit)):
+                url = self.retry_queue.pop_ready()
+                if url is None:
+                    if not self.frontier or not (unlimited or len(self.visited_urls) < preview_limit):
+                        # Only backed-off retries left: wait for the next one
+                        time.sleep(self.retry_queue.next_ready_in() or 0)
+                        continue
+                    url = self.frontier.pop()
+
+                    if url is None or not self._mark_visited(url):
+                        continue
 
                 if self.dry_run:
                     # Just show what would be scraped
                     logger.info("  [Preview] %s", url)
                     try:
                         headers = {'User-Agent': 'Mozilla/5.0 (Documentation Scraper - Dry Run)'}
-                        response = requests.get(url, headers=headers, timeout=10)
-                        soup = BeautifulSoup(response.content, 'html.parser')
+                        response = self.http_session().get(url, headers=headers, timeout=10)
+                        soup = BeautifulSoup(response.content, self.soup_features)
 
                         main_selector = self.config.get('selectors', {}).get('main_content', 'div[role="main"]')
                         main = soup.select_one(main_selector)
 
                         if main:
                             for link in main.find_all('a', href=True):
-                                href = urljoin(url, link['href'])
-                                if self.is_valid_url(href) and href not in self.visited_urls:
-                                    self.pending_urls.append(href)
+                                href = self.resolve_link(url, link['href'])
+                                if href is not None:
+                                    self.frontier.push(href)
                     except Exception as e:
                         # Failed to extract links in fast mode, continue anyway
                         logger.warning("⚠️  Warning: Could not extract links from %s: %s", url, e)
-                else:
-                    self.scrape_page(url)
+                elif self.scrape_page(url):
                     self.pages_scraped += 1
 
                     if self.checkpoint_enabled and self.pages_scraped % self.checkpoint_interval == 0:
@@ -688,78 +2066,107 @@ class DocToSkillConverter:
 
         # Multi-threaded mode (parallel scraping)
         else:
-            from concurrent.futures import ThreadPoolExecutor, as_completed
-
             logger.info("🚀 Starting parallel scraping with %d workers\n", self.workers)
+            self._scrape_threaded(unlimited, preview_limit)
 
-            with ThreadPoolExecutor(max_workers=self.workers) as executor:
-                futures = []
-
-                while self.pending_urls and (unlimited or len(self.visited_urls) < preview_limit):
-                    # Get next batch of URLs (thread-safe)
-                    batch = []
-                    batch_size = min(self.workers * 2, len(self.pending_urls))
-
-                    with self.lock:
-                        for _ in range(batch_size):
-                            if not self.pending_urls:
-                                break
-                            url = self.pending_urls.popleft()
-
-                            if url not in self.visited_urls:
-                                self.visited_urls.add(url)
-                                batch.append(url)
-
-                    # Submit batch to executor
-                    for url in batch:
-                        if unlimited or len(self.visited_urls) <= preview_limit:
-                            future = executor.submit(self.scrape_page, url)
-                            futures.append(future)
-
-                    # Wait for some to complete before submitting more
-                    completed = 0
-                    for future in as_completed(futures[:batch_size]):
-                        # Check for exceptions
-                        try:
-                            future.result()  # Raises exception if scrape_page failed
-                        except Exception as e:
-                            with self.lock:
-                                logger.warning("  ⚠️  Worker exception: %s", e)
+    def _claim_next_url(self, unlimited: bool, limit: int) -> Optional[str]:
+        """Hand the next URL (due retry first, then frontier) to a worker thread.
+
+        Blocks while the frontier is empty but other workers are still
+        in flight (they may discover more links) or retries are backing off.
+
+        Args:
+            unlimited: True if max_pages is disabled
+            limit: Maximum number of pages to visit
+
+        Returns:
+            str or None: URL to scrape, or None when the crawl is finished
+        """
+        with self.work_available:
+            while True:
+                if self.stop_requested:
+                    return None
+                if self.concurrency and self.in_flight >= self.concurrency.current():
+                    # Adaptive limit reached: wait for a request to finish
+                    self.work_available.wait()
+                    continue
 
-                        completed += 1
+                url = self.retry_queue.pop_ready()
+                if url is None and (unlimited or len(self.visited_urls) < limit):
+                    url = self.frontier.pop()
+                    if url is not None and not self._mark_visited(url):
+                        continue
+                if url is not None:
+                    self.in_flight += 1
+                    return url
+
+                # Nothing left to claim and nobody can add to it: crawl is done
+                if self.in_flight == 0 and not self.retry_queue:
+                    return None
+                self.work_available.wait(self.retry_queue.next_ready_in())
+
+    def _scrape_worker(self, unlimited: bool, limit: int) -> None:
+        """Worker thread loop: pull URLs until the frontier is exhausted."""
+        while True:
+            url = self._claim_next_url(unlimited, limit)
+            if url is None:
+                return
 
-                        with self.lock:
-                            self.pages_scraped += 1
+            done = True  # pages that raise count as finished, like final failures
+            try:
+                done = self.scrape_page(url)
+            except Exception as e:
+                with self.lock:
+                    logger.warning("  ⚠️  Worker exception: %s", e)
+            finally:
+                checkpoint_due = False
+                with self.work_available:
+                    self.in_flight -= 1
+                    # Retries are counted once, when they finally succeed or fail
+                    if done:
+                        self.pages_scraped += 1
+                        checkpoint_due = (self.checkpoint_enabled
+                                          and self.pages_scraped % self.checkpoint_interval == 0)
 
-                            if self.checkpoint_enabled and self.pages_scraped % self.checkpoint_interval == 0:
-                                self.save_checkpoint()
+                        if self.pages_scraped % 10 == 0:
+                            logger.info("  [%d pages scraped]", self.pages_scraped)
 
-                            if self.pages_scraped % 10 == 0:
-                                logger.info("  [%d pages scraped]", self.pages_scraped)
+                    self.work_available.notify_all()
 
-                    # Remove completed futures
-                    futures = [f for f in futures if not f.done()]
+                # Flush and snapshot outside the lock so other workers keep claiming
+                if checkpoint_due:
+                    self.save_checkpoint()
 
-                # Wait for remaining futures
-                for future in as_completed(futures):
-                    # Check for exceptions
-                    try:
-                        future.result()
-                    except Exception as e:
-                        with self.lock:
-                            logger.warning("  ⚠️  Worker exception: %s", e)
+    def _scrape_threaded(self, unlimited: bool, limit: int) -> None:
+        """Run the threaded crawl as a continuous producer/consumer pipeline.
 
-                    with self.lock:
-                        self.pages_scraped += 1
+        Each worker pulls the next URL as soon as it finishes the previous
+        one and pushes discovered links back into the shared frontier, so
+        a slow page never idles the other workers.
 
-        if self.dry_run:
-            logger.info("\n✅ Dry run complete: would scrape ~%d pages", len(self.visited_urls))
-            if len(self.visited_urls) >= preview_limit:
-                logger.info("   (showing first %d, actual scraping may find more)", preview_limit)
-            logger.info("\n💡 To actually scrape, run without --dry-run")
-        else:
-            logger.info("\n✅ Scraped %d pages", len(self.visited_urls))
-            self.save_summary()
+        Args:
+            unlimited: True if max_pages is disabled
+            limit: Maximum number of pages to visit
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        self.in_flight = 0
+        self.stop_requested = False
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            futures = [
+                executor.submit(self._scrape_worker, unlimited, limit)
+                for _ in range(self.workers)
+            ]
+            try:
+                for future in futures:
+                    future.result()
+            except BaseException:
+                # Let in-flight pages finish, but stop handing out new URLs
+                with self.work_available:
+                    self.stop_requested = True
+                    self.work_available.notify_all()
+                raise
 
     async def scrape_all_async(self) -> None:
         """Scrape all pages asynchronously (async/await version).
@@ -770,8 +2177,8 @@ class DocToSkillConverter:
 
         Performance: ~2-3x faster than sync mode with same worker count.
         """
-        # Try llms.txt first (unless dry-run)
-        if not self.dry_run:
+        # Try llms.txt first (unless dry-run or re-fetching failed pages)
+        if not self.dry_run and not self.retrying_failed:
             llms_result = self._try_llms_txt()
             if llms_result:
                 logger.info("\n✅ Used llms.txt (%s) - skipping HTML scraping", self.llms_txt_variant)
@@ -805,59 +2212,78 @@ class DocToSkillConverter:
             unlimited = False
             preview_limit = 20 if self.dry_run else max_pages
 
-        # Create semaphore for concurrency control
-        semaphore = asyncio.Semaphore(self.workers)
+        # Sitemap seeding does blocking HTTP: keep it off the event loop
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.seed_from_sitemaps, preview_limit)
+
+        # Streaming pipeline: feeder -> bounded queue -> fixed worker pool
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.workers * 2)
+        self.in_flight = 0
+        self.async_work_changed = asyncio.Event()
+        # Adaptive concurrency gate in front of the fixed worker pool
+        self.active_requests = 0
+        self.concurrency_slots = asyncio.Condition()
+
+        # Optional process pool so HTML parsing doesn't block the event loop
+        if self.parse_workers > 0 and not self.dry_run:
+            from concurrent.futures import ProcessPoolExecutor
+
+            logger.info("Parse workers: %d processes", self.parse_workers)
+            self.parse_pool = ProcessPoolExecutor(
+                max_workers=self.parse_workers,
+                initializer=_init_parse_worker,
+                initargs=(self.config,)
+            )
+
+        # Disk writes go to a writer thread; the lag monitor shows what still blocks the loop
+        writer = lag_monitor = None
+        if not self.dry_run:
+            if self.async_writer:
+                writer = PageWriter(self._write_page_batch,
+                                    self.config.get('writer_queue_size', DEFAULT_WRITER_QUEUE_SIZE))
+                self.page_writer = writer
+            lag_monitor = EventLoopLagMonitor()
+            lag_task = asyncio.create_task(lag_monitor.run())
 
         # Create shared HTTP client with connection pooling
+        # Follow redirects like the requests session does; links on the
+        # target page resolve against response.url
         async with httpx.AsyncClient(
             timeout=30.0,
+            follow_redirects=True,
             limits=httpx.Limits(max_connections=self.workers * 2)
         ) as client:
-            tasks = []
-
-            while self.pending_urls and (unlimited or len(self.visited_urls) < preview_limit):
-                # Get next batch of URLs
-                batch = []
-                batch_size = min(self.workers * 2, len(self.pending_urls))
-
-                for _ in range(batch_size):
-                    if not self.pending_urls:
-                        break
-                    url = self.pending_urls.popleft()
-
-                    if url not in self.visited_urls:
-                        self.visited_urls.add(url)
-                        batch.append(url)
-
-                # Create async tasks for batch
-                for url in batch:
-                    if unlimited or len(self.visited_urls) <= preview_limit:
-                        if self.dry_run:
-                            logger.info("  [Preview] %s", url)
-                        else:
-                            task = asyncio.create_task(
-                                self.scrape_page_async(url, semaphore, client)
-                            )
-                            tasks.append(task)
-
-                # Wait for batch to complete before continuing
-                if tasks:
-                    await asyncio.gather(*tasks, return_exceptions=True)
-                    tasks = []
-                    self.pages_scraped = len(self.visited_urls)
-
-                    # Progress indicator
-                    if self.pages_scraped % 10 == 0 and not self.dry_run:
-                        logger.info("  [%d pages scraped]", self.pages_scraped)
-
-                    # Checkpoint saving
-                    if not self.dry_run and self.checkpoint_enabled:
-                        if self.pages_scraped % self.checkpoint_interval == 0:
-                            self.save_checkpoint()
-
-            # Wait for any remaining tasks
-            if tasks:
-                await asyncio.gather(*tasks, return_exceptions=True)
+            workers = [
+                asyncio.create_task(self._async_worker(queue, client))
+                for _ in range(self.workers)
+            ]
+            try:
+                await self._feed_async_queue(queue, unlimited, preview_limit)
+                # Drain URLs already handed to workers
+                await queue.join()
+            finally:
+                for worker in workers:
+                    worker.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+
+                if self.parse_pool is not None:
+                    self.parse_pool.shutdown(wait=True)
+                    self.parse_pool = None
+
+                if lag_monitor is not None:
+                    lag_task.cancel()
+                    await asyncio.gather(lag_task, return_exceptions=True)
+                if writer is not None:
+                    # Flush queued pages before the summary reads the store
+                    await loop.run_in_executor(None, self._close_page_writer)
+                self.close_http_sessions()
+
+        if lag_monitor is not None:
+            lag = self.loop_lag = lag_monitor.stats()
+            logger.info("⏱️  Event loop lag: mean %.1fms, p99 %.1fms, max %.1fms (%s)",
+                        lag['mean'] * 1000, lag['p99'] * 1000, lag['max'] * 1000,
+                        f"page writer: {writer.written} writes in {writer.batches} batches"
+                        if writer is not None else "pages written on the event loop")
 
         if self.dry_run:
             logger.info("\n✅ Dry run complete: would scrape ~%d pages", len(self.visited_urls))
@@ -868,37 +2294,281 @@ class DocToSkillConverter:
             logger.info("\n✅ Scraped %d pages (async mode)", len(self.visited_urls))
             self.save_summary()
 
+    def _url_section(self, url: str) -> str:
+        """Top-level section of a URL below base_url (for --estimate reports)."""
+        parts = urlsplit(url)
+        base = urlsplit(self.base_url)
+        path = parts.path
+        prefix = ''
+        if parts.netloc == base.netloc and path.startswith(base.path):
+            path = path[len(base.path):]
+        elif parts.netloc != base.netloc:
+            prefix = parts.netloc + ':'
+        segments = [segment for segment in path.split('/') if segment]
+        if segments and (len(segments) > 1 or path.endswith('/')):
+            return prefix + segments[0]
+        return prefix + '(top level)'
+
+    async def _estimate_async(self, limit: float, concurrency: int) -> Dict[str, Any]:
+        """Discovery-only crawl: stream each page through the link extractor."""
+        selector = self.config.get('selectors', {}).get('main_content', 'div[role="main"]')
+        if StreamingLinkExtractor.compile_selector(selector) is None:
+            logger.warning("⚠️  main_content selector %r is too complex for --estimate - counting all links", selector)
+            selector = None
+
+        # Keyed by canonical URL; the queue holds URLs as discovered
+        discovered: Dict[str, None] = {}
+        queue: asyncio.Queue = asyncio.Queue()
+        for url in self.config.get('start_urls', [self.base_url]):
+            key = self.canonicalize_url(url)
+            if self.is_valid_url(key) and key not in discovered:
+                discovered[key] = None
+                queue.put_nowait(url.split('#')[0])
+        limit_reached = asyncio.Event()
+        stats = {'fetched': 0, 'errors': 0}
+        headers = {'User-Agent': 'Mozilla/5.0 (Documentation Scraper - Estimate)'}
+
+        async def worker(client: httpx.AsyncClient) -> None:
+            while True:
+                url = await queue.get()
+                try:
+                    await self.rate_limiter.acquire_async(url)
+                    extractor = StreamingLinkExtractor(selector)
+                    decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+                    async with client.stream('GET', url, headers=headers) as response:
+                        response.raise_for_status()
+                        async for chunk in response.aiter_bytes():
+                            extractor.feed(decoder.decode(chunk))
+                        base = str(response.url)
+                    extractor.feed(decoder.decode(b'', final=True))
+                    extractor.close()
+                    stats['fetched'] += 1
+
+                    for href in extractor.links:
+                        link = self.resolve_link(base, href)
+                        if link is None:
+                            continue
+                        key = self.canonicalize_url(link)
+                        if key in discovered:
+                            continue
+                        if len(discovered) >= limit:
+                            limit_reached.set()
+                            break
+                        discovered[key] = None
+                        queue.put_nowait(link)
+                except Exception as e:
+                    stats['errors'] += 1
+                    logger.debug("Estimate: %s: %s: %s", url, type(e).__name__, e)
+                finally:
+                    queue.task_done()
+                    if stats['fetched'] and stats['fetched'] % 50 == 0:
+                        logger.info("  [%d fetched, %d discovered]", stats['fetched'], len(discovered))
+
+        async with httpx.AsyncClient(timeout=DEFAULT_HTTP_TIMEOUT, follow_redirects=True,
+                                     limits=httpx.Limits(max_connections=concurrency)) as client:
+            workers = [asyncio.create_task(worker(client)) for _ in range(concurrency)]
+            finished = asyncio.create_task(queue.join())
+            stopped = asyncio.create_task(limit_reached.wait())
+            try:
+                await asyncio.wait({finished, stopped}, return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                for task in workers + [finished, stopped]:
+                    task.cancel()
+                await asyncio.gather(*workers, finished, stopped, return_exceptions=True)
+
+        return {
+            'discovered': len(discovered),
+            'fetched': stats['fetched'],
+            'errors': stats['errors'],
+            'limit_reached': limit_reached.is_set(),
+            'sections': Counter(self._url_section(url) for url in discovered)
+        }
+
+    def estimate_pages(self, max_discovery: Optional[int] = DEFAULT_MAX_DISCOVERY) -> Dict[str, Any]:
+        """Estimate how many pages a full crawl would scrape (``--estimate``).
+
+        Crawls concurrently (at least DEFAULT_ESTIMATE_WORKERS requests in
+        flight, still under the rate limit) and only extracts links - no
+        content parsing, nothing written to disk. Stops once
+        ``max_discovery`` URLs are known (-1 or None: no limit).
+
+        Returns:
+            dict: discovered, fetched, errors, limit_reached, elapsed and
+            per-section counts
+        """
+        unlimited = max_discovery is None or max_discovery == -1
+        limit = float('inf') if unlimited else max_discovery
+        concurrency = max(self.workers, DEFAULT_ESTIMATE_WORKERS)
+
+        logger.info("\n" + "=" * 60)
+        logger.info("ESTIMATE: %s", self.name)
+        logger.info("=" * 60)
+        logger.info("Base URL: %s", self.base_url)
+        logger.info("Discovery limit: %s, %d concurrent requests, rate limit %ss\n",
+                    "none" if unlimited else max_discovery, concurrency, self.rate_limiter.interval)
+
+        started = time.monotonic()
+        self.apply_crawl_delay()
+        try:
+            result = asyncio.run(self._estimate_async(limit, concurrency))
+        finally:
+            self.close_http_sessions()
+        result['elapsed'] = time.monotonic() - started
+        discovered = result['discovered']
+
+        logger.info("\n📊 Discovered %d pages (%d fetched, %d errors) in %.1fs",
+                    discovered, result['fetched'], result['errors'], result['elapsed'])
+        if result['limit_reached']:
+            logger.warning("⚠️  Stopped at the discovery limit: the site has at least %d pages", discovered)
+            logger.info("   Raise the limit with --max-discovery N (or -1 for no limit)")
+        else:
+            logger.info("✅ Link graph exhausted: about %d pages in total", discovered)
+        if discovered >= DISCOVERY_THRESHOLD:
+            logger.warning("⚠️  Large site (%d+ pages): expect a long crawl - consider narrowing url_patterns",
+                           discovered)
+
+        sections = result['sections'].most_common()
+        logger.info("\n📂 Pages per section:")
+        for section, count in sections[:20]:
+            logger.info("   %-40s %6d", section, count)
+        if len(sections) > 20:
+            logger.info("   ... and %d more sections (%d pages)", len(sections) - 20,
+                        sum(count for _, count in sections[20:]))
+
+        max_pages = self.config.get('max_pages', DEFAULT_MAX_PAGES)
+        if result['limit_reached']:
+            logger.info("\n💡 Suggested max_pages: -1 (unlimited), or re-run with a higher --max-discovery")
+        else:
+            logger.info("\n💡 Suggested max_pages: %d", discovered)
+        if max_pages not in (None, -1) and discovered > max_pages:
+            logger.info("   Current max_pages (%d) is below the %d pages found - raise it to crawl everything",
+                        max_pages, discovered)
+        return result
+
+    def reextract(self) -> bool:
+        """Rebuild every page from the raw HTML archive, without network access.
+
+        Re-runs extraction with the current selectors in parallel across CPU
+        cores (``parse_workers`` processes, default: all cores), replacing
+        the stored page JSON for each archived URL.
+
+        Returns:
+            bool: True if the archive existed and pages were re-extracted
+        """
+        from concurrent.futures import ProcessPoolExecutor
+
+        archive = self.html_archive or RawHtmlArchive(self.data_dir)
+        if not archive.exists():
+            logger.error("✗ No raw HTML archive at %s", archive.archive_file)
+            logger.error("   Suggestion: scrape once with 'archive_html' enabled (or --archive-html)")
+            return False
+
+        offsets = archive.latest_offsets()
+        processes = self.parse_workers or os.cpu_count() or 1
+        logger.info("\n" + "=" * 60)
+        logger.info("RE-EXTRACTING: %s", self.name)
+        logger.info("=" * 60)
+        logger.info("Archived pages: %d", len(offsets))
+        logger.info("Processes: %d\n", processes)
+
+        def save_batch(pages: List[Dict[str, Any]]) -> None:
+            for page in pages:
+                self.save_page(page)
+                self._keep_page(page)
+                if len(self.pages) % 100 == 0:
+                    logger.info("  [%d pages re-extracted]", len(self.pages))
+
+        # Batches of 16 pages; at most a few per process are read ahead
+        # (Executor.map would read and submit the whole archive up front)
+        records = archive.iter_records(offsets.values())
+        in_flight: Deque[Any] = deque()
+        with ProcessPoolExecutor(
+            max_workers=processes,
+            initializer=_init_parse_worker,
+            initargs=(self.config,)
+        ) as pool:
+            for batch in iter(lambda: list(itertools.islice(records, 16)), []):
+                in_flight.append(pool.submit(_reextract_in_worker, batch))
+                if len(in_flight) >= 2 * processes:
+                    save_batch(in_flight.popleft().result())
+            while in_flight:
+                save_batch(in_flight.popleft().result())
+
+        logger.info("\n✅ Re-extracted %d pages from archive", len(self.pages))
+        self.save_summary()
+        return True
+
+    def _summary_pages(self) -> List[Dict[str, str]]:
+        """Title/URL entries for summary.json.
+
+        After --resume, self.pages only covers the current session, so the
+        list comes from the page store's catalog instead (no page content
+        is loaded).
+        """
+        if self.resumed and self.page_store is not None:
+            return [{'title': title, 'url': url} for title, url in self.page_store.catalog()]
+        if self.streaming:
+            return [{'title': title, 'url': url} for title, url in self.pages]
+        return [{'title': p['title'], 'url': p['url']} for p in self.pages]
+
     def save_summary(self) -> None:
         """Save scraping summary"""
+        if self.html_archive:
+            self.html_archive.close()
+
+        self.frontier.close()
+
+        if self.page_store:
+            self.page_store.compact()
+
+        pages = self._summary_pages()
         summary = {
             'name': self.name,
-            'total_pages': len(self.pages),
+            'total_pages': len(pages),
             'base_url': self.base_url,
             'llms_txt_detected': self.llms_txt_detected,
             'llms_txt_variant': self.llms_txt_variant,
-            'pages': [{'title': p['title'], 'url': p['url']} for p in self.pages]
+            'pages': pages
         }
 
-        with open(f"{self.data_dir}/summary.json", 'w', encoding='utf-8') as f:
-            json.dump(summary, f, indent=2, ensure_ascii=False)
+        if self.http_cache:
+            summary['fetch_stats'] = {
+                'unchanged': self.http_cache.unchanged,
+                'changed': self.http_cache.changed
+            }
+            logger.info("🗂️  Incremental fetch: %d unchanged (skipped), %d new or changed",
+                        self.http_cache.unchanged, self.http_cache.changed)
+            self.http_cache.save()
+
+        self._save_failed_urls()
+        self._save_sitemap_lastmod()
+        if self.failed_urls:
+            summary['failed_pages'] = len(self.failed_urls)
+            logger.warning("⚠️  %d pages failed after retries (see %s) - rerun with --retry-failed",
+                           len(self.failed_urls), self.failed_file)
+
+        write_json(f"{self.data_dir}/summary.json", summary, pretty=self.pretty_json)
     
     def load_scraped_data(self) -> List[Dict[str, Any]]:
-        """Load previously scraped data"""
-        pages = []
-        pages_dir = Path(self.data_dir) / "pages"
-        
-        if not pages_dir.exists():
+        """Load all previously scraped pages into memory.
+
+        build_skill does not use this: it streams the page store instead.
+        """
+        if self.page_store is None:
             return []
-        
-        for json_file in pages_dir.glob("*.json"):
-            try:
-                with open(json_file, 'r', encoding='utf-8') as f:
-                    pages.append(json.load(f))
-            except Exception as e:
-                logger.error("⚠️  Error loading scraped data file %s: %s: %s", json_file, type(e).__name__, e)
-                logger.error("   Suggestion: File may be corrupted, consider re-scraping with --fresh")
-        
-        return pages
+        return list(self.page_store)
+
+    def _page_outlines(self) -> List[Dict[str, str]]:
+        """Stream the page store into the fields categorization looks at.
+
+        Keeps url, title and the first CONTENT_PREVIEW_LENGTH characters of
+        content per page (store order), never the full pages.
+        """
+        if self.page_store is None:
+            return []
+        return [{'url': page['url'], 'title': page['title'],
+                 'content': page.get('content', '')[:CONTENT_PREVIEW_LENGTH]}
+                for page in self.page_store]
     
     def smart_categorize(self, pages: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
         """Improved categorization with better pattern matching"""
@@ -971,24 +2641,23 @@ class DocToSkillConverter:
         
         return categories
     
-    def generate_quick_reference(self, pages: List[Dict[str, Any]]) -> List[Dict[str, str]]:
-        """Generate quick reference from common patterns (NEW FEATURE)"""
+    def generate_quick_reference(self, pages: Iterable[Dict[str, Any]]) -> List[Dict[str, str]]:
+        """Generate quick reference from common patterns (NEW FEATURE)
+
+        Stops reading ``pages`` (which may be a stream) once 15 are found.
+        """
         quick_ref = []
         
-        # Collect all patterns
-        all_patterns = []
-        for page in pages:
-            all_patterns.extend(page.get('patterns', []))
-        
         # Get most common code patterns
         seen_codes = set()
-        for pattern in all_patterns:
-            code = pattern['code']
-            if code not in seen_codes and len(code) < 300:
-                quick_ref.append(pattern)
-                seen_codes.add(code)
-                if len(quick_ref) >= 15:
-                    break
+        for page in pages:
+            for pattern in page.get('patterns', []):
+                code = pattern['code']
+                if code not in seen_codes and len(code) < 300:
+                    quick_ref.append(pattern)
+                    seen_codes.add(code)
+                    if len(quick_ref) >= 15:
+                        return quick_ref
         
         return quick_ref
     
@@ -997,47 +2666,92 @@ class DocToSkillConverter:
         if not pages:
             return
         
-        lines = []
-        lines.append(f"# {self.name.title()} - {category.replace('_', ' ').title()}\n")
-        lines.append(f"**Pages:** {len(pages)}\n")
-        lines.append("---\n")
-        
+        lines = self._reference_header(category, len(pages))
         for page in pages:
-            lines.append(f"## {page['title']}\n")
-            lines.append(f"**URL:** {page['url']}\n")
-            
-            # Table of contents from headings
-            if page.get('headings'):
-                lines.append("**Contents:**")
-                for h in page['headings'][:10]:
-                    level = int(h['level'][1]) if len(h['level']) > 1 else 1
-                    indent = "  " * max(0, level - 2)
-                    lines.append(f"{indent}- {h['text']}")
-                lines.append("")
-            
-            # Content (NO TRUNCATION)
-            if page.get('content'):
-                lines.append(page['content'])
-                lines.append("")
-
-            # Code examples with language (NO TRUNCATION)
-            if page.get('code_samples'):
-                lines.append("**Examples:**\n")
-                for i, sample in enumerate(page['code_samples'][:4], 1):
-                    lang = sample.get('language', 'unknown')
-                    code = sample.get('code', sample if isinstance(sample, str) else '')
-                    lines.append(f"Example {i} ({lang}):")
-                    lines.append(f"```{lang}")
-                    lines.append(code)  # Full code, no truncation
-                    lines.append("```\n")
-            
-            lines.append("---\n")
+            lines.extend(self._reference_page_lines(page))
         
         filepath = os.path.join(self.skill_dir, "references", f"{category}.md")
         with open(filepath, 'w', encoding='utf-8') as f:
             f.write('\n'.join(lines))
 
         logger.info("  ✓ %s.md (%d pages)", category, len(pages))
+
+    def _reference_header(self, category: str, page_count: int) -> List[str]:
+        return [
+            f"# {self.name.title()} - {category.replace('_', ' ').title()}\n",
+            f"**Pages:** {page_count}\n",
+            "---\n",
+        ]
+
+    def _reference_page_lines(self, page: Dict[str, Any]) -> List[str]:
+        """One page's section of a reference file."""
+        lines = []
+        lines.append(f"## {page['title']}\n")
+        lines.append(f"**URL:** {page['url']}\n")
+        
+        # Table of contents from headings
+        if page.get('headings'):
+            lines.append("**Contents:**")
+            for h in page['headings'][:10]:
+                level = int(h['level'][1]) if len(h['level']) > 1 else 1
+                indent = "  " * max(0, level - 2)
+                lines.append(f"{indent}- {h['text']}")
+            lines.append("")
+        
+        # Content (NO TRUNCATION)
+        if page.get('content'):
+            lines.append(page['content'])
+            lines.append("")
+
+        # Code examples with language (NO TRUNCATION)
+        if page.get('code_samples'):
+            lines.append("**Examples:**\n")
+            for i, sample in enumerate(page['code_samples'][:4], 1):
+                lang = sample.get('language', 'unknown')
+                code = sample.get('code', sample if isinstance(sample, str) else '')
+                lines.append(f"Example {i} ({lang}):")
+                lines.append(f"```{lang}")
+                lines.append(code)  # Full code, no truncation
+                lines.append("```\n")
+        
+        lines.append("---\n")
+        return lines
+
+    def write_reference_files(self, categories: Dict[str, List[Dict[str, str]]]) -> Dict[str, List[Dict[str, Any]]]:
+        """Write every reference file in one pass over the page store.
+
+        Pages are appended to their category's file as they stream past,
+        so only one full page is in memory at a time.
+
+        Args:
+            categories: Category -> page outlines, from smart_categorize
+
+        Returns:
+            dict: Category -> its first three full pages (SKILL.md examples)
+        """
+        category_of = {page['url']: cat for cat, pages in categories.items() for page in pages}
+        first_pages: Dict[str, List[Dict[str, Any]]] = {cat: [] for cat in categories}
+        files = {}
+        try:
+            for cat, pages in categories.items():
+                filepath = os.path.join(self.skill_dir, "references", f"{cat}.md")
+                files[cat] = open(filepath, 'w', encoding='utf-8')
+                files[cat].write('\n'.join(self._reference_header(cat, len(pages))))
+
+            for page in self.page_store:
+                cat = category_of.get(page['url'])
+                if cat is None:
+                    continue
+                files[cat].write('\n' + '\n'.join(self._reference_page_lines(page)))
+                if len(first_pages[cat]) < 3:
+                    first_pages[cat].append(page)
+        finally:
+            for f in files.values():
+                f.close()
+
+        for cat, pages in categories.items():
+            logger.info("  ✓ %s.md (%d pages)", cat, len(pages))
+        return first_pages
     
     def create_enhanced_skill_md(self, categories: Dict[str, List[Dict[str, Any]]], quick_ref: List[Dict[str, str]]) -> None:
         """Create SKILL.md with actual examples (IMPROVED)"""
@@ -1177,8 +2891,10 @@ To refresh this skill with updated documentation:
     def build_skill(self) -> bool:
         """Build the skill from scraped data.
 
-        Loads scraped JSON files, categorizes pages, extracts patterns,
-        and generates SKILL.md and reference files.
+        Streams the page store: one pass keeps only each page's outline
+        (url, title, content preview) for categorization, another writes
+        the reference files page by page; the quick reference reads
+        pages only until it has enough patterns.
 
         Returns:
             bool: True if build succeeded, False otherwise
@@ -1189,36 +2905,35 @@ To refresh this skill with updated documentation:
 
         # Load data
         logger.info("Loading scraped data...")
-        pages = self.load_scraped_data()
+        outlines = self._page_outlines()
 
-        if not pages:
+        if not outlines:
             logger.error("✗ No scraped data found!")
             return False
 
-        logger.info("  ✓ Loaded %d pages\n", len(pages))
+        logger.info("  ✓ Loaded %d pages\n", len(outlines))
 
         # Categorize
         logger.info("Categorizing pages...")
-        categories = self.smart_categorize(pages)
+        categories = self.smart_categorize(outlines)
         logger.info("  ✓ Created %d categories\n", len(categories))
 
         # Generate quick reference
         logger.info("Generating quick reference...")
-        quick_ref = self.generate_quick_reference(pages)
+        quick_ref = self.generate_quick_reference(self.page_store)
         logger.info("  ✓ Extracted %d patterns\n", len(quick_ref))
 
         # Create reference files
         logger.info("Creating reference files...")
-        for cat, cat_pages in categories.items():
-            self.create_reference_file(cat, cat_pages)
+        first_pages = self.write_reference_files(categories)
 
         # Create index
         self.create_index(categories)
         logger.info("")
 
-        # Create enhanced SKILL.md
+        # Create enhanced SKILL.md (its examples come from each category's first pages)
         logger.info("Creating SKILL.md...")
-        self.create_enhanced_skill_md(categories, quick_ref)
+        self.create_enhanced_skill_md(first_pages, quick_ref)
 
         logger.info("\n✅ Skill built: %s/", self.skill_dir)
         return True
@@ -1278,6 +2993,15 @@ def validate_config(config: Dict[str, Any]) -> Tuple[List[str], List[str]]:
                 if key in config['url_patterns']:
                     if not isinstance(config['url_patterns'][key], list):
                         errors.append(f"'url_patterns.{key}' must be a list")
+                        continue
+                    for pattern in config['url_patterns'][key]:
+                        if not isinstance(pattern, str):
+                            errors.append(f"'url_patterns.{key}' entries must be strings (got {pattern!r})")
+                            continue
+                        try:
+                            UrlPatternMatcher.pattern_regex(pattern)
+                        except re.error as e:
+                            errors.append(f"Invalid regex in 'url_patterns.{key}': '{pattern}' ({e})")
 
     # Validate categories
     if 'categories' in config:
@@ -1319,6 +3043,135 @@ def validate_config(config: Dict[str, Any]) -> Tuple[List[str], List[str]]:
             except (ValueError, TypeError):
                 errors.append(f"'max_pages' must be an integer, -1, or null (got {config['max_pages']})")
 
+    # Validate parse_workers
+    if 'parse_workers' in config:
+        parse_workers = config['parse_workers']
+        if not isinstance(parse_workers, int) or parse_workers < 0:
+            errors.append(f"'parse_workers' must be a non-negative integer (got {parse_workers})")
+        elif parse_workers > 0 and not config.get('async_mode', DEFAULT_ASYNC_MODE):
+            warnings.append("'parse_workers' only applies in async mode - it will be ignored")
+
+    # Validate parser
+    if 'parser' in config:
+        if config['parser'] not in PARSER_BACKENDS:
+            errors.append(f"'parser' must be one of {', '.join(PARSER_BACKENDS)} (got {config['parser']})")
+
+    # Validate pool_size
+    if 'pool_size' in config:
+        if not isinstance(config['pool_size'], int) or config['pool_size'] < 1:
+            errors.append(f"'pool_size' must be a positive integer (got {config['pool_size']})")
+
+    # Validate archive_html
+    if 'archive_html' in config:
+        if config['archive_html'] not in (True, False, 'auto', 'gzip', 'zstd'):
+            errors.append(f"'archive_html' must be true/false or 'auto', 'gzip', 'zstd' (got {config['archive_html']})")
+
+    # Validate adaptive_concurrency
+    if 'adaptive_concurrency' in config:
+        adaptive = config['adaptive_concurrency']
+        if isinstance(adaptive, dict):
+            min_workers = adaptive.get('min_workers', 1)
+            if not isinstance(min_workers, int) or min_workers < 1:
+                errors.append(f"'adaptive_concurrency.min_workers' must be a positive integer (got {min_workers})")
+            elif min_workers > config.get('workers', 1):
+                errors.append(f"'adaptive_concurrency.min_workers' ({min_workers}) exceeds 'workers' ({config.get('workers', 1)})")
+            if not isinstance(adaptive.get('window', 20), int) or adaptive.get('window', 20) < 1:
+                errors.append("'adaptive_concurrency.window' must be a positive integer")
+            for key in ('latency_target', 'error_threshold'):
+                if key in adaptive and (not isinstance(adaptive[key], (int, float)) or adaptive[key] <= 0):
+                    errors.append(f"'adaptive_concurrency.{key}' must be a positive number")
+        elif not isinstance(adaptive, bool):
+            errors.append(f"'adaptive_concurrency' must be true/false or a dict of options (got {adaptive})")
+
+    # Validate rate limiter options
+    if 'rate_limit_burst' in config:
+        if not isinstance(config['rate_limit_burst'], int) or config['rate_limit_burst'] < 1:
+            errors.append(f"'rate_limit_burst' must be a positive integer (got {config['rate_limit_burst']})")
+    for key in ('respect_crawl_delay', 'honor_retry_after'):
+        if key in config and not isinstance(config[key], bool):
+            errors.append(f"'{key}' must be true or false (got {config[key]})")
+
+    # Validate retry options
+    if 'max_retries' in config:
+        if not isinstance(config['max_retries'], int) or config['max_retries'] < 0:
+            errors.append(f"'max_retries' must be 0 or a positive integer (got {config['max_retries']})")
+    if 'retry' in config:
+        retry = config['retry']
+        if not isinstance(retry, dict):
+            errors.append(f"'retry' must be a dict of options (got {retry})")
+        else:
+            for key in ('base_delay', 'max_delay', 'breaker_cooldown'):
+                if key in retry and (not isinstance(retry[key], (int, float)) or retry[key] <= 0):
+                    errors.append(f"'retry.{key}' must be a positive number (got {retry[key]})")
+            for key in ('queue_size', 'breaker_threshold'):
+                if key in retry and (not isinstance(retry[key], int) or retry[key] < 1):
+                    errors.append(f"'retry.{key}' must be a positive integer (got {retry[key]})")
+
+    # Validate sitemap
+    if 'sitemap' in config:
+        sitemap = config['sitemap']
+        if isinstance(sitemap, list):
+            if not all(isinstance(url, str) and url.startswith('http') for url in sitemap):
+                errors.append("'sitemap' list entries must be http(s) URLs")
+        elif isinstance(sitemap, str):
+            if not sitemap.startswith('http'):
+                errors.append(f"'sitemap' URL must start with http:// or https:// (got {sitemap})")
+        elif not isinstance(sitemap, bool):
+            errors.append(f"'sitemap' must be true/false, a sitemap URL or a list of URLs (got {sitemap})")
+
+    # Validate pretty_json
+    if 'pretty_json' in config and not isinstance(config['pretty_json'], bool):
+        errors.append(f"'pretty_json' must be true or false (got {config['pretty_json']})")
+
+    # Validate async page writer
+    if 'async_writer' in config and not isinstance(config['async_writer'], bool):
+        errors.append(f"'async_writer' must be true or false (got {config['async_writer']})")
+    if 'writer_queue_size' in config:
+        if not isinstance(config['writer_queue_size'], int) or config['writer_queue_size'] < 1:
+            errors.append(f"'writer_queue_size' must be a positive integer (got {config['writer_queue_size']})")
+
+    # Validate streaming
+    if 'streaming' in config:
+        if not isinstance(config['streaming'], bool):
+            errors.append(f"'streaming' must be true or false (got {config['streaming']})")
+
+    # Validate compact_visited
+    if 'compact_visited' in config:
+        if not isinstance(config['compact_visited'], bool):
+            errors.append(f"'compact_visited' must be true or false (got {config['compact_visited']})")
+
+    # Validate frontier_memory_limit
+    if 'frontier_memory_limit' in config:
+        if not isinstance(config['frontier_memory_limit'], int) or config['frontier_memory_limit'] < 0:
+            errors.append(f"'frontier_memory_limit' must be a non-negative integer (got {config['frontier_memory_limit']})")
+
+    # Validate canonicalize
+    if 'canonicalize' in config:
+        rules = config['canonicalize']
+        if isinstance(rules, dict):
+            unknown = set(rules) - set(UrlCanonicalizer.DEFAULT_RULES)
+            if unknown:
+                errors.append(f"Unknown 'canonicalize' rules: {', '.join(sorted(unknown))}")
+            if rules.get('trailing_slash', 'strip') not in UrlCanonicalizer.TRAILING_SLASH_MODES:
+                errors.append(f"'canonicalize.trailing_slash' must be one of {', '.join(UrlCanonicalizer.TRAILING_SLASH_MODES)}")
+            if rules.get('scheme') not in (None,) + UrlCanonicalizer.SCHEME_MODES:
+                errors.append(f"'canonicalize.scheme' must be one of {', '.join(UrlCanonicalizer.SCHEME_MODES)}")
+            for key in ('drop_query_keys', 'index_documents'):
+                if key in rules and not isinstance(rules[key], list):
+                    errors.append(f"'canonicalize.{key}' must be a list")
+        elif not isinstance(rules, bool):
+            errors.append(f"'canonicalize' must be true/false or a dict of rules (got {rules})")
+
+    # Validate page_store
+    if 'page_store' in config:
+        if config['page_store'] not in PAGE_STORE_BACKENDS:
+            errors.append(f"'page_store' must be one of {', '.join(PAGE_STORE_BACKENDS)} (got {config['page_store']})")
+
+    # Validate crawl_order
+    if 'crawl_order' in config:
+        if config['crawl_order'] not in ('fifo', 'shallow_first'):
+            errors.append(f"'crawl_order' must be 'fifo' or 'shallow_first' (got {config['crawl_order']})")
+
     # Validate start_urls if present
     if 'start_urls' in config:
         if not isinstance(config['start_urls'], list):
@@ -1455,8 +3308,7 @@ def check_existing_data(name: str) -> Tuple[bool, int]:
     """
     data_dir = f"output/{name}_data"
     if os.path.exists(data_dir) and os.path.exists(f"{data_dir}/summary.json"):
-        with open(f"{data_dir}/summary.json", 'r') as f:
-            summary = json.load(f)
+        summary = read_json(f"{data_dir}/summary.json")
         return True, summary.get('total_pages', 0)
     return False, 0
 
@@ -1511,6 +3363,38 @@ def setup_argument_parser() -> argparse.ArgumentParser:
                        help='Number of parallel workers for faster scraping (default: 1, max: 10)')
     parser.add_argument('--async', dest='async_mode', action='store_true',
                        help='Enable async mode for better parallel performance (2-3x faster than threads)')
+    parser.add_argument('--parse-workers', type=int, metavar='N',
+                       help='Async mode: parse HTML in N worker processes instead of on the event loop (default: 0)')
+    parser.add_argument('--parser', choices=PARSER_BACKENDS,
+                       help=f'HTML parser backend (default: {DEFAULT_PARSER_BACKEND}); falls back if the library is missing')
+    parser.add_argument('--http-cache', action='store_true',
+                       help='Incremental re-scrape: send conditional requests and reuse unchanged pages')
+    parser.add_argument('--archive-html', action='store_true',
+                       help='Store compressed raw HTML so pages can be re-extracted offline')
+    parser.add_argument('--page-store', choices=PAGE_STORE_BACKENDS,
+                       help=f'Page storage backend (default: {DEFAULT_PAGE_STORE}); existing pages/ is migrated into jsonl/sqlite')
+    parser.add_argument('--streaming', action='store_true',
+                       help='Bounded memory: drop page content after saving (keep only titles/URLs)')
+    parser.add_argument('--compact-visited', action='store_true',
+                       help='Track visited URLs as 64-bit fingerprints (much less memory, ~0 collision risk)')
+    parser.add_argument('--adaptive', action='store_true',
+                       help='Adapt in-flight requests (AIMD) between 1 and --workers from latency/429s')
+    parser.add_argument('--respect-crawl-delay', action='store_true',
+                       help="Honor robots.txt Crawl-delay (slows down below --rate-limit if larger)")
+    parser.add_argument('--max-retries', type=int, metavar='N',
+                       help=f'Retries per page for timeouts, connection errors and 429/5xx (default: {DEFAULT_MAX_RETRIES})')
+    parser.add_argument('--retry-failed', action='store_true',
+                       help='Re-fetch only the pages that failed in the previous run (failed_urls.json), then rebuild')
+    parser.add_argument('--estimate', action='store_true',
+                       help='Estimate total pages with a fast discovery-only crawl (per-section counts), then exit')
+    parser.add_argument('--max-discovery', type=int, default=DEFAULT_MAX_DISCOVERY, metavar='N',
+                       help=f'--estimate: stop after discovering N URLs (default: {DEFAULT_MAX_DISCOVERY}, -1 for no limit)')
+    parser.add_argument('--sitemap', nargs='?', const=True, metavar='URL',
+                       help='Seed the crawl from sitemap.xml (robots.txt Sitemap: lines, or the given URL)')
+    parser.add_argument('--pretty-json', action='store_true',
+                       help='Write indented page/summary JSON (default: compact, via orjson/msgspec if installed)')
+    parser.add_argument('--reextract', action='store_true',
+                       help='Re-run extraction over the raw HTML archive (no network), then build')
     parser.add_argument('--no-rate-limit', action='store_true',
                        help='Disable rate limiting completely (same as --rate-limit 0)')
     parser.add_argument('--verbose', '-v', action='store_true',
@@ -1596,6 +3480,62 @@ def get_configuration(args: argparse.Namespace) -> Dict[str, Any]:
         else:
             logger.warning("⚠️  Async mode enabled but workers=1. Consider using --workers 4 for better performance")
 
+    # Apply CLI override for raw HTML archiving
+    if args.archive_html:
+        config['archive_html'] = True
+
+    # Apply CLI override for page storage backend
+    if args.page_store:
+        config['page_store'] = args.page_store
+
+    # Apply CLI override for streaming (bounded-memory) mode
+    if args.streaming:
+        config['streaming'] = True
+
+    # Apply CLI override for compact visited-URL tracking
+    if args.compact_visited:
+        config['compact_visited'] = True
+
+    # Apply CLI override for adaptive concurrency
+    if args.adaptive:
+        config['adaptive_concurrency'] = config.get('adaptive_concurrency') or True
+
+    # Apply CLI override for robots.txt Crawl-delay
+    if args.respect_crawl_delay:
+        config['respect_crawl_delay'] = True
+
+    # Apply CLI override for retry count
+    if args.max_retries is not None:
+        if args.max_retries < 0:
+            logger.error("❌ Error: --max-retries must be 0 or more (got %d)", args.max_retries)
+            sys.exit(1)
+        config['max_retries'] = args.max_retries
+
+    # Apply CLI override for sitemap seeding
+    if args.sitemap:
+        config['sitemap'] = args.sitemap
+
+    # Apply CLI override for indented JSON output
+    if args.pretty_json:
+        config['pretty_json'] = True
+
+    # Apply CLI override for conditional-request cache
+    if args.http_cache:
+        config['http_cache'] = True
+
+    # Apply CLI override for HTML parser backend
+    if args.parser:
+        config['parser'] = args.parser
+
+    # Apply CLI override for parse worker processes
+    if args.parse_workers is not None:
+        if args.parse_workers < 0:
+            logger.error("❌ Error: --parse-workers must be 0 or more (got %d)", args.parse_workers)
+            sys.exit(1)
+        config['parse_workers'] = args.parse_workers
+        if args.parse_workers > 0 and not config.get('async_mode'):
+            logger.warning("⚠️  --parse-workers only applies with --async; ignoring")
+
     return config
 
 
@@ -1620,6 +3560,15 @@ def execute_scraping_and_building(config: Dict[str, Any], args: argparse.Namespa
         >>> if converter:
         ...     print("Scraping complete!")
     """
+    # Page-count estimate - discovery only, nothing saved
+    if args.estimate:
+        if args.max_discovery == 0 or args.max_discovery < -1:
+            logger.error("❌ Error: --max-discovery must be positive or -1 (got %d)", args.max_discovery)
+            sys.exit(1)
+        converter = DocToSkillConverter(config, dry_run=True)
+        converter.estimate_pages(args.max_discovery)
+        return None
+
     # Dry run mode - preview only
     if args.dry_run:
         logger.info("\n" + "=" * 60)
@@ -1638,6 +3587,26 @@ def execute_scraping_and_building(config: Dict[str, Any], args: argparse.Namespa
         logger.info("   Categories: %d", len(config.get('categories', {})))
         return None
 
+    # Offline re-extraction from the raw HTML archive
+    if args.reextract:
+        converter = DocToSkillConverter(config)
+        if not converter.reextract() or not converter.build_skill():
+            sys.exit(1)
+        return converter
+
+    # Re-fetch only the pages the previous run gave up on
+    if args.retry_failed:
+        converter = DocToSkillConverter(config)
+        count = converter.seed_failed_urls()
+        if count:
+            logger.info("\n↻ Retrying %d failed pages from %s", count, converter.failed_file)
+            converter.scrape_all()
+        else:
+            logger.info("\n✓ No failed pages recorded in %s", converter.failed_file)
+        if not converter.build_skill():
+            sys.exit(1)
+        return converter
+
     # Check for existing data
     exists, page_count = check_existing_data(config['name'])
 
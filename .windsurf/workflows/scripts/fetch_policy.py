@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+"""
+Fetch Policies: Rate Limits, Retries and Concurrency
+
+How doc_scraper.py paces and retries requests:
+- HostRateLimiter: per-host token bucket, pauses and Retry-After handling
+- RetryPolicy / RetryQueue: jittered exponential backoff for transient
+  failures, with a bounded queue of URLs waiting to be retried
+- HostCircuitBreaker: pause a host after consecutive failures
+- ConcurrencyController: AIMD limit on requests in flight
+"""
+
+import time
+import heapq
+import random
+import asyncio
+import logging
+import threading
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+import requests
+
+from cli.constants import DEFAULT_MAX_RETRIES
+
+logger = logging.getLogger(__name__)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP-date)."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class HostRateLimiter:
+    """Per-host token bucket shared by every worker thread and coroutine.
+
+    Each host refills one token per ``interval`` seconds (the ``rate_limit``
+    config value) up to ``burst`` tokens. ``reserve`` takes a token and
+    returns how long the caller must wait for it; tokens may go negative,
+    so concurrent callers queue up behind each other and N workers still
+    make at most one request per interval per host. ``acquire`` /
+    ``acquire_async`` wait out the reservation (thread sleep or
+    ``asyncio.sleep``), before the request rather than after it.
+
+    A host can be slowed down (robots.txt Crawl-delay via
+    ``set_min_interval``) or paused (server Retry-After via ``pause``).
+    """
+
+    def __init__(self, interval: float, burst: int = 1) -> None:
+        self.interval = interval
+        self.burst = max(1, burst)
+        self._hosts: Dict[str, List[float]] = {}  # host -> [tokens, stamp, paused_until]
+        self._min_intervals: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def host_of(url: str) -> str:
+        return urlsplit(url).netloc.lower()
+
+    def host_interval(self, host: str) -> float:
+        return max(self.interval, self._min_intervals.get(host, 0.0))
+
+    def set_min_interval(self, host: str, seconds: float) -> None:
+        """Enforce at least ``seconds`` between requests to a host."""
+        with self._lock:
+            self._min_intervals[host] = seconds
+
+    def pause(self, host: str, seconds: float) -> None:
+        """Hold every request to a host for ``seconds`` (e.g. Retry-After)."""
+        with self._lock:
+            state = self._state(host, time.monotonic())
+            state[2] = max(state[2], time.monotonic() + seconds)
+
+    def paused_for(self, host: str) -> float:
+        """Seconds left on a host's pause (0 if it is not paused)."""
+        with self._lock:
+            state = self._hosts.get(host)
+            return max(0.0, state[2] - time.monotonic()) if state else 0.0
+
+    def _state(self, host: str, now: float) -> List[float]:
+        state = self._hosts.get(host)
+        if state is None:
+            state = self._hosts[host] = [float(self.burst), now, 0.0]
+        return state
+
+    def reserve(self, url: str) -> float:
+        """Take a token for the URL's host.
+
+        Returns:
+            float: Seconds to wait before sending the request
+        """
+        host = self.host_of(url)
+        with self._lock:
+            interval = self.host_interval(host)
+            now = time.monotonic()
+            state = self._state(host, now)
+            if interval <= 0:
+                return max(0.0, state[2] - now)
+
+            tokens = min(float(self.burst), state[0] + (now - state[1]) / interval) - 1
+            state[0], state[1] = tokens, now
+            delay = -tokens * interval if tokens < 0 else 0.0
+            return max(delay, state[2] - now)
+
+    def acquire(self, url: str) -> None:
+        delay = self.reserve(url)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self, url: str) -> None:
+        delay = self.reserve(url)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class RetryPolicy:
+    """Which fetch failures to retry, and how long to back off.
+
+    Connection errors, timeouts and 429/5xx responses are transient;
+    anything else (404, parse errors, ...) fails immediately. The delay
+    for attempt ``n`` is drawn from [cap/2, cap] with
+    ``cap = min(max_delay, base_delay * 2**n)`` so retries from many
+    workers don't arrive in lockstep, and is never shorter than the
+    server's Retry-After.
+    """
+
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+    def __init__(self, max_retries: int = DEFAULT_MAX_RETRIES, base_delay: float = 1.0,
+                 max_delay: float = 60.0) -> None:
+        self.max_retries = max(0, max_retries)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def is_retryable(self, status: Optional[int], error: Exception) -> bool:
+        if status is not None:
+            return status in self.RETRY_STATUSES
+        return isinstance(error, (requests.exceptions.ConnectionError,
+                                  requests.exceptions.Timeout,
+                                  requests.exceptions.ChunkedEncodingError,
+                                  httpx.TransportError))
+
+    def delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        cap = min(self.max_delay, self.base_delay * (2 ** attempt))
+        return max(random.uniform(cap / 2, cap), retry_after or 0.0)
+
+
+class RetryQueue:
+    """Bounded set of URLs waiting out their backoff, ordered by due time.
+
+    Workers poll ``pop_ready`` alongside the frontier, so a URL sleeping
+    off a backoff never ties up a worker. ``schedule`` refuses new
+    entries once ``maxsize`` URLs are waiting; the caller then records
+    the URL as failed instead.
+    """
+
+    def __init__(self, maxsize: int = 1000) -> None:
+        self.maxsize = maxsize
+        self._heap: List[Tuple[float, int, str]] = []
+        self._seq = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def schedule(self, url: str, delay: float) -> bool:
+        with self._lock:
+            if len(self._heap) >= self.maxsize:
+                return False
+            self._seq += 1
+            heapq.heappush(self._heap, (time.monotonic() + delay, self._seq, url))
+            return True
+
+    def pop_ready(self) -> Optional[str]:
+        """Next URL whose backoff has elapsed, or None."""
+        with self._lock:
+            if self._heap and self._heap[0][0] <= time.monotonic():
+                return heapq.heappop(self._heap)[2]
+            return None
+
+    def next_ready_in(self) -> Optional[float]:
+        """Seconds until the next URL is due (None if the queue is empty)."""
+        with self._lock:
+            if not self._heap:
+                return None
+            return max(0.0, self._heap[0][0] - time.monotonic())
+
+
+class HostCircuitBreaker:
+    """Pause an origin after repeated consecutive failures.
+
+    ``threshold`` transient failures in a row open the circuit: the host
+    is paused in the rate limiter for ``cooldown`` seconds, so every
+    worker stops hitting it at once. Each re-open while the host keeps
+    failing doubles the cooldown (up to ``max_cooldown``); one success
+    closes the circuit and resets it.
+    """
+
+    def __init__(self, limiter: HostRateLimiter, threshold: int = 5,
+                 cooldown: float = 30.0, max_cooldown: float = 300.0) -> None:
+        self.limiter = limiter
+        self.threshold = max(1, threshold)
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self._hosts: Dict[str, List[float]] = {}  # host -> [consecutive failures, next cooldown]
+        self._lock = threading.Lock()
+
+    def record_success(self, host: str) -> None:
+        with self._lock:
+            if self._hosts.pop(host, None):
+                logger.debug("🔌 Circuit closed for %s", host)
+
+    def record_failure(self, host: str) -> None:
+        with self._lock:
+            state = self._hosts.setdefault(host, [0, self.cooldown])
+            state[0] += 1
+            if state[0] < self.threshold:
+                return
+            cooldown = state[1]
+            state[0] = 0
+            state[1] = min(self.max_cooldown, cooldown * 2)
+        logger.warning("🔌 %s failed %d times in a row - pausing it for %.0fs",
+                       host, self.threshold, cooldown)
+        self.limiter.pause(host, cooldown)
+
+
+class ConcurrencyController:
+    """AIMD limit on in-flight requests, driven by latency and error rates.
+
+    Every ``window`` responses it looks at the batch: any 429, an error
+    rate (exceptions/5xx) above ``error_threshold``, or a p90 latency
+    above the target halves the limit (multiplicative decrease);
+    otherwise the limit grows by one (additive increase). Like TCP slow
+    start, the limit begins at ``minimum`` but doubles after each healthy
+    window until the first decrease, so a healthy server is driven at
+    ``maximum`` within a few windows. The target is ``latency_target``
+    seconds if configured, else twice the best p50 seen so far (latency
+    climbing with concurrency means the server is saturating). The
+    limit stays within [minimum, maximum].
+    """
+
+    def __init__(self, minimum: int, maximum: int, window: int = 20,
+                 latency_target: Optional[float] = None,
+                 error_threshold: float = 0.05, backoff: float = 0.5) -> None:
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.limit = float(self.minimum)
+        self.window = max(1, window)
+        self.latency_target = latency_target
+        self.error_threshold = error_threshold
+        self.backoff = backoff
+        self.best_p50: Optional[float] = None
+        self.slow_start = True
+        self._latencies: List[float] = []
+        self._requests = 0
+        self._errors = 0
+        self._throttled = 0
+        self._lock = threading.Lock()
+
+    def current(self) -> int:
+        return int(self.limit)
+
+    def record(self, latency: Optional[float], status: Optional[int]) -> None:
+        """Record one request (status None: failed without a response)."""
+        with self._lock:
+            self._requests += 1
+            if latency is not None:
+                self._latencies.append(latency)
+            if status == 429:
+                self._throttled += 1
+            elif status is None or status >= 500:
+                self._errors += 1
+            if self._requests >= self.window:
+                self._adjust()
+
+    def _adjust(self) -> None:
+        latencies = sorted(self._latencies)
+        error_rate = self._errors / self._requests
+        p50 = latencies[len(latencies) // 2] if latencies else None
+        p90 = latencies[int(0.9 * (len(latencies) - 1))] if latencies else None
+        if p50 is not None:
+            self.best_p50 = p50 if self.best_p50 is None else min(self.best_p50, p50)
+        target = self.latency_target
+        if target is None and self.best_p50 is not None:
+            target = max(2 * self.best_p50, self.best_p50 + 0.05)
+
+        if self._throttled:
+            reason = f"{self._throttled} throttled (429)"
+        elif error_rate > self.error_threshold:
+            reason = f"error rate {error_rate:.0%}"
+        elif p90 is not None and target is not None and p90 > target:
+            reason = f"p90 {p90 * 1000:.0f}ms > target {target * 1000:.0f}ms"
+        else:
+            reason = ''
+
+        previous = self.current()
+        if reason:
+            self.slow_start = False
+            self.limit = max(float(self.minimum), self.limit * self.backoff)
+        elif self.slow_start:
+            self.limit = min(float(self.maximum), self.limit * 2)
+        else:
+            self.limit = min(float(self.maximum), self.limit + 1)
+
+        if self.current() != previous:
+            logger.info("🎛️  Concurrency %d → %d (%s)", previous, self.current(),
+                        reason or (f"healthy, p90 {p90 * 1000:.0f}ms" if p90 is not None else "healthy"))
+        else:
+            logger.debug("🎛️  Concurrency stays %d (%s)", previous, reason or "healthy")
+
+        self._latencies = []
+        self._requests = 0
+        self._errors = 0
+        self._throttled = 0
@@ -0,0 +1,372 @@
+#!/usr/bin/env python3
+"""
+Crawl Frontier and Visited-URL Set
+
+The URL bookkeeping behind doc_scraper.py's crawl loop:
+- CrawlFrontier: pending URLs (FIFO or priority) with O(1) "seen or
+  queued" checks, spilling to SQLite past a memory limit
+- FingerprintSet: compact 64-bit fingerprint set for visited URLs
+  (``compact_visited``)
+"""
+
+import os
+import sys
+import heapq
+import base64
+import sqlite3
+import hashlib
+import logging
+import tempfile
+import threading
+from array import array
+from collections import deque
+from urllib.parse import urlparse
+from typing import Any, Callable, Deque, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+
+def url_depth_priority(url: str) -> int:
+    """Priority key that crawls shallow URLs (fewer path segments) first."""
+    return len([s for s in urlparse(url).path.split('/') if s])
+
+
+class FingerprintSet:
+    """Compact URL membership set: 64-bit fingerprints in an open-addressing table.
+
+    Stores blake2b-64 fingerprints of URLs in a flat ``array('Q')`` with
+    linear probing (load factor <= 0.5), costing ~16-32 bytes per URL
+    instead of the ~150+ bytes of a ``set[str]`` entry plus the string.
+
+    Tradeoff: the URLs themselves are not kept (no iteration), and two
+    distinct URLs sharing a fingerprint makes the second one look already
+    visited. The chance of any collision among n URLs is about
+    n^2 / 2^65: ~3e-6 at 10 million URLs.
+    """
+
+    def __init__(self, urls: Optional[Iterable[str]] = None, capacity: int = 1024) -> None:
+        size = 1
+        while size < capacity:
+            size <<= 1
+        self._slots = array('Q', bytes(8 * size))
+        self._mask = size - 1
+        self._len = 0
+        if urls:
+            self.update(urls)
+
+    @staticmethod
+    def fingerprint(url: str) -> int:
+        fp = int.from_bytes(hashlib.blake2b(url.encode('utf-8'), digest_size=8).digest(), 'little')
+        return fp or 1  # 0 marks an empty slot
+
+    def _insert(self, fp: int) -> bool:
+        slots, mask = self._slots, self._mask
+        i = fp & mask
+        while True:
+            current = slots[i]
+            if current == 0:
+                slots[i] = fp
+                self._len += 1
+                return True
+            if current == fp:
+                return False
+            i = (i + 1) & mask
+
+    def _grow(self) -> None:
+        old = self._slots
+        self._slots = array('Q', bytes(16 * len(old)))
+        self._mask = len(self._slots) - 1
+        self._len = 0
+        for fp in old:
+            if fp:
+                self._insert(fp)
+
+    def _add_fingerprint(self, fp: int) -> None:
+        if (self._len + 1) * 2 > len(self._slots):
+            self._grow()
+        self._insert(fp)
+
+    def add(self, url: str) -> None:
+        self._add_fingerprint(self.fingerprint(url))
+
+    def update(self, urls: Union[Iterable[str], 'FingerprintSet']) -> None:
+        if isinstance(urls, FingerprintSet):
+            for fp in urls._slots:
+                if fp:
+                    self._add_fingerprint(fp)
+            return
+        for url in urls:
+            self.add(url)
+
+    def __contains__(self, url: str) -> bool:
+        fp = self.fingerprint(url)
+        slots, mask = self._slots, self._mask
+        i = fp & mask
+        while True:
+            current = slots[i]
+            if current == fp:
+                return True
+            if current == 0:
+                return False
+            i = (i + 1) & mask
+
+    def discard(self, url: str) -> None:
+        fp = self.fingerprint(url)
+        slots, mask = self._slots, self._mask
+        i = fp & mask
+        while slots[i] != fp:
+            if slots[i] == 0:
+                return
+            i = (i + 1) & mask
+        slots[i] = 0
+        self._len -= 1
+        # Re-insert the rest of the probe run so lookups never stop early
+        i = (i + 1) & mask
+        while slots[i]:
+            moved, slots[i] = slots[i], 0
+            self._len -= 1
+            self._insert(moved)
+            i = (i + 1) & mask
+
+    def __len__(self) -> int:
+        return self._len
+
+    def dumps(self) -> str:
+        """Serialize the fingerprints (little-endian, base64) for checkpoints."""
+        packed = array('Q', (fp for fp in self._slots if fp))
+        if sys.byteorder == 'big':
+            packed.byteswap()
+        return base64.b64encode(packed.tobytes()).decode('ascii')
+
+    @classmethod
+    def loads(cls, data: str) -> 'FingerprintSet':
+        packed = array('Q')
+        packed.frombytes(base64.b64decode(data))
+        if sys.byteorder == 'big':
+            packed.byteswap()
+        restored = cls(capacity=2 * len(packed))
+        for fp in packed:
+            restored._add_fingerprint(fp)
+        return restored
+
+
+class CrawlFrontier:
+    """URL frontier with O(1) "seen or queued" membership checks.
+
+    Replaces scanning the pending deque on every discovered link. The
+    frontier remembers every URL it has ever accepted (queued or already
+    handed out), so re-discovered links are rejected by a set lookup.
+
+    Ordering is FIFO by default. Passing ``priority`` (a callable mapping a
+    URL to a sortable key) switches to a priority queue; ties keep insertion
+    order. All operations take an internal lock, so one frontier can be
+    shared by worker threads and by coroutines on an event loop.
+
+    ``on_queue`` is called (under the lock, in queue order) with the list of
+    URLs each push newly queued; the initial ``urls`` are not reported.
+    With ``compact=True`` the seen set is a FingerprintSet. ``key`` maps a
+    URL to its dedup key (e.g. a UrlCanonicalizer); the seen set holds keys
+    while the queue keeps the URLs as pushed.
+
+    FIFO frontiers can spill to disk: with ``memory_limit`` > 0, at most
+    that many URLs are kept in memory and the tail goes to a scratch
+    SQLite queue in ``spill_dir``. Once anything is spilled, new URLs are
+    appended to disk and the in-memory head is refilled from it in
+    batches, so pop order stays strictly FIFO.
+    """
+
+    SPILL_PREFIX = 'frontier_spill_'
+
+    def __init__(self, urls: Optional[List[str]] = None,
+                 seen: Optional[Union[Set[str], FingerprintSet]] = None,
+                 priority: Optional[Any] = None,
+                 on_queue: Optional[Callable[[List[str]], None]] = None,
+                 compact: bool = False,
+                 memory_limit: int = 0,
+                 spill_dir: Optional[str] = None,
+                 key: Optional[Callable[[str], str]] = None) -> None:
+        self._lock = threading.Lock()
+        self._priority = priority
+        self._key = key
+        self._queue: Deque[str] = deque()
+        self._heap: List[Tuple[Any, int, str]] = []
+        self._counter = 0
+        self._seen: Union[Set[str], FingerprintSet] = FingerprintSet() if compact else set()
+        if seen:
+            self._seen.update(seen)
+        self._on_queue: Optional[Callable[[List[str]], None]] = None
+
+        # Disk spill (FIFO only); the scratch database is created on first use
+        self._memory_limit = memory_limit if priority is None and spill_dir else 0
+        self._spill_dir = spill_dir
+        self._spill_file: Optional[str] = None
+        self._spill_conn: Optional[sqlite3.Connection] = None
+        self._spill_buffer: List[str] = []
+        self._spilled = 0
+        self._spill_head = 0  # highest spill row id moved back into memory
+        self._spill_readers = 0  # iter_pending calls still reading spill rows
+
+        for url in urls or []:
+            self.push(url)
+        self._on_queue = on_queue
+
+    def push(self, url: str) -> bool:
+        """Queue a URL unless it was seen before.
+
+        Returns:
+            bool: True if the URL was newly queued
+        """
+        with self._lock:
+            if not self._push_locked(url):
+                return False
+            self._flush_spill_locked()
+            if self._on_queue:
+                self._on_queue([url])
+            return True
+
+    def push_many(self, urls: List[str]) -> int:
+        """Queue several URLs under a single lock acquisition.
+
+        Returns:
+            int: Number of URLs that were newly queued
+        """
+        with self._lock:
+            queued = [url for url in urls if self._push_locked(url)]
+            self._flush_spill_locked()
+            if queued and self._on_queue:
+                self._on_queue(queued)
+            return len(queued)
+
+    def _push_locked(self, url: str) -> bool:
+        url_key = self._key(url) if self._key else url
+        if url_key in self._seen:
+            return False
+        self._seen.add(url_key)
+        if self._priority is None:
+            if self._memory_limit and (self._spilled or self._spill_buffer
+                                       or len(self._queue) >= self._memory_limit):
+                self._spill_buffer.append(url)
+            else:
+                self._queue.append(url)
+        else:
+            heapq.heappush(self._heap, (self._priority(url), self._counter, url))
+            self._counter += 1
+        return True
+
+    def pop(self) -> Optional[str]:
+        """Remove and return the next URL, or None when the frontier is empty."""
+        with self._lock:
+            if self._priority is None:
+                if not self._queue and self._spilled:
+                    self._refill_locked()
+                return self._queue.popleft() if self._queue else None
+            if not self._heap:
+                return None
+            return heapq.heappop(self._heap)[2]
+
+    def _open_spill_locked(self) -> sqlite3.Connection:
+        if self._spill_conn is None:
+            fd, self._spill_file = tempfile.mkstemp(
+                prefix=self.SPILL_PREFIX, suffix='.sqlite', dir=self._spill_dir)
+            os.close(fd)
+            conn = sqlite3.connect(self._spill_file, check_same_thread=False)
+            # Scratch data: no durability needed
+            conn.execute("PRAGMA journal_mode=OFF")
+            conn.execute("PRAGMA synchronous=OFF")
+            conn.execute("CREATE TABLE queue (id INTEGER PRIMARY KEY AUTOINCREMENT, url TEXT NOT NULL)")
+            self._spill_conn = conn
+            logger.info("💽 Frontier exceeded %d URLs in memory, spilling to %s",
+                        self._memory_limit, self._spill_file)
+        return self._spill_conn
+
+    def _flush_spill_locked(self) -> None:
+        if not self._spill_buffer:
+            return
+        conn = self._open_spill_locked()
+        conn.executemany("INSERT INTO queue (url) VALUES (?)", ((url,) for url in self._spill_buffer))
+        conn.commit()
+        self._spilled += len(self._spill_buffer)
+        self._spill_buffer = []
+
+    def _refill_locked(self) -> None:
+        # Half the memory budget per batch leaves room before the next spill
+        batch = max(1, self._memory_limit // 2)
+        conn = self._open_spill_locked()
+        rows = conn.execute("SELECT id, url FROM queue WHERE id > ? ORDER BY id LIMIT ?",
+                            (self._spill_head, batch)).fetchall()
+        if not rows:
+            self._spilled = 0
+            return
+        self._spill_head = rows[-1][0]
+        # Rows a checkpoint is still streaming stay until the next refill
+        if not self._spill_readers:
+            conn.execute("DELETE FROM queue WHERE id <= ?", (self._spill_head,))
+            conn.commit()
+        self._spilled -= len(rows)
+        self._queue.extend(url for _, url in rows)
+
+    def close(self) -> None:
+        """Delete the spill database (the frontier must not be used afterwards)."""
+        with self._lock:
+            if self._spill_conn is not None:
+                self._spill_conn.close()
+                self._spill_conn = None
+            if self._spill_file and os.path.exists(self._spill_file):
+                os.remove(self._spill_file)
+            self._spill_file = None
+
+    def mark_seen(self, url: str) -> None:
+        """Record a URL as seen without queueing it (e.g. already visited)."""
+        with self._lock:
+            self._seen.add(self._key(url) if self._key else url)
+
+    def __contains__(self, url: str) -> bool:
+        return (self._key(url) if self._key else url) in self._seen
+
+    def __len__(self) -> int:
+        if self._priority is None:
+            return len(self._queue) + self._spilled
+        return len(self._heap)
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def iter_pending(self) -> Iterator[str]:
+        """Stream the URLs queued at call time in pop order (used for checkpoints).
+
+        Only copies the in-memory queue and the spilled row id range under
+        the frontier lock; spilled URLs are then read from disk in batches
+        without blocking pushes and pops.
+        """
+        spill_range = None
+        with self._lock:
+            if self._priority is not None:
+                head = [url for _, _, url in sorted(self._heap)]
+            else:
+                head = list(self._queue)
+                if self._spill_conn is not None and self._spilled:
+                    last_id = self._spill_conn.execute("SELECT MAX(id) FROM queue").fetchone()[0]
+                    spill_range = (self._spill_head, last_id)
+                    self._spill_readers += 1
+
+        try:
+            yield from head
+            if spill_range is not None:
+                first_id, last_id = spill_range
+                while True:
+                    rows = self._spill_conn.execute(
+                        "SELECT id, url FROM queue WHERE id > ? AND id <= ? ORDER BY id LIMIT 10000",
+                        (first_id, last_id)
+                    ).fetchall()
+                    if not rows:
+                        break
+                    first_id = rows[-1][0]
+                    yield from (url for _, url in rows)
+        finally:
+            if spill_range is not None:
+                with self._lock:
+                    self._spill_readers -= 1
+
+    def pending(self) -> List[str]:
+        """Snapshot of queued URLs in pop order."""
+        return list(self.iter_pending())
@@ -31,6 +31,8 @@ except ImportError:
     print("Error: PyGithub not installed. Run: pip install PyGithub")
     sys.exit(1)
 
+from serialization import read_json, write_json
+
 # Import code analyzer for deep code analysis
 try:
     from code_analyzer import CodeAnalyzer
@@ -81,6 +83,7 @@ class GitHubScraper:
         self.include_changelog = config.get('include_changelog', True)
         self.include_releases = config.get('include_releases', True)
         self.include_code = config.get('include_code', False)
+        self.pretty_json = config.get('pretty_json', False)
         self.code_analysis_depth = config.get('code_analysis_depth', 'surface')  # 'surface', 'deep', 'full'
         self.file_patterns = config.get('file_patterns', [])
 
@@ -482,8 +485,7 @@ class GitHubScraper:
         """Save extracted data to JSON file."""
         os.makedirs('output', exist_ok=True)
 
-        with open(self.data_file, 'w', encoding='utf-8') as f:
-            json.dump(self.extracted_data, f, indent=2, ensure_ascii=False)
+        write_json(self.data_file, self.extracted_data, pretty=self.pretty_json)
 
         logger.info(f"Data saved to: {self.data_file}")
 
@@ -511,8 +513,7 @@ class GitHubToSkillConverter:
         if not os.path.exists(self.data_file):
             raise FileNotFoundError(f"Data file not found: {self.data_file}")
 
-        with open(self.data_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return read_json(self.data_file)
 
     def build_skill(self):
         """Build complete skill structure."""
@@ -740,6 +741,7 @@ Examples:
     parser.add_argument('--no-releases', action='store_true', help='Skip releases')
     parser.add_argument('--max-issues', type=int, default=100, help='Max issues to fetch')
     parser.add_argument('--scrape-only', action='store_true', help='Only scrape, don\'t build skill')
+    parser.add_argument('--pretty-json', action='store_true', help='Write indented data JSON (default: compact)')
 
     args = parser.parse_args()
 
@@ -761,6 +763,9 @@ Examples:
     else:
         parser.error('Either --repo or --config is required')
 
+    if args.pretty_json:
+        config['pretty_json'] = True
+
     try:
         # Phase 1: Scrape GitHub repository
         scraper = GitHubScraper(config)
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Raw HTML Archive
+
+Append-only, compressed (zstd when installed, else gzip) store of the raw
+HTML behind every scraped page, so ``--reextract`` can rebuild pages
+after the selectors change without touching the network.
+"""
+
+import os
+import gzip
+import hashlib
+import logging
+import threading
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+from cli.serialization import dumps, loads
+
+logger = logging.getLogger(__name__)
+
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+
+def compress_html(codec: str, content: bytes) -> bytes:
+    if codec == 'zstd':
+        return zstandard.ZstdCompressor(level=3).compress(content)
+    return gzip.compress(content, compresslevel=6)
+
+
+def decompress_html(codec: str, blob: bytes) -> bytes:
+    if codec == 'zstd':
+        return zstandard.ZstdDecompressor().decompress(blob)
+    return gzip.decompress(blob)
+
+
+class RawHtmlArchive:
+    """Append-only archive of compressed raw HTML, keyed by URL hash.
+
+    Each record is a one-line JSON header (``key``, ``url``, ``codec``,
+    ``length`` and, after a redirect, ``base``) followed by ``length``
+    bytes of compressed HTML. ``base`` is the final response URL that
+    relative links resolve against; records without it use ``url``. Re-crawls
+    append new records; the latest record for a URL wins when reading.
+    Lets ``--reextract`` rebuild every page from local data after the
+    selectors change, without touching the network.
+    """
+
+    def __init__(self, data_dir: str, codec: str = 'auto') -> None:
+        self.archive_file = os.path.join(data_dir, "raw_html.archive")
+        if codec == 'auto':
+            codec = 'zstd' if ZSTD_AVAILABLE else 'gzip'
+        elif codec == 'zstd' and not ZSTD_AVAILABLE:
+            logger.warning("⚠️  zstandard not installed - archiving raw HTML with gzip")
+            codec = 'gzip'
+        self.codec = codec
+        self._file: Optional[Any] = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def url_key(url: str) -> str:
+        return hashlib.sha1(url.encode()).hexdigest()[:16]
+
+    def append(self, url: str, content: bytes, base: Optional[str] = None) -> None:
+        """Compress and append the raw HTML for a URL.
+
+        Args:
+            url: Requested page URL (the archive key)
+            content: Raw response body
+            base: Final response URL, if a redirect changed it
+        """
+        blob = compress_html(self.codec, content)
+        record = {
+            'key': self.url_key(url),
+            'url': url,
+            'codec': self.codec,
+            'length': len(blob)
+        }
+        if base and base != url:
+            record['base'] = base
+        header = dumps(record) + b'\n'
+
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.archive_file, 'ab')
+            self._file.write(header)
+            self._file.write(blob)
+
+    def flush(self) -> None:
+        """Make appended records durable (before a checkpoint journals their pages)."""
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+                os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def exists(self) -> bool:
+        return os.path.exists(self.archive_file)
+
+    def latest_offsets(self) -> Dict[str, int]:
+        """Scan the archive headers, keeping the newest record per URL.
+
+        Blobs are skipped over, not read, so memory stays proportional to
+        the number of URLs rather than the archive size.
+
+        Returns:
+            dict: URL key -> file offset of its newest record, in order of
+            each URL's first appearance
+        """
+        offsets: Dict[str, int] = {}
+        size = os.path.getsize(self.archive_file)
+        with open(self.archive_file, 'rb') as f:
+            while True:
+                offset = f.tell()
+                line = f.readline()
+                if not line:
+                    break
+                try:
+                    header = loads(line)
+                    end = f.tell() + header['length']
+                except (ValueError, KeyError):
+                    logger.warning("⚠️  Corrupt record in %s - stopping read", self.archive_file)
+                    break
+                if end > size:
+                    # Truncated tail (crawl killed mid-write)
+                    break
+                offsets[header['key']] = offset
+                f.seek(end)
+        return offsets
+
+    def iter_records(self, offsets: Iterable[int]) -> Iterator[Tuple[str, str, str, bytes]]:
+        """Read records at the given offsets one at a time.
+
+        Yields:
+            tuple: (url, base URL for links, codec, compressed HTML)
+        """
+        with open(self.archive_file, 'rb') as f:
+            for offset in offsets:
+                f.seek(offset)
+                header = loads(f.readline())
+                yield (header['url'], header.get('base', header['url']), header['codec'],
+                       f.read(header['length']))
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+HTTP Metadata Cache for Incremental Re-scrapes
+
+Remembers ETag, Last-Modified and a body hash per URL so the next run of
+doc_scraper.py can send conditional requests and reuse unchanged pages
+from the page store.
+"""
+
+import os
+import hashlib
+import logging
+import threading
+from typing import Any, Dict, Optional
+
+from cli.page_store import PageStore
+from cli.serialization import dumps, loads, read_json, write_json
+
+logger = logging.getLogger(__name__)
+
+
+class HttpMetadataCache:
+    """On-disk response metadata for incremental (conditional) re-scrapes.
+
+    For every fetched URL it remembers the ETag, Last-Modified header and
+    a hash of the body. The next run sends If-None-Match /
+    If-Modified-Since; on 304 Not Modified (or a 200 with an identical
+    body) the page stored by the previous run is reused instead of
+    re-parsing. Stored as ``http_cache.json`` in the data directory;
+    checkpoints only append the entries stored since the last one to
+    ``http_cache.json.log``, and ``save`` folds that log into the file.
+    """
+
+    def __init__(self, data_dir: str, page_store: PageStore) -> None:
+        self.cache_file = os.path.join(data_dir, "http_cache.json")
+        self.log_file = self.cache_file + ".log"
+        self.page_store = page_store
+        self.entries: Dict[str, Dict[str, str]] = {}
+        self.unchanged = 0
+        self.changed = 0
+        self._unsaved: Dict[str, Dict[str, str]] = {}  # stored since the last flush
+        self._lock = threading.Lock()
+
+    def load(self) -> None:
+        """Load metadata saved by a previous run (missing file = empty cache)."""
+        try:
+            if os.path.exists(self.cache_file):
+                self.entries = read_json(self.cache_file)
+            if os.path.exists(self.log_file):
+                with open(self.log_file, 'rb') as f:
+                    for line in f:
+                        try:
+                            self.entries.update(loads(line))
+                        except ValueError:
+                            break  # torn last line: its pages are simply re-fetched
+            if self.entries:
+                logger.info("🗂️  HTTP cache: %d known URLs", len(self.entries))
+        except Exception as e:
+            logger.warning("⚠️  Failed to load HTTP cache, fetching everything: %s", e)
+            self.entries = {}
+
+    def flush(self) -> None:
+        """Append the entries stored since the last flush to the log (checkpoints)."""
+        with self._lock:
+            if not self._unsaved:
+                return
+            delta, self._unsaved = self._unsaved, {}
+        try:
+            with open(self.log_file, 'ab') as f:
+                f.write(dumps(delta) + b'\n')
+        except Exception as e:
+            logger.warning("⚠️  Failed to save HTTP cache: %s", e)
+
+    def save(self) -> None:
+        """Persist all metadata atomically and drop the log (compaction, end of run)."""
+        with self._lock:
+            entries = dict(self.entries)
+            self._unsaved = {}
+        try:
+            write_json(self.cache_file, entries, atomic=True)
+            if os.path.exists(self.log_file):
+                os.remove(self.log_file)
+        except Exception as e:
+            logger.warning("⚠️  Failed to save HTTP cache: %s", e)
+
+    def request_headers(self, url: str) -> Dict[str, str]:
+        """Conditional request headers for a URL seen in a previous run."""
+        entry = self.entries.get(url)
+        if not entry:
+            return {}
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def cached_page(self, url: str, status_code: int, content: bytes) -> Optional[Dict[str, Any]]:
+        """Return the stored page if the response says the page is unchanged.
+
+        Args:
+            url: Requested URL
+            status_code: HTTP status of the conditional request
+            content: Response body (empty for 304)
+
+        Returns:
+            dict or None: Stored page, or None if the page must be
+            (re)parsed - changed content, unknown URL or page not in the store
+        """
+        entry = self.entries.get(url)
+        if not entry:
+            return None
+        if status_code != 304:
+            if status_code != 200 or hashlib.sha256(content).hexdigest() != entry.get('content_hash'):
+                return None
+
+        page = self.page_store.get(url)
+        if page is None:
+            return None
+
+        with self._lock:
+            self.unchanged += 1
+        return page
+
+    def store(self, url: str, headers: Any, content: bytes) -> None:
+        """Record metadata for a freshly fetched and saved page."""
+        entry = {
+            'etag': headers.get('ETag', ''),
+            'last_modified': headers.get('Last-Modified', ''),
+            'content_hash': hashlib.sha256(content).hexdigest(),
+        }
+        with self._lock:
+            self.entries[url] = entry
+            self._unsaved[url] = entry
+            self.changed += 1
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+Crawl Journal for Checkpoints and Resume
+
+Write-ahead log of claimed, queued and completed URLs plus periodic
+snapshots, so ``--resume`` continues an interrupted crawl with (almost)
+nothing lost. Used by doc_scraper.py's save_checkpoint/load_checkpoint.
+"""
+
+import os
+import re
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Union
+
+from cli.frontier import FingerprintSet
+from cli.serialization import dumps, loads, read_json
+
+
+class CrawlJournal:
+    """Write-ahead crawl journal with periodic, atomically replaced snapshots.
+
+    Every claimed and newly queued URL is appended as one compact JSON line
+    to ``crawl_journal.<generation>.jsonl`` as it happens, so an interrupted
+    crawl loses (almost) nothing. A claimed URL only counts as visited once
+    a completion event follows it, and completions are journaled only
+    after the page store has flushed (``take_completed`` before the flush,
+    ``commit_completed`` after it); claims without one go back to pending
+    on replay. Compaction starts a new journal
+    generation, writes the full state to the checkpoint file via a temp
+    file + ``os.replace`` and then deletes the older journals. A crash at
+    any point leaves either the old or the new snapshot plus every journal
+    written since, and replaying those is idempotent.
+    """
+
+    JOURNAL_RE = re.compile(r'^crawl_journal\.(\d+)\.jsonl$')
+
+    def __init__(self, data_dir: str, checkpoint_file: str) -> None:
+        self.data_dir = data_dir
+        self.checkpoint_file = checkpoint_file
+        self.generation = 0
+        self.events = 0  # events appended since the last snapshot
+        self.completed = 0  # pages whose completion is journaled
+        self.claimed: Set[str] = set()  # claimed, completion not journaled yet
+        self._completed: List[str] = []  # done, waiting for a page store flush
+        self._file: Optional[Any] = None
+        self._lock = threading.Lock()
+
+    def _journal_path(self, generation: int) -> str:
+        return os.path.join(self.data_dir, f"crawl_journal.{generation}.jsonl")
+
+    def _generations(self) -> List[int]:
+        if not os.path.isdir(self.data_dir):
+            return []
+        found = (self.JOURNAL_RE.match(name) for name in os.listdir(self.data_dir))
+        return sorted(int(m.group(1)) for m in found if m)
+
+    def exists(self) -> bool:
+        return os.path.exists(self.checkpoint_file) or bool(self._generations())
+
+    def _append(self, event: List[Any]) -> None:
+        line = dumps(event) + b'\n'
+        with self._lock:
+            if self._file is None:
+                self._file = open(self._journal_path(self.generation), 'ab')
+            self._file.write(line)
+            self._file.flush()
+            self.events += 1
+
+    def record_queued(self, urls: List[str]) -> None:
+        """Journal URLs added to the frontier (in queue order)."""
+        self._append(['q', urls])
+
+    def record_visited(self, url: str) -> None:
+        """Journal a URL handed out for scraping (claimed, not yet stored)."""
+        with self._lock:
+            self.claimed.add(url)
+        self._append(['v', url])
+
+    def record_completed(self, url: str) -> None:
+        """Note a URL that is stored (or has failed for good).
+
+        Nothing is written yet: the page may still sit in a store buffer.
+        """
+        with self._lock:
+            self._completed.append(url)
+
+    def take_completed(self) -> List[str]:
+        """Hand over completions noted so far (call before flushing the page store)."""
+        with self._lock:
+            completed, self._completed = self._completed, []
+            return completed
+
+    def commit_completed(self, urls: List[str]) -> None:
+        """Journal completions from take_completed once the page store has flushed."""
+        if not urls:
+            return
+        self._append(['c', urls])
+        with self._lock:
+            self.claimed.difference_update(urls)
+            self.completed += len(urls)
+
+    def should_compact(self, state_size: int) -> bool:
+        """Compact once the journal has grown to a quarter of the state.
+
+        Keeps snapshot cost amortized O(1) per event instead of rewriting
+        the full state at every checkpoint interval.
+        """
+        return self.events > 0 and self.events >= state_size // 4
+
+    def rotate(self) -> int:
+        """Start a new journal generation (call before capturing a snapshot).
+
+        Returns:
+            int: Generation the snapshot must be tagged with
+        """
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            self.generation += 1
+            self.events = 0
+            return self.generation
+
+    def write_snapshot(self, state: Dict[str, Any], pending: Iterable[str], generation: int) -> None:
+        """Atomically replace the snapshot, then drop journals it covers.
+
+        ``pending`` is streamed into the file, so a spilled frontier is
+        never materialized in memory. Claimed URLs without a journaled
+        completion are saved as ``claimed_urls`` and re-queued on load.
+        """
+        state['journal_generation'] = generation
+        with self._lock:
+            state['pages_scraped'] = self.completed
+            state['claimed_urls'] = list(self.claimed)
+        tmp_file = self.checkpoint_file + '.tmp'
+        with open(tmp_file, 'wb') as f:
+            f.write(dumps(state)[:-1])
+            f.write(b',"pending_urls":[')
+            for i, url in enumerate(pending):
+                f.write((b',' if i else b'') + dumps(url))
+            f.write(b']}')
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.checkpoint_file)
+
+        for old in self._generations():
+            if old < generation:
+                os.remove(self._journal_path(old))
+
+    def load(self, start_urls: List[str],
+             visited: Union[Set[str], FingerprintSet],
+             key: Optional[Callable[[str], str]] = None) -> Optional[Dict[str, Any]]:
+        """Rebuild crawl state from the snapshot plus journal replay.
+
+        Args:
+            start_urls: Initial queue when there is no snapshot yet
+            visited: Empty set to fill (a snapshot saved with fingerprints
+                always restores as a FingerprintSet)
+            key: Maps a journaled URL to its visited-set key (default: the URL)
+
+        Returns:
+            dict or None: visited_urls (set or FingerprintSet),
+            pending_urls (list; claimed-but-unfinished URLs first),
+            pages_scraped and last_updated; None if nothing was saved
+        """
+        if not self.exists():
+            return None
+        key = key or (lambda url: url)
+
+        snapshot: Dict[str, Any] = {}
+        if os.path.exists(self.checkpoint_file):
+            snapshot = read_json(self.checkpoint_file)
+
+        if 'visited_fingerprints' in snapshot:
+            visited = FingerprintSet.loads(snapshot['visited_fingerprints'])
+        else:
+            visited.update(snapshot.get('visited_urls', []))
+        pending = dict.fromkeys(snapshot.get('pending_urls', start_urls))
+        claimed = dict.fromkeys(snapshot.get('claimed_urls', []))
+        pages_scraped = snapshot.get('pages_scraped', 0)
+        base_generation = snapshot.get('journal_generation', 0)
+
+        generations = [g for g in self._generations() if g >= base_generation]
+        for generation in generations:
+            with open(self._journal_path(generation), 'rb') as f:
+                for line in f:
+                    try:
+                        kind, value = loads(line)
+                    except ValueError:
+                        break  # torn final write
+                    if kind == 'q':
+                        for url in value:
+                            if key(url) not in visited:
+                                pending.setdefault(url)
+                    elif kind == 'v' and key(value) not in visited:
+                        claimed.setdefault(value)
+                        pending.pop(value, None)
+                    elif kind == 'c':
+                        for url in value:
+                            if url in claimed or key(url) not in visited:
+                                claimed.pop(url, None)
+                                visited.add(key(url))
+                                pending.pop(url, None)
+                                pages_scraped += 1
+
+        # Claimed but never durably stored: fetch again
+        for url in claimed:
+            visited.discard(key(url))
+            pending.pop(url, None)
+        pending = {**claimed, **pending}
+
+        # Keep appending to the newest journal
+        self.generation = max(generations + [base_generation])
+        self.completed = pages_scraped
+        return {
+            'visited_urls': visited,
+            'pending_urls': list(pending),
+            'pages_scraped': pages_scraped,
+            'last_updated': snapshot.get('last_updated', 'never (journal only)'),
+            'replayed_journals': len(generations)
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def clear(self) -> None:
+        """Delete the snapshot and every journal."""
+        self.close()
+        for generation in self._generations():
+            os.remove(self._journal_path(generation))
+        if os.path.exists(self.checkpoint_file):
+            os.remove(self.checkpoint_file)
+        self.generation = 0
+        self.events = 0
+        self.completed = 0
+        with self._lock:
+            self.claimed.clear()
+            self._completed = []
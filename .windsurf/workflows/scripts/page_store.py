@@ -0,0 +1,619 @@
+#!/usr/bin/env python3
+"""
+Page Store Backends for Scraped Documentation
+
+Stores the page dicts produced by doc_scraper.py:
+- json: one JSON file per page in pages/ (original layout)
+- jsonl: single append-only pages.jsonl with a URL -> offset index
+- sqlite: single pages.sqlite database with the URL as primary key
+
+All backends support streaming iteration (for building skills), random
+access by URL (for incremental re-scrapes) and a cheap (title, url)
+catalog (for resumed crawl summaries). Existing pages/ directories can
+be migrated once into the single-file backends.
+"""
+
+import os
+import re
+import queue
+import asyncio
+import sqlite3
+import hashlib
+import logging
+import threading
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Any
+
+from cli.serialization import dumps, loads, read_json, write_json
+
+logger = logging.getLogger(__name__)
+
+PAGE_STORE_BACKENDS = ('json', 'jsonl', 'sqlite')
+
+
+def page_url_hash(url: str) -> str:
+    """Short URL hash used in per-page file names."""
+    return hashlib.md5(url.encode()).hexdigest()[:10]
+
+
+class PageStore(ABC):
+    """Base class for page storage backends."""
+
+    backend = ''
+
+    @abstractmethod
+    def put(self, page: Dict[str, Any]) -> str:
+        """Store a page (replacing any previous version of its URL).
+
+        Returns:
+            str: Backend-specific reference to the stored page
+        """
+
+    def put_many(self, pages: List[Dict[str, Any]]) -> None:
+        """Store a batch of pages (backends may do it in one transaction)."""
+        for page in pages:
+            self.put(page)
+
+    @abstractmethod
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """Return the stored page for a URL, or None."""
+
+    @abstractmethod
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """Stream every stored page (latest version per URL)."""
+
+    def catalog(self) -> Iterator[Tuple[str, str]]:
+        """Yield (title, url) for every stored page without loading content."""
+        for page in self:
+            yield page['title'], page['url']
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Number of stored pages."""
+
+    def __contains__(self, url: str) -> bool:
+        return self.get(url) is not None
+
+    def flush(self) -> None:
+        """Make everything written so far durable."""
+
+    def compact(self) -> None:
+        """Flush, then fold incremental index logs into one full index.
+
+        Checkpoints only ``flush``; this runs on journal compaction and at
+        the end of a run, so the O(pages) index rewrite stays rare.
+        """
+        self.flush()
+
+    def close(self) -> None:
+        self.compact()
+
+
+class JsonDirPageStore(PageStore):
+    """One JSON file per page: pages/<title>_<urlhash>.json (indented if ``pretty``)
+
+    A URL -> (title, file name) catalog is kept in pages_index.json and
+    loaded lazily; files it does not cover are read once to fill it in.
+    ``flush`` appends the entries changed since the last flush to
+    pages_index.json.log, and ``compact`` folds that log into the catalog.
+    """
+
+    backend = 'json'
+
+    def __init__(self, data_dir: str, pretty: bool = False) -> None:
+        self.pages_dir = os.path.join(data_dir, "pages")
+        self.pretty = pretty
+        self.catalog_file = os.path.join(data_dir, "pages_index.json")
+        self.catalog_log = self.catalog_file + ".log"
+        os.makedirs(self.pages_dir, exist_ok=True)
+        self._index: Optional[Dict[str, str]] = None  # url hash -> file name
+        self._catalog: Optional[Dict[str, Tuple[str, str]]] = None  # url -> (title, file name)
+        self._catalog_updates: Dict[str, Tuple[str, str]] = {}
+        self._unsaved: Dict[str, Tuple[str, str]] = {}  # changed since the last flush
+        self._lock = threading.Lock()
+
+    def _files_by_hash(self) -> Dict[str, str]:
+        # File names end in _<urlhash>.json, so one listing indexes the store
+        if self._index is None:
+            index = {}
+            for filename in os.listdir(self.pages_dir):
+                if filename.endswith('.json') and '_' in filename:
+                    index[filename[:-len('.json')].rsplit('_', 1)[1]] = filename
+            self._index = index
+        return self._index
+
+    def _load_catalog(self) -> Dict[str, Tuple[str, str]]:
+        if self._catalog is not None:
+            return self._catalog
+        files = self._files_by_hash()
+
+        catalog: Dict[str, Tuple[str, str]] = {}
+        if os.path.exists(self.catalog_file):
+            try:
+                saved = read_json(self.catalog_file)
+                for url, (title, filename) in saved.items():
+                    if files.get(page_url_hash(url)) == filename:
+                        catalog[url] = (title, filename)
+            except (OSError, ValueError):
+                logger.warning("⚠️  Ignoring unreadable page index %s", self.catalog_file)
+        if os.path.exists(self.catalog_log):
+            # One JSON object per flush; a torn last line is left to the file scan below
+            with open(self.catalog_log, 'rb') as f:
+                for line in f:
+                    try:
+                        for url, (title, filename) in loads(line).items():
+                            if files.get(page_url_hash(url)) == filename:
+                                catalog[url] = (title, filename)
+                    except (ValueError, TypeError):
+                        break
+
+        # Fill in files written without the catalog (older runs, crashes)
+        known = {filename for _, filename in catalog.values()}
+        known.update(filename for _, filename in self._catalog_updates.values())
+        missing = [filename for filename in files.values() if filename not in known]
+        if missing:
+            logger.info("📇 Indexing %d page files...", len(missing))
+        for filename in missing:
+            try:
+                page = read_json(os.path.join(self.pages_dir, filename))
+                catalog[page['url']] = (page['title'], filename)
+            except (OSError, ValueError, KeyError):
+                continue
+
+        catalog.update(self._catalog_updates)
+        self._catalog_updates = {}
+        self._catalog = catalog
+        return catalog
+
+    def put(self, page: Dict[str, Any]) -> str:
+        url_hash = page_url_hash(page['url'])
+        safe_title = re.sub(r'[^\w\s-]', '', page['title'])[:50]
+        safe_title = re.sub(r'[-\s]+', '_', safe_title)
+
+        filename = f"{safe_title}_{url_hash}.json"
+        filepath = os.path.join(self.pages_dir, filename)
+
+        write_json(filepath, page, pretty=self.pretty)
+
+        with self._lock:
+            index = self._files_by_hash()
+            previous = index.get(url_hash)
+            index[url_hash] = filename
+            entry = (page['title'], filename)
+            self._unsaved[page['url']] = entry
+            if self._catalog is not None:
+                self._catalog[page['url']] = entry
+            else:
+                self._catalog_updates[page['url']] = entry
+        # Title changed since the last save: drop the old file
+        if previous and previous != filename:
+            try:
+                os.remove(os.path.join(self.pages_dir, previous))
+            except OSError:
+                pass
+
+        return filename
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            filename = self._files_by_hash().get(page_url_hash(url))
+        if not filename:
+            return None
+        try:
+            return read_json(os.path.join(self.pages_dir, filename))
+        except (OSError, ValueError):
+            return None
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        with self._lock:
+            filenames = list(self._files_by_hash().values())
+        for filename in filenames:
+            json_file = os.path.join(self.pages_dir, filename)
+            try:
+                yield read_json(json_file)
+            except Exception as e:
+                logger.error("⚠️  Error loading scraped data file %s: %s: %s", json_file, type(e).__name__, e)
+                logger.error("   Suggestion: File may be corrupted, consider re-scraping with --fresh")
+
+    def catalog(self) -> Iterator[Tuple[str, str]]:
+        with self._lock:
+            entries = list(self._load_catalog().items())
+        for url, (title, _) in entries:
+            yield title, url
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._files_by_hash())
+
+    def flush(self) -> None:
+        with self._lock:
+            if not self._unsaved:
+                return
+            delta = {url: list(entry) for url, entry in self._unsaved.items()}
+            self._unsaved = {}
+            with open(self.catalog_log, 'ab') as f:
+                f.write(dumps(delta) + b'\n')
+
+    def compact(self) -> None:
+        with self._lock:
+            self._unsaved = {}
+            if self._catalog is None and not self._catalog_updates and not os.path.exists(self.catalog_log):
+                return
+            saved = {url: list(entry) for url, entry in self._load_catalog().items()}
+            write_json(self.catalog_file, saved, atomic=True)
+            if os.path.exists(self.catalog_log):
+                os.remove(self.catalog_log)
+
+
+class JsonlPageStore(PageStore):
+    """Append-only pages.jsonl (one compact JSON page per line).
+
+    Re-saving a URL appends a new line; an in-memory URL -> (offset, length,
+    title) index points at the latest one. ``flush`` appends the entries
+    added since the last flush to pages.jsonl.idx.log; ``compact`` writes
+    the full index to pages.jsonl.idx and drops the log. Either is tagged
+    with the data file size it covers, and the index is rebuilt by a single
+    scan if they do not add up to the current file.
+    """
+
+    backend = 'jsonl'
+
+    def __init__(self, data_dir: str) -> None:
+        self.data_file = os.path.join(data_dir, "pages.jsonl")
+        self.index_file = os.path.join(data_dir, "pages.jsonl.idx")
+        self.index_log = self.index_file + ".log"
+        self._lock = threading.Lock()
+        self._writer: Optional[Any] = None
+        self._index: Dict[str, Tuple[int, int, str]] = {}
+        self._unsaved: Dict[str, Tuple[int, int, str]] = {}  # added since the last flush
+        self._load_index()
+
+    def _load_index(self) -> None:
+        if not os.path.exists(self.data_file):
+            return
+        size = os.path.getsize(self.data_file)
+
+        # Fast path: full index plus the deltas flushed after it, ending at exactly this file size
+        try:
+            index: Dict[str, Tuple[int, int, str]] = {}
+            covered = 0
+            if os.path.exists(self.index_file):
+                saved = read_json(self.index_file)
+                index = {url: (entry[0], entry[1], entry[2]) for url, entry in saved['index'].items()}
+                covered = saved['size']
+            if os.path.exists(self.index_log):
+                with open(self.index_log, 'rb') as f:
+                    for line in f:
+                        delta = loads(line)
+                        # Left over from a compaction that crashed before removing the log
+                        if delta['size'] <= covered:
+                            continue
+                        index.update((url, (entry[0], entry[1], entry[2])) for url, entry in delta['index'].items())
+                        covered = delta['size']
+            if covered == size:
+                self._index = index
+                return
+        except (OSError, ValueError, KeyError, IndexError, TypeError):
+            pass
+
+        # Rebuild by scanning (ignores a truncated last line)
+        index: Dict[str, Tuple[int, int, str]] = {}
+        offset = 0
+        with open(self.data_file, 'rb') as f:
+            for line in f:
+                if line.endswith(b'\n'):
+                    try:
+                        page = loads(line)
+                        index[page['url']] = (offset, len(line), page['title'])
+                    except (ValueError, KeyError):
+                        logger.warning("⚠️  Skipping corrupt line at offset %d in %s", offset, self.data_file)
+                offset += len(line)
+        self._index = index
+
+    def put(self, page: Dict[str, Any]) -> str:
+        line = dumps(page) + b'\n'
+        with self._lock:
+            if self._writer is None:
+                self._writer = open(self.data_file, 'ab')
+            offset = self._writer.tell()
+            self._writer.write(line)
+            entry = (offset, len(line), page['title'])
+            self._index[page['url']] = entry
+            self._unsaved[page['url']] = entry
+        return page['url']
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._index.get(url)
+            if entry is None:
+                return None
+            if self._writer is not None:
+                self._writer.flush()
+        with open(self.data_file, 'rb') as f:
+            f.seek(entry[0])
+            return loads(f.read(entry[1]))
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        with self._lock:
+            if self._writer is not None:
+                self._writer.flush()
+            latest = {entry[0] for entry in self._index.values()}
+        if not latest:
+            return
+
+        # Sequential scan, skipping superseded versions
+        offset = 0
+        with open(self.data_file, 'rb') as f:
+            for line in f:
+                if offset in latest:
+                    yield loads(line)
+                offset += len(line)
+
+    def catalog(self) -> Iterator[Tuple[str, str]]:
+        with self._lock:
+            entries = sorted(self._index.items(), key=lambda item: item[1][0])
+        for url, (_, _, title) in entries:
+            yield title, url
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, url: str) -> bool:
+        return url in self._index
+
+    def _sync(self) -> None:
+        if self._writer is not None:
+            self._writer.flush()
+            os.fsync(self._writer.fileno())
+
+    def flush(self) -> None:
+        with self._lock:
+            self._sync()
+            if not self._unsaved:
+                return
+            delta = {
+                'size': os.path.getsize(self.data_file),
+                'index': {url: list(entry) for url, entry in self._unsaved.items()}
+            }
+            self._unsaved = {}
+            with open(self.index_log, 'ab') as f:
+                f.write(dumps(delta) + b'\n')
+
+    def compact(self) -> None:
+        with self._lock:
+            self._sync()
+            self._unsaved = {}
+            if not os.path.exists(self.data_file):
+                return
+            saved = {
+                'size': os.path.getsize(self.data_file),
+                'index': {url: list(entry) for url, entry in self._index.items()}
+            }
+            write_json(self.index_file, saved, atomic=True)
+            if os.path.exists(self.index_log):
+                os.remove(self.index_log)
+
+    def close(self) -> None:
+        self.compact()
+        with self._lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+
+
+class SqlitePageStore(PageStore):
+    """Single pages.sqlite database keyed by URL."""
+
+    backend = 'sqlite'
+
+    def __init__(self, data_dir: str) -> None:
+        self.db_file = os.path.join(data_dir, "pages.sqlite")
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_file, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS pages ("
+            "url TEXT PRIMARY KEY, title TEXT NOT NULL, data TEXT NOT NULL)"
+        )
+        self._conn.commit()
+
+    def put(self, page: Dict[str, Any]) -> str:
+        data = dumps(page).decode('utf-8')
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO pages (url, title, data) VALUES (?, ?, ?)",
+                (page['url'], page['title'], data)
+            )
+        return page['url']
+
+    def put_many(self, pages: List[Dict[str, Any]]) -> None:
+        rows = [(page['url'], page['title'], dumps(page).decode('utf-8')) for page in pages]
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO pages (url, title, data) VALUES (?, ?, ?)", rows
+            )
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute("SELECT data FROM pages WHERE url = ?", (url,)).fetchone()
+        return loads(row[0]) if row else None
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        # Separate read connection so iteration doesn't hold the writer lock
+        self.flush()
+        reader = sqlite3.connect(self.db_file)
+        try:
+            for (data,) in reader.execute("SELECT data FROM pages ORDER BY rowid"):
+                yield loads(data)
+        finally:
+            reader.close()
+
+    def catalog(self) -> Iterator[Tuple[str, str]]:
+        with self._lock:
+            rows = self._conn.execute("SELECT title, url FROM pages ORDER BY rowid").fetchall()
+        yield from rows
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM pages").fetchone()[0]
+
+    def flush(self) -> None:
+        with self._lock:
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.commit()
+            self._conn.close()
+
+
+class PageWriter:
+    """Background writer thread fed by a bounded queue.
+
+    Keeps page persistence off the async crawler's event loop: callers
+    enqueue items and a single thread hands them to ``write_batch`` in
+    batches of up to ``batch_size`` (whatever has queued up since the
+    last write). The queue is bounded, so a slow disk applies
+    backpressure instead of buffering unbounded page content.
+
+    A failed batch is not retried; its exception is kept and re-raised by
+    every later ``put``, ``put_async``, ``join`` and ``close``, so callers
+    never treat queued pages as stored after a write error.
+    """
+
+    _STOP = object()
+
+    def __init__(self, write_batch: Callable[[List[Any]], None],
+                 maxsize: int = 256, batch_size: int = 32) -> None:
+        self.write_batch = write_batch
+        self.batch_size = max(1, batch_size)
+        self.written = 0
+        self.batches = 0
+        self.error: Optional[BaseException] = None
+        self._queue: queue.Queue = queue.Queue(maxsize)
+        self._thread = threading.Thread(target=self._run, name='page-writer', daemon=True)
+        self._thread.start()
+
+    def _raise_error(self) -> None:
+        if self.error is not None:
+            raise self.error
+
+    def put(self, item: Any) -> None:
+        """Enqueue an item, blocking while the queue is full."""
+        self._raise_error()
+        self._queue.put(item)
+
+    async def put_async(self, item: Any) -> None:
+        """Enqueue an item without blocking the event loop."""
+        self._raise_error()
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            await asyncio.get_running_loop().run_in_executor(None, self._queue.put, item)
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while batch[-1] is not self._STOP and len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = batch[-1] is self._STOP
+            barriers = [item for item in batch if isinstance(item, threading.Event)]
+            items = [item for item in batch if item is not self._STOP and not isinstance(item, threading.Event)]
+            try:
+                if items:
+                    self.write_batch(items)
+                    self.written += len(items)
+                    self.batches += 1
+            except Exception as e:
+                logger.error("  ✗ Failed to write %d pages: %s: %s", len(items), type(e).__name__, e)
+                if self.error is None:
+                    self.error = e
+            finally:
+                for barrier in barriers:
+                    barrier.set()
+                for _ in batch:
+                    self._queue.task_done()
+            if stop:
+                return
+
+    def join(self) -> None:
+        """Wait until everything enqueued before this call has been written.
+
+        Uses a barrier item rather than ``Queue.join``, which would also
+        wait for items other threads keep adding meanwhile. Must not be
+        called after ``close``.
+        """
+        barrier = threading.Event()
+        self._queue.put(barrier)
+        barrier.wait()
+        self._raise_error()
+
+    def close(self) -> None:
+        """Write what is queued, then stop the thread."""
+        self._queue.put(self._STOP)
+        self._thread.join()
+        self._raise_error()
+
+
+def migrate_page_dir(data_dir: str, store: PageStore) -> int:
+    """One-time import of an existing pages/ directory into a single-file store.
+
+    The directory is renamed to pages.migrated/ afterwards so the
+    migration never runs twice.
+
+    Returns:
+        int: Number of pages migrated
+    """
+    pages_dir = os.path.join(data_dir, "pages")
+    if isinstance(store, JsonDirPageStore) or not os.path.isdir(pages_dir):
+        return 0
+
+    migrated = 0
+    for page in JsonDirPageStore(data_dir):
+        store.put(page)
+        migrated += 1
+    store.flush()
+
+    target = os.path.join(data_dir, "pages.migrated")
+    if os.path.exists(target):
+        target = f"{target}.{int(os.path.getmtime(pages_dir))}"
+    os.rename(pages_dir, target)
+    for catalog_file in ("pages_index.json", "pages_index.json.log"):
+        if os.path.exists(os.path.join(data_dir, catalog_file)):
+            os.remove(os.path.join(data_dir, catalog_file))
+    if migrated:
+        logger.info("📦 Migrated %d pages from pages/ into %s store (old files kept in %s)",
+                    migrated, store.backend, os.path.basename(target))
+    return migrated
+
+
+def open_page_store(data_dir: str, backend: str = 'json', pretty: bool = False) -> PageStore:
+    """Open (creating if needed) the page store for a data directory.
+
+    Args:
+        data_dir: Scraper data directory (output/<name>_data)
+        backend: 'json', 'jsonl' or 'sqlite'
+        pretty: Indent page files (json backend only)
+
+    Returns:
+        PageStore: Store instance; for single-file backends, any legacy
+        pages/ directory has been migrated into it
+    """
+    os.makedirs(data_dir, exist_ok=True)
+    if backend == 'jsonl':
+        store: PageStore = JsonlPageStore(data_dir)
+    elif backend == 'sqlite':
+        store = SqlitePageStore(data_dir)
+    elif backend == 'json':
+        return JsonDirPageStore(data_dir, pretty)
+    else:
+        raise ValueError(f"Unknown page store backend: {backend} (use one of {', '.join(PAGE_STORE_BACKENDS)})")
+
+    migrate_page_dir(data_dir, store)
+    return store
+
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+JSON Serialization for Scraped Data Files
+
+One place for reading and writing the JSON files produced by the
+scrapers (pages, summaries, checkpoints, GitHub data, conflict reports):
+- orjson when installed, then msgspec, then the stdlib json module
+- compact output by default; pretty=True gives the old indent=2 layout
+- always UTF-8 (non-ASCII text is written as-is, like ensure_ascii=False)
+
+Files written by any backend load with any other, so installing or
+removing orjson/msgspec never invalidates existing output.
+"""
+
+import os
+import json
+from typing import Any
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
+if ORJSON_AVAILABLE:
+    JSON_BACKEND = 'orjson'
+elif MSGSPEC_AVAILABLE:
+    JSON_BACKEND = 'msgspec'
+else:
+    JSON_BACKEND = 'json'
+
+_ENCODE_ERRORS = (TypeError, ValueError, OverflowError)
+if MSGSPEC_AVAILABLE:
+    _msgspec_encoder = msgspec.json.Encoder()
+    _msgspec_decoder = msgspec.json.Decoder()
+    _ENCODE_ERRORS += (msgspec.EncodeError,)
+
+
+def _stdlib_dumps(obj: Any, pretty: bool) -> bytes:
+    if pretty:
+        text = json.dumps(obj, indent=2, ensure_ascii=False)
+    else:
+        text = json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
+    return text.encode('utf-8')
+
+
+def dumps(obj: Any, pretty: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes.
+
+    Args:
+        obj: JSON-compatible value
+        pretty: Indent with two spaces (human-readable, ~30% larger)
+
+    Returns:
+        bytes: Encoded JSON (no trailing newline)
+    """
+    try:
+        if JSON_BACKEND == 'orjson':
+            option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+            return orjson.dumps(obj, option=option)
+        if JSON_BACKEND == 'msgspec':
+            data = _msgspec_encoder.encode(obj)
+            return msgspec.json.format(data, indent=2) if pretty else data
+    except _ENCODE_ERRORS:
+        pass  # e.g. integers beyond 64 bits: let the stdlib decide
+    return _stdlib_dumps(obj, pretty)
+
+
+def loads(data: Any) -> Any:
+    """Parse JSON from bytes or str (raises ValueError on bad input)."""
+    if JSON_BACKEND == 'orjson':
+        return orjson.loads(data)
+    if JSON_BACKEND == 'msgspec':
+        try:
+            return _msgspec_decoder.decode(data)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e  # callers catch ValueError, as with json
+    return json.loads(data)
+
+
+def write_json(path: str, obj: Any, pretty: bool = False, atomic: bool = False) -> None:
+    """Write a JSON file.
+
+    Args:
+        path: Destination file
+        obj: JSON-compatible value
+        pretty: Indented output instead of compact
+        atomic: Write a temp file and rename it over ``path``, so readers
+            never see a half-written file
+    """
+    data = dumps(obj, pretty)
+    target = path + '.tmp' if atomic else path
+    with open(target, 'wb') as f:
+        f.write(data)
+    if atomic:
+        os.replace(target, path)
+
+
+def read_json(path: str) -> Any:
+    """Read a JSON file written by write_json (or any UTF-8 JSON file)."""
+    with open(path, 'rb') as f:
+        return loads(f.read())
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Streaming Sitemap Reader
+
+Reads sitemaps and sitemap indexes (plain or gzipped) incrementally, so
+doc_scraper.py can seed a crawl from them without holding a whole
+sitemap in memory.
+"""
+
+import io
+import gzip
+import logging
+import xml.etree.ElementTree as ET
+from typing import Any, Callable, Iterator, Optional, Set, Tuple
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+
+class SitemapReader:
+    """Stream (url, lastmod) entries out of sitemaps and sitemap indexes.
+
+    Responses are parsed incrementally with ``iterparse`` and cleared as
+    they go, so a 50k-URL sitemap never sits in memory as a tree.
+    Gzipped sitemaps (``.xml.gz``, detected by magic bytes) are
+    decompressed on the fly. Nested indexes are followed up to
+    ``max_sitemaps`` documents, each fetched once.
+    """
+
+    def __init__(self, fetch: Callable[[str], Any], max_sitemaps: int = 1000) -> None:
+        self.fetch = fetch  # url -> streaming requests.Response
+        self.max_sitemaps = max_sitemaps
+        self.fetched = 0
+        self._seen: Set[str] = set()
+
+    @staticmethod
+    def _local(tag: str) -> str:
+        return tag.rsplit('}', 1)[-1]
+
+    def iter_urls(self, sitemap_url: str) -> Iterator[Tuple[str, Optional[str]]]:
+        """Yield (loc, lastmod) for every page listed under a sitemap."""
+        pending = [sitemap_url]
+        while pending:
+            url = pending.pop()
+            if url in self._seen or self.fetched >= self.max_sitemaps:
+                continue
+            self._seen.add(url)
+            response = None
+            try:
+                response = self.fetch(url)
+                if response.status_code != 200:
+                    logger.debug("Sitemap %s: HTTP %d", url, response.status_code)
+                    continue
+                self.fetched += 1
+                response.raw.decode_content = True  # undo Content-Encoding
+                response.raw.auto_close = False  # let the buffer read to EOF
+                stream = io.BufferedReader(response.raw)
+                if stream.peek(2)[:2] == b'\x1f\x8b':  # .xml.gz file
+                    stream = gzip.GzipFile(fileobj=stream)
+                for kind, loc, lastmod in self._parse(stream):
+                    if kind == 'sitemap':
+                        pending.append(loc)
+                    else:
+                        yield loc, lastmod
+            except (requests.RequestException, ET.ParseError, OSError, EOFError) as e:
+                logger.warning("⚠️  Could not read sitemap %s: %s", url, e)
+            finally:
+                if response is not None:
+                    response.close()
+
+    def _parse(self, stream: Any) -> Iterator[Tuple[str, str, Optional[str]]]:
+        root = None
+        for event, elem in ET.iterparse(stream, events=('start', 'end')):
+            if root is None:
+                root = elem
+            if event != 'end':
+                continue
+            kind = self._local(elem.tag)
+            if kind not in ('url', 'sitemap'):
+                continue
+            loc = lastmod = None
+            for child in elem:
+                name = self._local(child.tag)
+                if name == 'loc' and child.text:
+                    loc = child.text.strip()
+                elif name == 'lastmod' and child.text:
+                    lastmod = child.text.strip()
+            root.clear()  # drop processed entries
+            if loc:
+                yield kind, loc, lastmod
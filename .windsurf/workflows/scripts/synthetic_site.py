@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+Synthetic Documentation Site for Tests and Benchmarks
+
+Serves a generated documentation tree from a local HTTP server thread,
+so crawls can be exercised without network access:
+- page n links to its children 2n+1 and 2n+2 (a binary tree of ``pages``)
+  plus the root page, so every page is reachable from page 0
+- ``relative=True`` serves directory-style URLs (``/docs/p3/``), links
+  them relatively (``../p7``) and 301-redirects the slash-less form
+- ``elements`` adds that many paragraphs, list items and code blocks to
+  each page's main content (large-page extraction workloads)
+- ``latency`` delays every response (seconds)
+- ``capacity`` caps requests in flight: beyond it the server answers
+  ``overload_status`` (429 or 503, optionally with ``Retry-After``)
+  immediately, like an overloaded origin shedding load
+- ``fail_paths`` maps paths to a status served on every request for them
+- ``sitemap`` lists every page (with ``lastmod``) in sitemaps announced
+  by robots.txt: an index pointing at a gzipped ``.xml.gz`` file (even
+  pages) and a nested index whose sitemap is served with
+  ``Content-Encoding: gzip`` (odd pages)
+- ``validators`` sends an ETag and Last-Modified (both derived from
+  ``lastmod``) with every page and answers 304 Not Modified to a
+  matching If-None-Match or If-Modified-Since; pages embed ``lastmod``,
+  so changing it changes every page
+
+Usage:
+    with SyntheticDocSite(pages=500) as site:
+        converter = DocToSkillConverter(site.config('demo', workers=8))
+"""
+
+import calendar
+import gzip
+import http.server
+import socketserver
+import threading
+import time
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Any, Dict, List, Optional
+
+
+class _Server(socketserver.ThreadingMixIn, http.server.HTTPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class SyntheticDocSite:
+    """Generated documentation tree served on 127.0.0.1 (random port)."""
+
+    def __init__(self, pages: int = 200, latency: float = 0.0,
+                 relative: bool = False, elements: int = 0,
+                 capacity: Optional[int] = None, overload_status: int = 429,
+                 retry_after: Optional[int] = None,
+                 fail_paths: Optional[Dict[str, int]] = None,
+                 sitemap: bool = False, lastmod: str = '2026-01-01',
+                 validators: bool = False) -> None:
+        self.pages = pages
+        self.latency = latency
+        self.relative = relative
+        self.elements = elements
+        self.capacity = capacity
+        self.overload_status = overload_status
+        self.retry_after = retry_after
+        self.fail_paths = dict(fail_paths or {})
+        self.sitemap = sitemap
+        self.lastmod = lastmod
+        self.validators = validators
+        self.requests = 0
+        self.not_modified = 0
+        self.rejected = 0
+        self.in_flight = 0
+        self.max_in_flight = 0  # among requests that were served
+        self._lock = threading.Lock()
+        self._server: Optional[_Server] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def origin(self) -> str:
+        assert self._server is not None, "site not started"
+        return f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    @property
+    def base_url(self) -> str:
+        return self.origin + "/docs/"
+
+    @property
+    def start_url(self) -> str:
+        """Root page URL (slash-less in relative mode, so it redirects)."""
+        return self.base_url + ('p0' if self.relative else 'p0.html')
+
+    def config(self, name: str = 'synthetic', **overrides: Any) -> Dict[str, Any]:
+        """Scraper config crawling the whole site (no rate limit)."""
+        config = {
+            'name': name,
+            'base_url': self.base_url,
+            'start_urls': [self.start_url],
+            'rate_limit': 0,
+            'max_pages': self.pages,
+            'selectors': {'main_content': 'div[role="main"]', 'title': 'title', 'code_blocks': 'pre code'},
+        }
+        config.update(overrides)
+        return config
+
+    def page_path(self, n: int) -> str:
+        return f"/docs/p{n}/" if self.relative else f"/docs/p{n}.html"
+
+    def page_validators(self, n: int) -> Dict[str, str]:
+        """ETag and Last-Modified headers of page n."""
+        modified = calendar.timegm(time.strptime(self.lastmod, '%Y-%m-%d'))
+        return {'ETag': f'"p{n}-{self.lastmod}"', 'Last-Modified': formatdate(modified, usegmt=True)}
+
+    def not_modified_since(self, n: int, headers: Any) -> bool:
+        """Whether a conditional request for page n can be answered with 304."""
+        current = self.page_validators(n)
+        if headers.get('If-None-Match') is not None:
+            return headers['If-None-Match'] == current['ETag']
+        since = headers.get('If-Modified-Since')
+        try:
+            return since is not None and (parsedate_to_datetime(since)
+                                          >= parsedate_to_datetime(current['Last-Modified']))
+        except (TypeError, ValueError):
+            return False
+
+    def render(self, n: int) -> bytes:
+        """HTML of page n."""
+        children = [c for c in (2 * n + 1, 2 * n + 2) if c < self.pages]
+        if self.relative:
+            links = ''.join(f'<a href="../p{c}">Child {c}</a>' for c in children)
+            links += '<a href="../p0#top">Home</a>'
+        else:
+            links = ''.join(f'<a href="/docs/p{c}.html">Child {c}</a>' for c in children)
+            links += '<a href="/docs/p0.html#top">Home</a>'
+
+        filler = []
+        for i in range(self.elements // 3):
+            filler.append(f'<h3>Section {i}</h3><p>Paragraph {i} of page {n} with <b>inline</b> '
+                          f'<a href="#s{i}">anchors</a> and some explanatory text.</p>')
+            filler.append(f'<ul><li>Item {i}.1</li><li>Item {i}.2</li></ul>')
+            filler.append(f'<pre><code class="language-python">def f_{i}(x):\n    return x * {i}</code></pre>')
+
+        return (
+            f'<html><head><title>Page {n}</title>'
+            f'<meta name="dcterms.modified" content="{self.lastmod}"></head><body>'
+            f'<nav><a href="/docs/">Docs</a></nav>'
+            f'<div role="main"><h1>Page {n}</h1>'
+            f'<p>Introductory paragraph for page {n}, long enough to count as content.</p>'
+            f'<pre><code class="language-python">print("page {n}")</code></pre>'
+            f'{"".join(filler)}{links}</div></body></html>'
+        ).encode()
+
+    def sitemap_files(self) -> Dict[str, bytes]:
+        """robots.txt and sitemap documents by path (uncompressed)."""
+        def urlset(pages: range) -> bytes:
+            entries = ''.join(f'<url><loc>{self.origin}{self.page_path(n)}</loc>'
+                              f'<lastmod>{self.lastmod}</lastmod></url>' for n in pages)
+            return (f'<?xml version="1.0" encoding="UTF-8"?>'
+                    f'<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">{entries}</urlset>').encode()
+
+        def index(paths: List[str]) -> bytes:
+            entries = ''.join(f'<sitemap><loc>{self.origin}{path}</loc></sitemap>' for path in paths)
+            return (f'<?xml version="1.0" encoding="UTF-8"?>'
+                    f'<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">{entries}</sitemapindex>').encode()
+
+        return {
+            '/robots.txt': f"User-agent: *\nSitemap: {self.origin}/sitemap_index.xml\n".encode(),
+            '/sitemap_index.xml': index(['/sitemaps/even.xml.gz', '/sitemaps/nested.xml']),
+            '/sitemaps/even.xml.gz': gzip.compress(urlset(range(0, self.pages, 2))),
+            '/sitemaps/nested.xml': index(['/sitemaps/odd.xml']),
+            '/sitemaps/odd.xml': urlset(range(1, self.pages, 2)),
+        }
+
+    def _handler(self) -> Any:
+        site = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            # Headers and body go out in separate writes; with Nagle's
+            # algorithm each response would stall on the client's delayed ACK
+            disable_nagle_algorithm = True
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+            def _send(self, status: int, body: bytes = b'', location: Optional[str] = None,
+                      retry_after: Optional[int] = None, content_type: str = 'text/html; charset=utf-8',
+                      encoding: Optional[str] = None, headers: Optional[Dict[str, str]] = None) -> None:
+                self.send_response(status)
+                for header, value in (headers or {}).items():
+                    self.send_header(header, value)
+                if location:
+                    self.send_header('Location', location)
+                if retry_after is not None:
+                    self.send_header('Retry-After', str(retry_after))
+                if encoding:
+                    self.send_header('Content-Encoding', encoding)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self) -> None:
+                with site._lock:
+                    site.requests += 1
+                    overloaded = site.capacity is not None and site.in_flight >= site.capacity
+                    if overloaded:
+                        site.rejected += 1
+                    else:
+                        site.in_flight += 1
+                        site.max_in_flight = max(site.max_in_flight, site.in_flight)
+                if overloaded:
+                    self._send(site.overload_status, retry_after=site.retry_after)
+                    return
+                if site.latency:
+                    time.sleep(site.latency)
+                # The slot frees before the response goes out, so a client
+                # reusing it straight away is not counted as over capacity
+                with site._lock:
+                    site.in_flight -= 1
+
+                path = self.path.split('?')[0]
+                if path in site.fail_paths:
+                    self._send(site.fail_paths[path])
+                    return
+                if site.sitemap and (path == '/robots.txt' or path.startswith('/sitemap')):
+                    files = site.sitemap_files()
+                    if path not in files:
+                        self._send(404)
+                    elif path == '/robots.txt':
+                        self._send(200, files[path], content_type='text/plain')
+                    elif path.endswith('.gz'):
+                        self._send(200, files[path], content_type='application/gzip')
+                    elif path == '/sitemaps/odd.xml':
+                        self._send(200, gzip.compress(files[path]), content_type='application/xml',
+                                   encoding='gzip')
+                    else:
+                        self._send(200, files[path], content_type='application/xml')
+                    return
+                name = path[len('/docs/p'):] if path.startswith('/docs/p') else ''
+                if site.relative:
+                    slash = name.endswith('/')
+                    name = name.rstrip('/')
+                else:
+                    slash = True
+                    name = name[:-len('.html')] if name.endswith('.html') else ''
+                if not name.isdigit() or int(name) >= site.pages:
+                    self._send(404)
+                elif not slash:
+                    self._send(301, location=site.page_path(int(name)))
+                elif not site.validators:
+                    self._send(200, site.render(int(name)))
+                elif site.not_modified_since(int(name), self.headers):
+                    with site._lock:
+                        site.not_modified += 1
+                    self._send(304, headers=site.page_validators(int(name)))
+                else:
+                    self._send(200, site.render(int(name)), headers=site.page_validators(int(name)))
+
+        return Handler
+
+    def start(self) -> 'SyntheticDocSite':
+        self._server = _Server(('127.0.0.1', 0), self._handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> 'SyntheticDocSite':
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
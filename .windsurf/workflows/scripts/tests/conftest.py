@@ -0,0 +1,65 @@
+"""Make the scripts directory importable as the ``cli`` package.
+
+The scraper modules import each other as ``cli.<module>`` (the upstream
+layout). Here they live in ``scripts/``, so register that directory as
+``cli`` and stand in for the llms.txt modules this tree does not ship.
+The stubs never find an llms.txt, so crawls fall back to HTML scraping.
+"""
+
+import os
+import sys
+import types
+
+SCRIPTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class LlmsTxtDetector:
+    def __init__(self, base_url):
+        self.base_url = base_url
+
+    def detect_all(self):
+        return []
+
+
+class LlmsTxtDownloader:
+    def __init__(self, url):
+        self.url = url
+
+    def download(self):
+        return None
+
+    def get_proper_filename(self):
+        return os.path.basename(self.url).replace('.txt', '.md')
+
+
+class LlmsTxtParser:
+    def __init__(self, content):
+        self.content = content
+
+    def parse(self):
+        return []
+
+
+def _install_cli_package() -> None:
+    if SCRIPTS_DIR not in sys.path:
+        sys.path.insert(0, SCRIPTS_DIR)
+    if 'cli' not in sys.modules:
+        package = types.ModuleType('cli')
+        package.__path__ = [SCRIPTS_DIR]
+        sys.modules['cli'] = package
+
+    stubs = {
+        'llms_txt_detector': LlmsTxtDetector,
+        'llms_txt_downloader': LlmsTxtDownloader,
+        'llms_txt_parser': LlmsTxtParser,
+    }
+    for name, cls in stubs.items():
+        if os.path.exists(os.path.join(SCRIPTS_DIR, name + '.py')):
+            continue
+        module = types.ModuleType('cli.' + name)
+        setattr(module, cls.__name__, cls)
+        sys.modules['cli.' + name] = module
+        setattr(sys.modules['cli'], name, module)
+
+
+_install_cli_package()
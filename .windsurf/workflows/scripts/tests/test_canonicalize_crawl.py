@@ -0,0 +1,53 @@
+"""Crawls with URL canonicalization enabled against a relative-link site."""
+
+import pytest
+
+from cli import doc_scraper
+from cli.frontier import CrawlFrontier
+from cli.synthetic_site import SyntheticDocSite
+
+PAGES = 61
+
+
+def crawl(tmp_path, monkeypatch, **extra):
+    monkeypatch.chdir(tmp_path)
+    with SyntheticDocSite(pages=PAGES, relative=True) as site:
+        config = {
+            'name': 'canon',
+            'base_url': site.base_url,
+            'start_urls': [site.start_url],
+            'rate_limit': 0,
+            'max_pages': 1000,
+            'canonicalize': True,
+            'selectors': {'main_content': 'div[role="main"]', 'title': 'title', 'code_blocks': 'pre code'},
+        }
+        config.update(extra)
+        converter = doc_scraper.DocToSkillConverter(config)
+        converter.scrape_all()
+    return converter
+
+
+@pytest.mark.parametrize('extra', [
+    {},
+    {'workers': 4},
+    {'async_mode': True, 'workers': 4},
+], ids=['sequential', 'threaded', 'async'])
+def test_relative_links_crawl_every_page(tmp_path, monkeypatch, extra):
+    converter = crawl(tmp_path, monkeypatch, **extra)
+    titles = {title for title, _ in converter.page_store.catalog()}
+    assert titles == {f"Page {n}" for n in range(PAGES)}
+    assert len(converter.visited_urls) == PAGES
+
+
+def test_canonical_form_is_only_the_dedup_key():
+    canonicalize = doc_scraper.UrlCanonicalizer(True, 'https://docs.example.com/')
+    # Trailing slashes are kept by default
+    assert canonicalize('https://Docs.Example.com:443/guide/?utm_source=x') == 'https://docs.example.com/guide/'
+    assert canonicalize('https://docs.example.com/guide') == 'https://docs.example.com/guide'
+    # Userinfo would be lost when rebuilding the host
+    assert canonicalize('https://user:pw@Docs.Example.com/a#b') == 'https://user:pw@Docs.Example.com/a'
+
+    frontier = CrawlFrontier(key=canonicalize)
+    assert frontier.push('https://docs.example.com/guide/?utm_source=x')
+    assert not frontier.push('https://docs.example.com/guide/')
+    assert frontier.pop() == 'https://docs.example.com/guide/?utm_source=x'
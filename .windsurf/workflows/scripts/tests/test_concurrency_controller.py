@@ -0,0 +1,105 @@
+"""ConcurrencyController on synthetic latency/error sequences and on crawls of an overloaded site."""
+
+import pytest
+
+from cli.doc_scraper import DocToSkillConverter
+from cli.fetch_policy import ConcurrencyController
+from cli.synthetic_site import SyntheticDocSite
+
+
+def feed_window(controller, latency, status=200, errors=0, throttled=0):
+    """Record one full window; the first requests fail or get throttled."""
+    for i in range(controller.window):
+        if i < throttled:
+            controller.record(latency, 429)
+        elif i < throttled + errors:
+            controller.record(None, None)
+        else:
+            controller.record(latency, status)
+    return controller.current()
+
+
+def saturating_server(capacity, base=0.1):
+    """Latency stays at ``base`` up to ``capacity`` requests in flight, then grows linearly."""
+    return lambda limit: base * max(1.0, limit / capacity)
+
+
+def test_slow_start_doubles_until_maximum():
+    controller = ConcurrencyController(1, 32, window=10)
+    limits = [feed_window(controller, 0.1) for _ in range(7)]
+    assert limits == [2, 4, 8, 16, 32, 32, 32]
+    assert controller.slow_start
+
+
+def test_throttling_halves_and_ends_slow_start():
+    controller = ConcurrencyController(1, 32, window=10)
+    for _ in range(5):
+        feed_window(controller, 0.1)
+    assert feed_window(controller, 0.1, throttled=1) == 16
+    assert not controller.slow_start
+    # Additive increase from here on
+    assert [feed_window(controller, 0.1) for _ in range(3)] == [17, 18, 19]
+
+
+def test_error_rate_threshold():
+    controller = ConcurrencyController(4, 64, window=20, error_threshold=0.05)
+    assert feed_window(controller, 0.1, errors=1) == 8  # 5% is not above the threshold
+    assert feed_window(controller, 0.1, errors=2) == 4  # 10% is
+    assert feed_window(controller, 0.1, status=503, errors=0) == 4  # every response a 5xx, floor holds
+    assert feed_window(controller, 0.1) == 5
+
+
+def test_latency_target_backoff():
+    controller = ConcurrencyController(2, 32, window=10, latency_target=0.2)
+    assert feed_window(controller, 0.15) == 4
+    assert feed_window(controller, 0.5) == 2
+    assert feed_window(controller, 0.15) == 3
+
+
+def test_converges_below_saturation():
+    latency_at = saturating_server(capacity=8)
+    controller = ConcurrencyController(1, 64, window=20)
+    limits = [feed_window(controller, latency_at(controller.current())) for _ in range(200)]
+
+    # Slow start overshoots once, then AIMD saws between capacity and 2x
+    # capacity, where p90 crosses the 2x best-p50 target
+    assert max(limits[:10]) == 32
+    steady = limits[20:]
+    assert min(steady) >= 8
+    assert max(steady) <= 17
+    assert 10 <= sum(steady) / len(steady) <= 15
+    assert controller.best_p50 == pytest.approx(0.1)
+
+
+def test_limit_stays_within_bounds():
+    controller = ConcurrencyController(3, 6, window=5)
+    assert all(feed_window(controller, 0.1, errors=5) == 3 for _ in range(4))
+    assert all(1 <= feed_window(controller, 0.1) <= 6 for _ in range(10))
+    assert controller.current() == 6
+
+
+@pytest.mark.parametrize('mode,status', [
+    ({}, 429),
+    ({'async_mode': True}, 503),
+], ids=['threaded-429', 'async-503'])
+def test_crawl_converges_to_server_capacity(tmp_path, monkeypatch, mode, status):
+    monkeypatch.chdir(tmp_path)
+    capacity = 4
+    # Requests beyond 4 in flight are shed with 429/503; the crawl starts
+    # with a ceiling of 16 workers and has to find the capacity itself
+    with SyntheticDocSite(pages=250, latency=0.03, capacity=capacity, overload_status=status) as site:
+        config = site.config(
+            'adaptive', workers=16, adaptive_concurrency={'window': 10}, max_retries=10,
+            retry={'base_delay': 0.02, 'max_delay': 0.1, 'breaker_threshold': 1000}, **mode
+        )
+        converter = DocToSkillConverter(config)
+        converter.scrape_all()
+
+    controller = converter.concurrency
+    assert site.rejected > 0
+    assert not controller.slow_start
+    # AIMD saws between half the capacity and one step above it
+    assert capacity // 2 <= controller.current() <= capacity + 1
+    # Every shed request was retried: the crawl finished
+    assert len(converter.page_store) == 250
+    assert not converter.failed_urls
@@ -0,0 +1,84 @@
+"""CrawlFrontier disk spill: FIFO order and checkpoint streaming against a deque model."""
+
+import os
+import random
+from collections import deque
+
+import pytest
+
+from cli.frontier import CrawlFrontier
+
+
+class ModelFrontier:
+    """What a FIFO frontier must do: dedupe on first sight, pop in push order."""
+
+    def __init__(self):
+        self.queue = deque()
+        self.seen = set()
+
+    def push_many(self, urls):
+        queued = [url for url in dict.fromkeys(urls) if url not in self.seen]
+        self.seen.update(queued)
+        self.queue.extend(queued)
+        return len(queued)
+
+    def pop(self):
+        return self.queue.popleft() if self.queue else None
+
+
+def random_steps(frontier, model, rng, steps):
+    for _ in range(steps):
+        if rng.random() < 0.55:
+            urls = [f'https://docs.example.com/p{rng.randrange(3000)}' for _ in range(rng.randrange(1, 12))]
+            if len(urls) == 1:
+                assert frontier.push(urls[0]) == bool(model.push_many(urls))
+            else:
+                assert frontier.push_many(urls) == model.push_many(urls)
+        else:
+            for _ in range(rng.randrange(1, 10)):
+                assert frontier.pop() == model.pop()
+        assert len(frontier) == len(model.queue)
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_spilling_frontier_stays_fifo(tmp_path, seed):
+    rng = random.Random(seed)
+    frontier = CrawlFrontier(memory_limit=16, spill_dir=str(tmp_path))
+    model = ModelFrontier()
+
+    random_steps(frontier, model, rng, 2000)
+    assert frontier._spill_file is not None  # the run did spill
+    while model.queue:
+        assert frontier.pop() == model.pop()
+    assert frontier.pop() is None
+    assert not frontier
+
+    frontier.close()
+    assert not any(name.startswith(CrawlFrontier.SPILL_PREFIX) for name in os.listdir(tmp_path))
+
+
+def test_iter_pending_while_spilled(tmp_path):
+    rng = random.Random(7)
+    frontier = CrawlFrontier(memory_limit=16, spill_dir=str(tmp_path))
+    model = ModelFrontier()
+    model.push_many([f'https://docs.example.com/p{i}' for i in range(200)])
+    frontier.push_many([f'https://docs.example.com/p{i}' for i in range(200)])
+    random_steps(frontier, model, rng, 300)
+    assert frontier._spilled
+
+    assert frontier.pending() == list(model.queue)
+
+    # A checkpoint streams the queue while workers keep popping (refilling
+    # from the spill) and pushing: it must see the queue as it was
+    expected = list(model.queue)
+    pending = frontier.iter_pending()
+    streamed = [next(pending)]
+    random_steps(frontier, model, rng, 200)
+    streamed.extend(pending)
+    assert streamed == expected
+
+    # Rows kept for the reader are released afterwards
+    assert frontier.pending() == list(model.queue)
+    while model.queue:
+        assert frontier.pop() == model.pop()
+    frontier.close()
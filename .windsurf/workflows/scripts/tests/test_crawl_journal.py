@@ -0,0 +1,94 @@
+"""CrawlJournal replay after torn writes and crashes during compaction."""
+
+import os
+
+import pytest
+
+from cli.journal import CrawlJournal
+
+START = ['a']
+
+
+def new_journal(tmp_path):
+    return CrawlJournal(str(tmp_path), str(tmp_path / 'checkpoint.json'))
+
+
+def record_crawl(journal):
+    """Start page a is stored, b is claimed but not stored, c and d are queued."""
+    journal.record_queued(['b', 'c'])
+    journal.record_visited('a')
+    journal.commit_completed(['a'])
+    journal.record_visited('b')
+    journal.record_queued(['d'])
+
+
+def assert_state(state, pending):
+    assert set(state['visited_urls']) == {'a'}
+    # Claimed-but-unstored URLs go back to the front of the queue
+    assert state['pending_urls'] == pending
+    assert state['pages_scraped'] == 1
+
+
+def test_replay_matches_recorded_events(tmp_path):
+    journal = new_journal(tmp_path)
+    record_crawl(journal)
+    journal.close()
+
+    assert_state(new_journal(tmp_path).load(START, set()), ['b', 'c', 'd'])
+
+
+def test_replay_stops_at_torn_last_line(tmp_path):
+    journal = new_journal(tmp_path)
+    record_crawl(journal)
+    journal.close()
+    # Killed mid-write: the last event is half a line
+    with open(tmp_path / 'crawl_journal.0.jsonl', 'ab') as f:
+        f.write(b'["c",["c","d')
+
+    assert_state(new_journal(tmp_path).load(START, set()), ['b', 'c', 'd'])
+
+
+@pytest.mark.parametrize('crash', ['after_rotate', 'before_replace', 'before_cleanup'])
+def test_crash_during_compaction_keeps_state(tmp_path, crash):
+    journal = new_journal(tmp_path)
+    record_crawl(journal)
+    old_journal = tmp_path / 'crawl_journal.0.jsonl'
+    old_events = old_journal.read_bytes()
+
+    generation = journal.rotate()
+    # An event racing the snapshot lands in the new generation
+    journal.record_queued(['e'])
+    if crash == 'before_replace':
+        (tmp_path / 'checkpoint.json.tmp').write_bytes(b'{"config":{"na')
+    elif crash == 'before_cleanup':
+        journal.write_snapshot({'visited_urls': ['a', 'b'], 'last_updated': 'now'},
+                               iter(['c', 'd', 'e']), generation)
+        # The snapshot was replaced but the old journal was never deleted
+        old_journal.write_bytes(old_events)
+    journal.close()
+
+    for _ in range(2):  # replay is idempotent
+        recovered = new_journal(tmp_path)
+        assert_state(recovered.load(START, set()), ['b', 'c', 'd', 'e'])
+        assert recovered.generation == generation
+
+
+def test_snapshot_drops_covered_journals_and_resumes_appending(tmp_path):
+    journal = new_journal(tmp_path)
+    record_crawl(journal)
+    generation = journal.rotate()
+    journal.write_snapshot({'visited_urls': ['a', 'b'], 'last_updated': 'now'},
+                           iter(['c', 'd']), generation)
+    journal.close()
+    assert sorted(os.listdir(tmp_path)) == ['checkpoint.json']
+
+    resumed = new_journal(tmp_path)
+    assert_state(resumed.load(START, set()), ['b', 'c', 'd'])
+    resumed.record_visited('c')
+    resumed.commit_completed(['c'])
+    resumed.close()
+
+    state = new_journal(tmp_path).load(START, set())
+    assert set(state['visited_urls']) == {'a', 'c'}
+    assert state['pending_urls'] == ['b', 'd']
+    assert state['pages_scraped'] == 2
@@ -0,0 +1,53 @@
+"""--estimate page counts against SyntheticDocSite, compared with a real crawl."""
+
+import pytest
+
+from cli.doc_scraper import DocToSkillConverter
+from cli.synthetic_site import SyntheticDocSite
+
+PAGES = 200
+
+
+@pytest.mark.parametrize('relative', [False, True], ids=['absolute', 'relative'])
+def test_estimate_counts_every_page(tmp_path, monkeypatch, relative):
+    monkeypatch.chdir(tmp_path)
+    with SyntheticDocSite(pages=PAGES, relative=relative) as site:
+        config = site.config('estimate', max_pages=1000, page_store='jsonl', canonicalize=True)
+        estimator = DocToSkillConverter(config)
+        result = estimator.estimate_pages(max_discovery=-1)
+        estimate_requests = site.requests
+
+        crawl = DocToSkillConverter(config)
+        crawl.scrape_all()
+
+    assert result['discovered'] == PAGES
+    assert result['fetched'] == PAGES
+    assert result['errors'] == 0
+    assert not result['limit_reached']
+    assert sum(result['sections'].values()) == PAGES
+    # Discovery only: nothing stored, and it agrees with a real crawl
+    assert len(estimator.page_store) == 0
+    assert len(crawl.visited_urls) == result['discovered']
+    # Relative mode redirects every slash-less link once
+    assert estimate_requests == (2 * PAGES if relative else PAGES)
+
+
+def test_estimate_stops_at_discovery_limit(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    with SyntheticDocSite(pages=PAGES) as site:
+        result = DocToSkillConverter(site.config('estimate')).estimate_pages(max_discovery=50)
+
+    assert result['limit_reached']
+    assert result['discovered'] == 50
+    assert result['fetched'] < PAGES
+
+
+def test_estimate_counts_errors_and_skips_their_links(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    # p1's subtree (3, 4, 7, 8, ...) is only linked from p1
+    with SyntheticDocSite(pages=15, fail_paths={'/docs/p1.html': 500}) as site:
+        result = DocToSkillConverter(site.config('estimate')).estimate_pages(max_discovery=-1)
+
+    assert result['errors'] == 1
+    assert result['discovered'] == 15 - 6
+    assert result['fetched'] == 15 - 6 - 1
@@ -0,0 +1,74 @@
+"""FingerprintSet growth, deletion and checkpoint round-trips."""
+
+from cli.doc_scraper import DocToSkillConverter
+from cli.frontier import FingerprintSet
+from cli.journal import CrawlJournal
+from cli.synthetic_site import SyntheticDocSite
+
+
+def urls(count, prefix='https://docs.example.com/p'):
+    return [f'{prefix}{i}.html' for i in range(count)]
+
+
+def test_grows_past_initial_capacity():
+    visited = FingerprintSet(capacity=4)
+    for url in urls(5000):
+        visited.add(url)
+        visited.add(url)  # duplicates are not counted twice
+
+    assert len(visited) == 5000
+    # Load factor stays at or below 0.5
+    assert len(visited._slots) >= 10000
+    assert all(url in visited for url in urls(5000))
+    assert not any(url in visited for url in urls(5000, 'https://docs.example.com/other'))
+
+
+def test_discard_keeps_probe_runs_intact():
+    visited = FingerprintSet(urls(3000), capacity=16)
+    for url in urls(3000)[::2]:
+        visited.discard(url)
+    visited.discard('https://docs.example.com/never-added')
+
+    assert len(visited) == 1500
+    assert not any(url in visited for url in urls(3000)[::2])
+    assert all(url in visited for url in urls(3000)[1::2])
+
+
+def test_round_trips_through_a_checkpoint(tmp_path):
+    visited = FingerprintSet(urls(2000))
+    restored = FingerprintSet.loads(visited.dumps())
+    assert len(restored) == 2000
+    assert all(url in restored for url in urls(2000))
+
+    journal = CrawlJournal(str(tmp_path), str(tmp_path / 'checkpoint.json'))
+    generation = journal.rotate()
+    journal.write_snapshot({'visited_fingerprints': visited.dumps()}, iter(['next']), generation)
+    journal.close()
+
+    state = CrawlJournal(str(tmp_path), str(tmp_path / 'checkpoint.json')).load([], set())
+    assert isinstance(state['visited_urls'], FingerprintSet)
+    assert len(state['visited_urls']) == 2000
+    assert all(url in state['visited_urls'] for url in urls(2000))
+    assert state['pending_urls'] == ['next']
+
+
+def test_resumed_compact_crawl_skips_visited_pages(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    with SyntheticDocSite(pages=100) as site:
+        checkpoint = {'enabled': True, 'interval': 5}
+        first = DocToSkillConverter(site.config('compact', max_pages=40, compact_visited=True,
+                                                checkpoint=checkpoint, page_store='jsonl'))
+        first.scrape_all()
+        assert isinstance(first.visited_urls, FingerprintSet)
+        first_requests = site.requests
+
+        resumed = DocToSkillConverter(site.config('compact', compact_visited=True,
+                                                  checkpoint=checkpoint, page_store='jsonl'), resume=True)
+        assert isinstance(resumed.visited_urls, FingerprintSet)
+        resumed.scrape_all()
+
+    assert len(resumed.visited_urls) == 100
+    assert len(resumed.page_store) == 100
+    # Nothing the first run stored is fetched again
+    assert first_requests == 40
+    assert site.requests - first_requests == 60
@@ -0,0 +1,85 @@
+"""Conditional re-fetches through HttpMetadataCache against SyntheticDocSite validators."""
+
+import json
+import os
+
+import pytest
+
+from cli.doc_scraper import DocToSkillConverter
+from cli.synthetic_site import SyntheticDocSite
+
+PAGES = 15
+
+
+def crawl(config):
+    converter = DocToSkillConverter(config)
+    converter.scrape_all()
+    with open(os.path.join(converter.data_dir, 'summary.json')) as f:
+        return converter, json.load(f)
+
+
+@pytest.mark.parametrize('mode', [{'workers': 1}, {'workers': 4, 'async_mode': True}], ids=['sequential', 'async'])
+def test_not_modified_pages_are_reused(tmp_path, monkeypatch, mode):
+    monkeypatch.chdir(tmp_path)
+    with SyntheticDocSite(pages=PAGES, validators=True) as site:
+        config = site.config('cached', http_cache=True, **mode)
+        _, first = crawl(config)
+        assert first['fetch_stats'] == {'unchanged': 0, 'changed': PAGES}
+        assert site.not_modified == 0
+
+        # The stored page for p5 is gone: its 304 is followed by a plain GET
+        data_dir = tmp_path / 'output' / 'cached_data'
+        os.remove(next((data_dir / 'pages').glob('Page_5_*.json')))
+        requests_before = site.requests
+        converter, second = crawl(config)
+        assert site.not_modified == PAGES
+        assert site.requests - requests_before == PAGES + 1
+        assert second['fetch_stats'] == {'unchanged': PAGES - 1, 'changed': 1}
+        assert len(converter.page_store) == PAGES
+
+        # New lastmod: validators no longer match, every page is re-parsed
+        site.lastmod = '2026-02-01'
+        _, third = crawl(config)
+        assert site.not_modified == PAGES
+        assert third['fetch_stats'] == {'unchanged': 0, 'changed': PAGES}
+
+
+def test_identical_body_is_reused_without_validators(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    with SyntheticDocSite(pages=PAGES) as site:
+        config = site.config('hashed', http_cache=True)
+        crawl(config)
+        requests_before = site.requests
+        _, second = crawl(config)
+
+    # The server ignores conditional headers; the body hash still matches
+    assert site.requests - requests_before == PAGES
+    assert site.not_modified == 0
+    assert second['fetch_stats'] == {'unchanged': PAGES, 'changed': 0}
+
+
+def test_checkpoints_append_to_the_cache_log(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    with SyntheticDocSite(pages=PAGES, validators=True) as site:
+        config = site.config('journaled', http_cache=True, page_store='jsonl',
+                             checkpoint={'enabled': True, 'interval': 4})
+        converter = DocToSkillConverter(config)
+        converter.scrape_all()
+        cache = converter.http_cache
+        converter.save_checkpoint()  # journals the last completions and compacts
+
+        # Between compactions, checkpoints only append what changed
+        cache.store(site.base_url + 'extra.html', {'ETag': '"x"'}, b'extra')
+        converter.save_checkpoint()
+        with open(cache.log_file, 'rb') as f:
+            assert f.read().count(b'extra.html') == 1
+        with open(cache.cache_file) as f:
+            assert site.base_url + 'extra.html' not in json.load(f)
+
+        reloaded = DocToSkillConverter(config)
+        assert len(reloaded.http_cache.entries) == PAGES + 1
+
+        cache.save()
+        assert not os.path.exists(cache.log_file)
+        with open(cache.cache_file) as f:
+            assert len(json.load(f)) == PAGES + 1
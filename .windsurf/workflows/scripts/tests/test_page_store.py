@@ -0,0 +1,91 @@
+"""Page store backends: round-trips and the abstract base."""
+
+import json
+
+import pytest
+
+from cli.page_store import PAGE_STORE_BACKENDS, PageStore, open_page_store
+
+
+def page(n, title=None):
+    return {'url': f'https://docs.example.com/p{n}.html', 'title': title or f'Page {n}',
+            'content': f'content {n}', 'code_samples': [], 'links': []}
+
+
+@pytest.mark.parametrize('backend', PAGE_STORE_BACKENDS)
+def test_round_trip_keeps_latest_version(tmp_path, backend):
+    store = open_page_store(str(tmp_path), backend)
+    store.put_many([page(n) for n in range(5)])
+    store.put(page(2, title='Page 2 (updated)'))
+    store.flush()
+
+    assert len(store) == 5
+    assert store.get(page(2)['url'])['title'] == 'Page 2 (updated)'
+    assert store.get('https://docs.example.com/missing.html') is None
+    assert sorted(p['url'] for p in store) == sorted(page(n)['url'] for n in range(5))
+    assert ('Page 2 (updated)', page(2)['url']) in set(store.catalog())
+    store.close()
+
+
+def test_backend_missing_a_method_cannot_be_instantiated():
+    class PartialStore(PageStore):
+        def put(self, page):
+            return page['url']
+
+        def get(self, url):
+            return None
+
+        def __iter__(self):
+            return iter(())
+
+    with pytest.raises(TypeError, match='__len__'):
+        PartialStore()
+
+
+@pytest.mark.parametrize('backend', ['json', 'jsonl'])
+def test_flush_appends_index_deltas_and_compact_folds_them(tmp_path, backend):
+    index_file = tmp_path / ('pages_index.json' if backend == 'json' else 'pages.jsonl.idx')
+    index_log = tmp_path / (index_file.name + '.log')
+
+    store = open_page_store(str(tmp_path), backend)
+    store.put_many([page(n) for n in range(3)])
+    store.flush()
+    store.put(page(1, title='Page 1 (updated)'))
+    store.flush()
+    store.flush()  # nothing new: nothing appended
+    # Checkpoints append only what changed; the full index is not written yet
+    assert not index_file.exists()
+    deltas = index_log.read_bytes().splitlines()
+    assert len(deltas) == 2
+    assert b'p0.html' not in deltas[1]
+
+    # A fresh process replays the log (jsonl would otherwise rescan the data file)
+    reopened = open_page_store(str(tmp_path), backend)
+    assert ('Page 1 (updated)', page(1)['url']) in set(reopened.catalog())
+    assert reopened.get(page(1)['url'])['title'] == 'Page 1 (updated)'
+    assert len(reopened) == 3
+
+    store.put(page(3))
+    store.compact()
+    assert index_file.exists() and not index_log.exists()
+    store.put(page(4))
+    store.close()  # close compacts too
+    assert not index_log.exists()
+
+    reopened = open_page_store(str(tmp_path), backend)
+    assert len(reopened) == 5
+    assert len(set(reopened.catalog())) == 5
+
+
+def test_jsonl_index_log_ignored_when_it_does_not_cover_the_data(tmp_path):
+    store = open_page_store(str(tmp_path), 'jsonl')
+    store.put_many([page(n) for n in range(3)])
+    store.flush()
+    assert (tmp_path / 'pages.jsonl.idx.log').exists()
+    # Crash after a data append that no index delta records
+    with open(tmp_path / 'pages.jsonl', 'a') as f:
+        f.write(json.dumps(page(3)) + '\n')
+
+    reopened = open_page_store(str(tmp_path), 'jsonl')
+    assert len(reopened) == 4
+    assert reopened.get(page(3)['url'])['title'] == 'Page 3'
@@ -0,0 +1,134 @@
+"""PageWriter failure propagation, backpressure and shutdown; event loop lag."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from cli.doc_scraper import DocToSkillConverter, EventLoopLagMonitor
+from cli.page_store import JsonlPageStore, PageWriter
+from cli.synthetic_site import SyntheticDocSite
+
+
+def test_write_failure_is_raised_on_join_close_and_put():
+    def write_batch(items):
+        raise OSError('disk full')
+
+    writer = PageWriter(write_batch)
+    writer.put('page')
+    with pytest.raises(OSError, match='disk full'):
+        writer.join()
+    with pytest.raises(OSError, match='disk full'):
+        writer.put('another')
+    with pytest.raises(OSError, match='disk full'):
+        asyncio.run(writer.put_async('another'))
+    with pytest.raises(OSError, match='disk full'):
+        writer.close()
+    assert writer.written == 0
+
+
+def test_full_queue_blocks_producers_until_the_writer_catches_up():
+    release = threading.Event()
+    written = []
+
+    def write_batch(items):
+        release.wait()
+        written.extend(items)
+
+    writer = PageWriter(write_batch, maxsize=2, batch_size=1)
+    writer.put(0)  # taken by the writer thread, which then blocks in write_batch
+    time.sleep(0.05)
+    writer.put(1)
+    writer.put(2)  # queue now full
+
+    producer = threading.Thread(target=writer.put, args=(3,))
+    producer.start()
+    producer.join(0.2)
+    assert producer.is_alive()  # backpressure: the put waits for room
+
+    release.set()
+    producer.join(5)
+    assert not producer.is_alive()
+    writer.close()
+    assert written == [0, 1, 2, 3]
+
+
+def test_put_async_waits_without_blocking_the_loop():
+    release = threading.Event()
+    writer = PageWriter(lambda items: release.wait(), maxsize=1, batch_size=1)
+
+    async def produce():
+        ticks = 0
+        # The writer holds at most one item and the queue one more: a put waits in an executor
+        puts = [asyncio.ensure_future(writer.put_async(item)) for item in 'abc']
+        while ticks < 5:
+            await asyncio.sleep(0.01)
+            ticks += 1
+        assert not all(put.done() for put in puts)
+        release.set()
+        await asyncio.gather(*puts)
+        return ticks
+
+    assert asyncio.run(produce()) == 5
+    writer.close()
+    assert writer.written == 3
+
+
+def test_close_writes_everything_still_queued():
+    written = []
+
+    def write_batch(items):
+        time.sleep(0.005)
+        written.extend(items)
+
+    writer = PageWriter(write_batch, maxsize=8, batch_size=4)
+    for n in range(50):
+        writer.put(n)
+    writer.close()
+
+    assert written == list(range(50))
+    assert writer.written == 50
+    assert writer.batches >= 50 // 4
+
+
+def test_lag_monitor_sees_a_blocked_loop():
+    monitor = EventLoopLagMonitor(interval=0.01)
+    assert monitor.stats() == {'mean': 0.0, 'p99': 0.0, 'max': 0.0}
+
+    async def block_the_loop():
+        task = asyncio.ensure_future(monitor.run())
+        await asyncio.sleep(0.05)
+        time.sleep(0.1)  # a synchronous call on the loop
+        await asyncio.sleep(0.05)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    asyncio.run(block_the_loop())
+    stats = monitor.stats()
+    assert stats['max'] >= 0.08
+    assert stats['mean'] < stats['max']
+
+
+def test_page_writer_keeps_slow_disk_writes_off_the_loop(tmp_path, monkeypatch):
+    """Event loop lag of an async crawl with pages saved inline vs on the writer thread."""
+    monkeypatch.chdir(tmp_path)
+    put = JsonlPageStore.put
+
+    def slow_put(self, page):
+        time.sleep(0.02)  # a slow disk
+        return put(self, page)
+
+    monkeypatch.setattr(JsonlPageStore, 'put', slow_put)
+    lag = {}
+    with SyntheticDocSite(pages=31) as site:
+        for async_writer in (False, True):
+            converter = DocToSkillConverter(site.config(f'lag_{async_writer}', workers=4, async_mode=True,
+                                                        page_store='jsonl', async_writer=async_writer))
+            converter.scrape_all()
+            assert len(converter.page_store) == 31
+            lag[async_writer] = converter.loop_lag
+
+    # Inline, every save stalls the loop for the whole write
+    assert lag[False]['max'] >= 0.015
+    assert lag[True]['max'] < lag[False]['max']
@@ -0,0 +1,94 @@
+"""Page dicts from every parser backend match the BeautifulSoup html.parser baseline."""
+
+import pytest
+
+from cli import doc_scraper
+from cli.synthetic_site import SyntheticDocSite
+
+URL = 'https://docs.example.com/docs/guide/intro.html'
+
+GUIDE_PAGE = """<!DOCTYPE html>
+<html><head><title>  Getting   Started | Example Docs </title>
+<style>body { color: red; }</style></head>
+<body>
+<nav><a href="/docs/">Docs</a><a href="/blog/">Blog</a></nav>
+<div role="main">
+  <h1>Getting <em>Started</em></h1>
+  <p>Install the package with <code>pip install example</code> and import it.</p>
+  <h2 id="config">Configuration</h2>
+  <p>Example: pass <code>debug=True</code> to see every request &amp; response.</p>
+  <pre><code class="language-python">import example
+client = example.Client(debug=True)  # &lt;- verbose
+print(client.get("/status"))</code></pre>
+  <ul><li>First &nbsp;item</li><li>Second <a href="../api/ref.html#client">item</a></li></ul>
+  <h3>Links</h3>
+  <p>See <a href="setup.html">setup</a>, <a href="./setup.html#top">setup again</a>,
+     <a href="#config">this page</a>, <a href="https://other.example.org/x">elsewhere</a>
+     and <a href="/docs/api/">the API</a>.</p>
+  <table><tr><th>Option</th><th>Default</th></tr><tr><td>debug</td><td>False</td></tr></table>
+  <pre class="highlight"><code>$ example --version
+1.2.3</code></pre>
+  <div class="note"><p>Typical use: call <code>client.close()</code> when done.</p></div>
+  <h2>Unicode ✓</h2>
+  <p>Ünïcödé text — with dashes … and emoji 🚀.</p>
+</div>
+<footer><a href="/imprint">Imprint</a></footer>
+</body></html>"""
+
+EMBEDDED_PAGE = """<html><head><title>Embedded</title></head><body>
+<div role="main">
+  <h1>Scripts and styles</h1>
+  <script>var html = "<p>not content</p>";</script>
+  <style>.x { display: none }</style>
+  <template><p>template text</p></template>
+  <p>Visible <span>nested <b>inline</b></span> text<br>after a break.</p>
+  <pre><code class="lang-js">const a = 1 &lt; 2 &amp;&amp; 3 &gt; 2;</code></pre>
+  <p>Usage: <ruby>漢<rt>kan</rt></ruby> reading.</p>
+  <h2>Empty section</h2>
+  <h2>   </h2>
+  <p></p>
+</div></body></html>"""
+
+NO_MAIN_PAGE = """<html><head><title>No main</title></head><body>
+<div class="content"><h1>Nothing selected</h1><p>Body text.</p></div>
+</body></html>"""
+
+PAGES = {
+    'guide': GUIDE_PAGE.encode(),
+    'embedded': EMBEDDED_PAGE.encode(),
+    'no-main': NO_MAIN_PAGE.encode(),
+    'large': SyntheticDocSite(pages=100, elements=2400).render(42),
+}
+
+
+def converter(parser):
+    config = {
+        'name': 'parity',
+        'base_url': 'https://docs.example.com/docs/',
+        'parser': parser,
+        'selectors': {'main_content': 'div[role="main"]', 'title': 'title', 'code_blocks': 'pre code'},
+    }
+    instance = doc_scraper.DocToSkillConverter(config, dry_run=True)
+    if instance.parser_backend != parser:
+        pytest.skip(f"parser backend {parser!r} is not installed")
+    return instance
+
+
+@pytest.fixture(scope='module')
+def baseline():
+    return converter('html.parser')
+
+
+@pytest.mark.parametrize('name', sorted(PAGES))
+@pytest.mark.parametrize('parser', ['lxml', 'lxml-direct'])
+def test_backend_matches_html_parser(baseline, parser, name):
+    expected = baseline.parse_html(PAGES[name], URL)
+    assert converter(parser).parse_html(PAGES[name], URL) == expected
+
+
+@pytest.mark.parametrize('parser', doc_scraper.PARSER_BACKENDS)
+def test_links_resolve_against_base(parser):
+    page = converter(parser).parse_html(PAGES['guide'], URL, 'https://docs.example.com/docs/guide/')
+    assert page['url'] == URL
+    assert 'https://docs.example.com/docs/guide/setup.html' in page['links']
+    assert 'https://docs.example.com/docs/api/ref.html' in page['links']
@@ -0,0 +1,121 @@
+"""HostRateLimiter token-bucket spacing, host pauses and Retry-After handling."""
+
+import asyncio
+import threading
+import time
+from email.utils import formatdate
+
+import pytest
+
+from cli import doc_scraper, fetch_policy
+from cli.fetch_policy import HostRateLimiter, parse_retry_after
+
+A = 'https://docs.example.com/a'
+B = 'https://api.example.com/b'
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Frozen monotonic clock; advance it by assigning clock.now."""
+    class Clock:
+        now = 1000.0
+    monkeypatch.setattr(fetch_policy.time, 'monotonic', lambda: Clock.now)
+    return Clock
+
+
+def test_reservations_queue_one_interval_apart(clock):
+    limiter = HostRateLimiter(0.5)
+    # Concurrent callers take future tokens instead of all firing at once
+    assert [limiter.reserve(A) for _ in range(4)] == [0.0, 0.5, 1.0, 1.5]
+    assert limiter.reserve(B) == 0.0  # buckets are per host
+
+    clock.now += 2.0
+    assert limiter.reserve(A) == pytest.approx(0.0)
+    assert limiter.reserve(A) == pytest.approx(0.5)
+
+
+def test_burst_and_refill_cap(clock):
+    limiter = HostRateLimiter(1.0, burst=3)
+    assert [limiter.reserve(A) for _ in range(4)] == [0.0, 0.0, 0.0, 1.0]
+
+    # A long idle period refills at most `burst` tokens
+    clock.now += 60
+    assert [limiter.reserve(A) for _ in range(4)] == [0.0, 0.0, 0.0, 1.0]
+
+
+def test_crawl_delay_raises_one_hosts_interval(clock):
+    limiter = HostRateLimiter(0.5)
+    limiter.set_min_interval('docs.example.com', 2.0)
+    assert [limiter.reserve(A) for _ in range(3)] == [0.0, 2.0, 4.0]
+    assert [limiter.reserve(B) for _ in range(2)] == [0.0, 0.5]
+
+
+def test_pause_holds_a_host_even_without_rate_limit(clock):
+    limiter = HostRateLimiter(0)
+    assert limiter.reserve(A) == 0.0
+    limiter.pause('docs.example.com', 30)
+    assert limiter.paused_for('docs.example.com') == 30
+    assert limiter.reserve(A) == 30
+    assert limiter.reserve(B) == 0.0
+
+    # A shorter pause never cuts a longer one short
+    limiter.pause('docs.example.com', 5)
+    clock.now += 20
+    assert limiter.reserve(A) == pytest.approx(10)
+    clock.now += 10
+    assert limiter.paused_for('docs.example.com') == 0.0
+    assert limiter.reserve(A) == 0.0
+
+
+def test_threads_and_coroutines_are_spaced_in_real_time():
+    limiter = HostRateLimiter(0.05)
+    stamps = []
+    lock = threading.Lock()
+
+    def worker():
+        limiter.acquire(A)
+        with lock:
+            stamps.append(time.monotonic())
+
+    threads = [threading.Thread(target=worker) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    stamps.sort()
+    assert all(b - a >= 0.035 for a, b in zip(stamps, stamps[1:]))
+
+    async def crawl():
+        started = time.monotonic()
+        await asyncio.gather(*(limiter.acquire_async(B) for _ in range(5)))
+        return time.monotonic() - started
+
+    assert asyncio.run(crawl()) >= 0.19
+
+
+def test_parse_retry_after():
+    assert parse_retry_after('120') == 120.0
+    assert parse_retry_after(' 7 ') == 7.0
+    assert 55 <= parse_retry_after(formatdate(time.time() + 60, usegmt=True)) <= 60
+    assert parse_retry_after(formatdate(time.time() - 60, usegmt=True)) == 0.0
+    assert parse_retry_after('soon') is None
+    assert parse_retry_after(None) is None
+
+
+class FakeResponse:
+    def __init__(self, status_code, retry_after=None):
+        self.status_code = status_code
+        self.headers = {'Retry-After': retry_after} if retry_after else {}
+
+
+@pytest.mark.parametrize('status', [429, 503])
+def test_retry_after_pauses_the_host(status):
+    converter = doc_scraper.DocToSkillConverter(
+        {'name': 'limits', 'base_url': 'https://docs.example.com/', 'rate_limit': 0}, dry_run=True)
+    converter._observe_response(A, FakeResponse(200, '60'), 0.1)
+    assert converter.rate_limiter.paused_for('docs.example.com') == 0.0
+
+    converter._observe_response(A, FakeResponse(status, '60'), 0.1)
+    assert 59 <= converter.rate_limiter.paused_for('docs.example.com') <= 60
+    assert converter.rate_limiter.reserve(A) > 59
+    assert converter.rate_limiter.paused_for('api.example.com') == 0.0
@@ -0,0 +1,43 @@
+"""--reextract rebuilds the same pages a crawl stored, from the raw HTML archive."""
+
+from cli import doc_scraper
+from cli.html_archive import RawHtmlArchive
+from cli.synthetic_site import SyntheticDocSite
+
+PAGES = 15
+
+
+def stored_pages(converter):
+    converter.page_store.flush()
+    return {page['url']: page for page in converter.page_store}
+
+
+def test_reextract_matches_crawl_after_redirects(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    # Relative mode: every link is slash-less and redirects to the
+    # directory form, so links must resolve against the final URL
+    with SyntheticDocSite(pages=PAGES, relative=True) as site:
+        config = site.config('archive', archive_html=True, page_store='jsonl', parse_workers=2)
+        crawled = doc_scraper.DocToSkillConverter(config)
+        crawled.scrape_all()
+        base = site.base_url
+    before = stored_pages(crawled)
+    assert len(before) == PAGES
+    assert base + 'p1' in before[base + 'p0']['links']
+
+    rebuilt = doc_scraper.DocToSkillConverter(config)
+    assert rebuilt.reextract()
+    assert stored_pages(rebuilt) == before
+
+
+def test_records_without_base_fall_back_to_url(tmp_path):
+    archive = RawHtmlArchive(str(tmp_path), codec='gzip')
+    archive.append('https://docs.example.com/old', b'<html></html>')
+    archive.append('https://docs.example.com/guide', b'<html></html>', 'https://docs.example.com/guide/')
+    archive.close()
+
+    records = list(archive.iter_records(archive.latest_offsets().values()))
+    assert [(url, base) for url, base, _, _ in records] == [
+        ('https://docs.example.com/old', 'https://docs.example.com/old'),
+        ('https://docs.example.com/guide', 'https://docs.example.com/guide/'),
+    ]
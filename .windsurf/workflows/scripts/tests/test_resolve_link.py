@@ -0,0 +1,111 @@
+"""resolve_link cache keys and the bounded URL decision caches."""
+
+from urllib.parse import urljoin
+
+import pytest
+
+from cli import doc_scraper
+from cli.doc_scraper import DocToSkillConverter
+
+BASE = 'https://docs.example.com/docs/'
+
+PAGES = [
+    BASE + 'guide/intro.html',
+    BASE + 'guide/setup.html?lang=en',
+    BASE + 'guide/advanced/tuning.html#top',
+    BASE + 'api/client.html',
+    BASE + 'index.html',
+    'http://docs.example.com/docs/guide/intro.html',  # other scheme, same path
+]
+
+HREFS = [
+    'https://docs.example.com/docs/api/server.html#methods',  # absolute
+    'http://docs.example.com/docs/api/server.html',
+    'next.html',  # relative
+    './next.html#part-2',
+    '../api/client.html',
+    '../../outside.html',
+    'advanced/',
+    '/docs/guide/intro.html',  # root-relative
+    '/blog/post.html',
+    '//docs.example.com/docs/api/server.html',  # protocol-relative
+    '?page=2',  # query only
+    '#section',  # fragment only
+    '',
+]
+
+
+def converter():
+    return DocToSkillConverter({'name': 'links', 'base_url': BASE}, dry_run=True)
+
+
+def expected(base, href):
+    """Uncached resolution: join, drop the fragment, check the scope."""
+    resolved = urljoin(base, href).split('#')[0]
+    return resolved if resolved.startswith(BASE) else None
+
+
+def test_cached_results_match_uncached_resolution():
+    cached = converter()
+    # Every page twice: the second pass is answered from the cache
+    for _ in range(2):
+        for page in PAGES:
+            for href in HREFS:
+                assert cached.resolve_link(page, href) == expected(page, href), (page, href)
+
+
+def test_keys_depend_only_on_what_the_href_needs():
+    cached = converter()
+    for page in PAGES:
+        for href in HREFS:
+            cached.resolve_link(page, href)
+    keys = set(cached.link_cache)
+
+    # Absolute hrefs: one entry whatever page they are on
+    assert ('', HREFS[0]) in keys
+    assert sum(1 for key in keys if key[1] == HREFS[0]) == 1
+    # Protocol-relative: per scheme
+    assert {key for key in keys if key[1] == HREFS[9]} == {('https', HREFS[9]), ('http', HREFS[9])}
+    # Root-relative: per origin
+    assert {key[0] for key in keys if key[1] == '/blog/post.html'} == {
+        'https://docs.example.com', 'http://docs.example.com'}
+    # Relative: per directory (intro and setup share docs/guide/)
+    assert {key[0] for key in keys if key[1] == 'next.html'} == {
+        BASE + 'guide/', BASE + 'guide/advanced/', BASE + 'api/', BASE,
+        'http://docs.example.com/docs/guide/'}
+    # Query and fragment only: per page, since they keep the page's path (and query)
+    assert {key[0] for key in keys if key[1] == '?page=2'} == set(PAGES)
+
+
+def test_relative_links_on_pages_in_different_directories_do_not_collide():
+    cached = converter()
+    assert cached.resolve_link(BASE + 'guide/intro.html', 'next.html') == BASE + 'guide/next.html'
+    assert cached.resolve_link(BASE + 'api/client.html', 'next.html') == BASE + 'api/next.html'
+    assert cached.resolve_link(BASE + 'guide/intro.html', '#top') == BASE + 'guide/intro.html'
+    assert cached.resolve_link(BASE + 'api/client.html', '#top') == BASE + 'api/client.html'
+    assert cached.resolve_link(BASE + 'guide/a.html?v=1', '?v=2') == BASE + 'guide/a.html?v=2'
+    assert cached.resolve_link(BASE + 'api/b.html?v=1', '?v=2') == BASE + 'api/b.html?v=2'
+
+
+def test_caches_start_over_at_the_size_limit(monkeypatch):
+    monkeypatch.setattr(doc_scraper, 'URL_DECISION_CACHE_SIZE', 4)
+    cached = converter()
+
+    for n in range(4):
+        assert cached.resolve_link(BASE, f'p{n}.html') == f'{BASE}p{n}.html'
+    assert len(cached.link_cache) == 4
+    assert len(cached.url_decisions) == 4
+
+    # Full: the next new entry clears the cache rather than growing it
+    assert cached.resolve_link(BASE, 'p4.html') == BASE + 'p4.html'
+    assert len(cached.link_cache) == 1
+    assert len(cached.url_decisions) == 1
+    # Cleared entries are simply recomputed
+    assert cached.resolve_link(BASE, 'p0.html') == BASE + 'p0.html'
+    assert cached.resolve_link(BASE, '/blog/post.html') is None
+    assert len(cached.link_cache) == 3
+
+
+@pytest.mark.parametrize('href', ['mailto:docs@example.com', 'javascript:void(0)'])
+def test_non_http_links_are_dropped(href):
+    assert converter().resolve_link(BASE + 'index.html', href) is None
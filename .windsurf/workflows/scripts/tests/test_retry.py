@@ -0,0 +1,110 @@
+"""Retry backoff, the bounded retry queue and the per-host circuit breaker."""
+
+import pytest
+import requests
+
+from cli import fetch_policy
+from cli.doc_scraper import DocToSkillConverter
+from cli.fetch_policy import HostCircuitBreaker, HostRateLimiter, RetryPolicy, RetryQueue
+from cli.synthetic_site import SyntheticDocSite
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Frozen monotonic clock; advance it by assigning clock.now."""
+    class Clock:
+        now = 1000.0
+    monkeypatch.setattr(fetch_policy.time, 'monotonic', lambda: Clock.now)
+    return Clock
+
+
+def test_backoff_is_jittered_exponential_and_capped():
+    policy = RetryPolicy(max_retries=5, base_delay=1.0, max_delay=10.0)
+    for attempt, cap in enumerate([1, 2, 4, 8, 10, 10]):
+        delays = [policy.delay(attempt) for _ in range(200)]
+        assert all(cap / 2 <= delay <= cap for delay in delays)
+        assert max(delays) - min(delays) > cap / 4  # jittered, not lockstep
+    # Never shorter than the server's Retry-After
+    assert policy.delay(0, retry_after=30) == 30
+
+
+def test_only_transient_failures_are_retried():
+    policy = RetryPolicy()
+    assert all(policy.is_retryable(status, None) for status in (429, 500, 502, 503, 504))
+    assert not any(policy.is_retryable(status, None) for status in (400, 403, 404, 410))
+    assert policy.is_retryable(None, requests.exceptions.ConnectionError())
+    assert policy.is_retryable(None, requests.exceptions.Timeout())
+    assert not policy.is_retryable(None, ValueError('parse error'))
+
+
+def test_retry_queue_is_bounded_and_ordered_by_due_time(clock):
+    queue = RetryQueue(maxsize=3)
+    assert queue.next_ready_in() is None
+    assert queue.schedule('slow', 5)
+    assert queue.schedule('fast', 1)
+    assert queue.schedule('fast-too', 1)
+    assert not queue.schedule('overflow', 0)
+    assert len(queue) == 3
+
+    assert queue.pop_ready() is None
+    assert queue.next_ready_in() == 1
+    clock.now += 1
+    assert [queue.pop_ready(), queue.pop_ready(), queue.pop_ready()] == ['fast', 'fast-too', None]
+    assert queue.schedule('another', 0)  # room again
+    clock.now += 4
+    assert [queue.pop_ready(), queue.pop_ready()] == ['another', 'slow']
+    assert not queue
+
+
+def test_breaker_trips_doubles_and_resets(clock):
+    limiter = HostRateLimiter(0)
+    breaker = HostCircuitBreaker(limiter, threshold=3, cooldown=10, max_cooldown=25)
+    host = 'docs.example.com'
+
+    for _ in range(2):
+        breaker.record_failure(host)
+    assert limiter.paused_for(host) == 0
+    breaker.record_failure(host)
+    assert limiter.paused_for(host) == 10
+
+    # Still failing: every re-open doubles the cooldown, up to the maximum
+    clock.now += 10
+    for _ in range(3):
+        breaker.record_failure(host)
+    assert limiter.paused_for(host) == 20
+    clock.now += 20
+    for _ in range(3):
+        breaker.record_failure(host)
+    assert limiter.paused_for(host) == 25
+
+    # One success closes the circuit and resets the count and the cooldown
+    clock.now += 25
+    breaker.record_failure(host)
+    breaker.record_success(host)
+    for _ in range(2):
+        breaker.record_failure(host)
+    assert limiter.paused_for(host) == 0
+    breaker.record_failure(host)
+    assert limiter.paused_for(host) == 10
+    assert limiter.paused_for('api.example.com') == 0
+
+
+@pytest.mark.parametrize('mode', [{'workers': 1}, {'workers': 4}, {'workers': 4, 'async_mode': True}],
+                         ids=['sequential', 'threaded', 'async'])
+def test_crawl_retries_transient_errors_only(tmp_path, monkeypatch, mode):
+    monkeypatch.chdir(tmp_path)
+    with SyntheticDocSite(pages=15, fail_paths={'/docs/p3.html': 503, '/docs/p6.html': 404}) as site:
+        config = site.config('retry', max_retries=2, retry={'base_delay': 0.01, 'max_delay': 0.02},
+                             page_store='jsonl', **mode)
+        converter = DocToSkillConverter(config)
+        converter.scrape_all()
+        failing = site.base_url + 'p3.html'
+        missing = site.base_url + 'p6.html'
+
+    assert converter.failed_urls[failing]['status'] == 503
+    assert converter.failed_urls[failing]['attempts'] == 3
+    assert converter.failed_urls[missing]['attempts'] == 1
+    assert set(converter.failed_urls) == {failing, missing}
+    assert not converter.retry_queue
+    # p3 and p6 and their children (7, 8, 13, 14) are missing; the rest is stored
+    assert len(converter.page_store) == 9
@@ -0,0 +1,77 @@
+"""dumps/loads/write_json on every installed JSON backend."""
+
+import json
+
+import pytest
+
+from cli import serialization
+from cli.serialization import dumps, loads, read_json, write_json
+
+AVAILABLE = {
+    'orjson': serialization.ORJSON_AVAILABLE,
+    'msgspec': serialization.MSGSPEC_AVAILABLE,
+    'json': True,
+}
+
+
+@pytest.fixture(params=list(AVAILABLE))
+def backend(request, monkeypatch):
+    """Run a test once per backend (skipping backends that are not installed)."""
+    if not AVAILABLE[request.param]:
+        pytest.skip(f'{request.param} not installed')
+    monkeypatch.setattr(serialization, 'JSON_BACKEND', request.param)
+    return request.param
+
+
+def test_round_trip_is_compact_utf8(backend):
+    page = {'url': 'https://docs.example.com/ü', 'title': 'Größe – 大小', 'links': [], 'n': 1.5}
+    data = dumps(page)
+    assert isinstance(data, bytes)
+    assert b'\n' not in data and b': ' not in data
+    assert 'Größe – 大小'.encode() in data  # not \u-escaped
+    assert loads(data) == page
+    assert loads(data.decode('utf-8')) == page
+
+
+def test_values_the_backend_cannot_encode_fall_back_to_stdlib(backend):
+    # Beyond 64 bits: orjson and msgspec refuse, the stdlib does not
+    huge = {'id': 2 ** 70}
+    assert dumps(huge) == b'{"id":1180591620717411303424}'
+    assert loads(dumps(huge)) == huge
+    assert json.loads(dumps(huge, pretty=True)) == huge
+    with pytest.raises(TypeError):
+        dumps({'handle': object()})
+
+
+def test_non_str_keys_are_written_as_strings(backend):
+    # orjson needs OPT_NON_STR_KEYS for these; every backend must agree with json
+    data = {1: 'one', 2.5: 'two and a half', False: 'no', None: 'none'}
+    assert loads(dumps(data)) == {'1': 'one', '2.5': 'two and a half', 'false': 'no', 'null': 'none'}
+    assert loads(dumps(data)) == json.loads(json.dumps(data))
+    assert loads(dumps({404: ['https://docs.example.com/gone']})) == {'404': ['https://docs.example.com/gone']}
+
+
+def test_pretty_output_matches_indent_2(backend):
+    data = {'name': 'docs', 'pages': [{'title': 'Größe', 'url': 'https://docs.example.com/'}], 'empty': {}}
+    assert dumps(data, pretty=True).decode('utf-8') == json.dumps(data, indent=2, ensure_ascii=False)
+
+
+def test_bad_input_raises_value_error(backend):
+    with pytest.raises(ValueError):
+        loads(b'{"truncated": ')
+
+
+def test_atomic_write_replaces_the_file_and_leaves_no_temp(tmp_path, backend):
+    path = tmp_path / 'checkpoint.json'
+    write_json(str(path), {'version': 1})
+    write_json(str(path), {'version': 2, 'pending': ['a', 'b']}, pretty=True, atomic=True)
+
+    assert read_json(str(path)) == {'version': 2, 'pending': ['a', 'b']}
+    assert path.read_text(encoding='utf-8').startswith('{\n  "version"')
+    assert [p.name for p in tmp_path.iterdir()] == ['checkpoint.json']
+
+    # Encoding fails before anything is written: the old file survives intact
+    with pytest.raises(TypeError):
+        write_json(str(path), {'handle': object()}, atomic=True)
+    assert read_json(str(path))['version'] == 2
+    assert [p.name for p in tmp_path.iterdir()] == ['checkpoint.json']
@@ -0,0 +1,88 @@
+"""Sitemap discovery: gzipped sitemaps, nested indexes and incremental re-crawls."""
+
+import requests
+
+from cli.doc_scraper import DocToSkillConverter
+from cli.sitemap import SitemapReader
+from cli.synthetic_site import SyntheticDocSite
+
+PAGES = 15
+
+
+def test_reader_follows_gzipped_and_nested_indexes():
+    with SyntheticDocSite(pages=PAGES, sitemap=True, lastmod='2026-03-01') as site:
+        reader = SitemapReader(lambda url: requests.get(url, stream=True, timeout=10))
+        entries = list(reader.iter_urls(site.origin + '/sitemap_index.xml'))
+        # Each document is fetched once, even when listed again
+        assert list(reader.iter_urls(site.origin + '/sitemaps/odd.xml')) == []
+        expected = {site.origin + site.page_path(n) for n in range(PAGES)}
+
+    assert reader.fetched == 4  # index, even.xml.gz, nested index, odd.xml
+    assert {loc for loc, _ in entries} == expected
+    assert len(entries) == PAGES
+    assert {lastmod for _, lastmod in entries} == {'2026-03-01'}
+
+
+def test_missing_sitemap_is_skipped():
+    with SyntheticDocSite(pages=PAGES, sitemap=True) as site:
+        reader = SitemapReader(lambda url: requests.get(url, stream=True, timeout=10))
+        assert list(reader.iter_urls(site.origin + '/sitemap-missing.xml')) == []
+    assert reader.fetched == 0
+
+
+def test_sitemap_seeds_pages_links_cannot_reach(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    # p1 is gone, so links never reach its subtree (3, 4, 7, 8, 9, 10)
+    broken = {'/docs/p1.html': 404}
+    with SyntheticDocSite(pages=PAGES, fail_paths=broken, sitemap=True) as site:
+        linked = DocToSkillConverter(site.config('links', page_store='jsonl'))
+        linked.scrape_all()
+        seeded = DocToSkillConverter(site.config('seeded', page_store='jsonl', sitemap=True))
+        seeded.scrape_all()
+
+    assert len(linked.page_store) == PAGES - 7
+    assert len(seeded.page_store) == PAGES - 1
+
+
+def test_unchanged_lastmod_skips_refetch(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    with SyntheticDocSite(pages=PAGES, sitemap=True) as site:
+        config = site.config('incremental', page_store='jsonl', sitemap=True)
+        DocToSkillConverter(config).scrape_all()
+        first_run = site.requests
+
+        site.lastmod = '2026-02-01'
+        rerun = DocToSkillConverter(config)
+        rerun.scrape_all()
+        changed_run = site.requests - first_run
+
+        unchanged = DocToSkillConverter(config)
+        unchanged.scrape_all()
+        unchanged_run = site.requests - first_run - changed_run
+
+    sitemap_requests = 5  # robots.txt and four sitemap documents
+    assert first_run == PAGES + sitemap_requests
+    assert changed_run == PAGES + sitemap_requests
+    # Nothing changed since the last run: only the sitemaps are fetched
+    assert unchanged_run == sitemap_requests
+    assert len(unchanged.page_store) == PAGES
+    assert len(unchanged.pages) == PAGES
+
+
+def test_reused_pages_count_toward_max_pages(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    with SyntheticDocSite(pages=40, sitemap=True) as site:
+        DocToSkillConverter(site.config('limited', page_store='jsonl', sitemap=True)).scrape_all()
+        first_run = site.requests
+
+        limited = DocToSkillConverter(site.config('limited', page_store='jsonl', sitemap=True, max_pages=5))
+        limited.scrape_all()
+        second_run = site.requests - first_run
+
+    assert len(limited.visited_urls) == 5
+    assert len(limited.pages) == 5
+    assert limited.pages_scraped == 5
+    # Unchanged pages are reused, not fetched, and seeding stops reading
+    # sitemaps once the limit is reached: robots.txt, the index, the
+    # nested index and odd.xml (the first five odd pages fill the limit)
+    assert second_run == 4
@@ -0,0 +1,69 @@
+"""url_patterns matching for substring, glob: and re: patterns."""
+
+import pytest
+
+from cli.doc_scraper import DocToSkillConverter, UrlPatternMatcher, validate_config
+
+BASE = 'https://docs.example.com/'
+
+
+def test_substring_patterns_match_anywhere():
+    matcher = UrlPatternMatcher(['/api/', '?version=2'])
+    assert matcher.matches(BASE + 'reference/api/client.html')
+    assert matcher.matches(BASE + 'guide.html?version=2')
+    assert not matcher.matches(BASE + 'apis/client.html')
+    # Regex metacharacters in substrings are literal
+    assert not UrlPatternMatcher(['a.c']).matches(BASE + 'abc')
+
+
+def test_glob_patterns_match_the_whole_url():
+    matcher = UrlPatternMatcher(['glob:*/v2/*.html'])
+    assert matcher.matches(BASE + 'v2/intro.html')
+    assert not matcher.matches(BASE + 'v2/intro.htm')
+    assert not matcher.matches(BASE + 'v3/intro.html')
+    # Anchored at the start: a glob without a leading * must match from the scheme
+    assert not UrlPatternMatcher(['glob:docs.example.com/*']).matches(BASE + 'x')
+
+
+def test_regex_patterns_are_searched():
+    matcher = UrlPatternMatcher([r're:/v[0-9]+/'])
+    assert matcher.matches(BASE + 'v12/intro.html')
+    assert not matcher.matches(BASE + 'vx/intro.html')
+
+
+def test_inline_flags_and_backreferences_keep_their_meaning():
+    # Valid on their own; joined into one alternation they broke
+    flags = UrlPatternMatcher(['/blog/', 're:(?i)/API/'])
+    assert flags.matches(BASE + 'api/ref.html')
+    assert flags.matches(BASE + 'blog/post.html')
+
+    backrefs = UrlPatternMatcher([r're:(a)\1', r're:(b)\1'])
+    assert backrefs.matches(BASE + 'aa')
+    assert backrefs.matches(BASE + 'bb')
+    assert not backrefs.matches(BASE + 'ab')
+
+
+def test_empty_matcher_is_falsy():
+    assert not UrlPatternMatcher([])
+    assert UrlPatternMatcher(['re:x'])
+    assert not UrlPatternMatcher([]).matches(BASE)
+
+
+def test_include_and_exclude_in_a_converter():
+    config = {
+        'name': 'patterns',
+        'base_url': BASE,
+        'url_patterns': {'include': ['/guide/', 're:(?i)/API/'], 'exclude': ['glob:*/internal/*']},
+    }
+    assert validate_config(config)[0] == []
+    converter = DocToSkillConverter(config, dry_run=True)
+    assert converter.is_valid_url(BASE + 'guide/intro.html')
+    assert converter.is_valid_url(BASE + 'Api/ref.html')
+    assert not converter.is_valid_url(BASE + 'blog/post.html')
+    assert not converter.is_valid_url(BASE + 'guide/internal/notes.html')
+
+
+@pytest.mark.parametrize('pattern', ['re:(', 're:[a-'])
+def test_invalid_regex_is_a_config_error(pattern):
+    errors, _ = validate_config({'name': 'bad', 'base_url': BASE, 'url_patterns': {'include': [pattern]}})
+    assert any('Invalid regex' in error for error in errors)